@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+HexStrike AI - CPU-bound Analysis Functions
+
+Pure-Python analysis that the API server runs in its warm worker processes
+(see AnalysisExecutor in hexstrike_server.py) instead of on request threads:
+  - flag candidate scanning over tool output
+  - CTF cipher text identification and frequency analysis
+  - vulnerability indicators in HTTP responses
+
+Everything here is a module-level function over plain, picklable arguments
+and must not touch server state, so it behaves the same inline or in a worker.
+"""
+
+import re
+import signal
+import threading
+from typing import Any, Dict, List
+
+FLAG_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'flag\{[^}]+\}',
+    r'FLAG\{[^}]+\}',
+    r'ctf\{[^}]+\}',
+    r'CTF\{[^}]+\}',
+    r'[a-zA-Z0-9_]+\{[^}]+\}',
+    r'[0-9a-f]{32}',  # MD5 hash
+    r'[0-9a-f]{40}',  # SHA1 hash
+    r'[0-9a-f]{64}'   # SHA256 hash
+)]
+
+HASH_LENGTHS = {
+    32: "MD5",
+    40: "SHA1",
+    64: "SHA256",
+    128: "SHA512"
+}
+
+SECURITY_HEADERS = {
+    'X-Frame-Options': 'Clickjacking protection missing',
+    'X-Content-Type-Options': 'MIME type sniffing protection missing',
+    'X-XSS-Protection': 'XSS protection missing',
+    'Strict-Transport-Security': 'HTTPS enforcement missing',
+    'Content-Security-Policy': 'Content Security Policy missing'
+}
+
+SENSITIVE_PATTERNS = [(re.compile(pattern, re.IGNORECASE), description) for pattern, description in (
+    (r'password\s*[:=]\s*["\']?([^"\'\s]+)', 'Password disclosure'),
+    (r'api[_-]?key\s*[:=]\s*["\']?([^"\'\s]+)', 'API key disclosure'),
+    (r'secret\s*[:=]\s*["\']?([^"\'\s]+)', 'Secret disclosure'),
+    (r'token\s*[:=]\s*["\']?([^"\'\s]+)', 'Token disclosure')
+)]
+
+SQL_ERRORS = [
+    'SQL syntax error',
+    'mysql_fetch_array',
+    'ORA-01756',
+    'Microsoft OLE DB Provider',
+    'PostgreSQL query failed'
+]
+
+HEX_RE = re.compile(r'^[0-9a-fA-F]+$')
+BASE64_RE = re.compile(r'^[A-Za-z0-9+/]+=*$')
+
+class AnalysisTimeout(Exception):
+    """An analysis job ran past its deadline"""
+
+def _deadline_expired(signum, frame):
+    raise AnalysisTimeout("analysis ran past its deadline")
+
+def worker_init(ready=None):
+    """Initializer for analysis worker processes: shutdown signals are the server's to handle
+
+    ready is a barrier shared by the workers of one pool, passed so none finishes
+    its first job (and goes idle) before all of them have started.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGALRM, _deadline_expired)
+    if ready is not None:
+        try:
+            ready.wait(timeout=60)
+        except threading.BrokenBarrierError:
+            pass
+
+def run_with_deadline(timeout: float, func, *args, **kwargs):
+    """Run func in a worker, raising AnalysisTimeout after timeout seconds so the worker is free for the next job"""
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return func(*args, **kwargs)
+    except AnalysisTimeout:
+        raise AnalysisTimeout(f"{func.__name__} did not finish within {timeout:g}s") from None
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+def ping() -> bool:
+    """No-op task used to start and check workers"""
+    return True
+
+def extract_flag_candidates(output: str) -> List[str]:
+    """Extract potential flags from tool output"""
+    candidates = []
+    for pattern in FLAG_PATTERNS:
+        candidates.extend(pattern.findall(output))
+
+    return list(set(candidates))  # Remove duplicates
+
+def analyze_cipher_text(cipher_text: str, cipher_type: str = "unknown", additional_info: str = "") -> Dict[str, Any]:
+    """Identify likely encodings, hashes and cipher families and suggest tools and next steps"""
+    results = {
+        "cipher_text": cipher_text,
+        "cipher_type": cipher_type,
+        "analysis_results": [],
+        "potential_solutions": [],
+        "recommended_tools": [],
+        "next_steps": []
+    }
+    unspaced = cipher_text.replace(' ', '')
+    distinct_upper = len(set(unspaced.upper()))
+
+    # Cipher type identification
+    if cipher_type == "unknown":
+        # Basic cipher identification heuristics
+        if HEX_RE.match(unspaced):
+            results["analysis_results"].append("Possible hexadecimal encoding")
+            results["recommended_tools"].extend(["hex", "xxd"])
+
+        if BASE64_RE.match(unspaced):
+            results["analysis_results"].append("Possible Base64 encoding")
+            results["recommended_tools"].append("base64")
+
+        if distinct_upper <= 26:
+            results["analysis_results"].append("Possible substitution cipher")
+            results["recommended_tools"].extend(["frequency-analysis", "substitution-solver"])
+
+    # Hash identification
+    clean_text = unspaced.replace('\n', '')
+    if len(clean_text) in HASH_LENGTHS and HEX_RE.match(clean_text):
+        hash_type = HASH_LENGTHS[len(clean_text)]
+        results["analysis_results"].append(f"Possible {hash_type} hash")
+        results["recommended_tools"].extend(["hashcat", "john", "hash-identifier"])
+
+    # Frequency analysis for substitution ciphers
+    if cipher_type in ["substitution", "caesar", "vigenere"] or "substitution" in results["analysis_results"]:
+        char_freq = {}
+        for char in cipher_text.upper():
+            if char.isalpha():
+                char_freq[char] = char_freq.get(char, 0) + 1
+
+        if char_freq:
+            most_common = max(char_freq, key=char_freq.get)
+            results["analysis_results"].append(f"Most frequent character: {most_common} ({char_freq[most_common]} occurrences)")
+            results["next_steps"].append("Try substituting most frequent character with 'E'")
+
+    # ROT/Caesar cipher detection
+    if cipher_type == "caesar" or distinct_upper <= 26:
+        results["recommended_tools"].append("rot13")
+        results["next_steps"].append("Try all ROT values (1-25)")
+
+    # RSA-specific analysis
+    if cipher_type == "rsa" or "rsa" in additional_info.lower():
+        results["recommended_tools"].extend(["rsatool", "factordb", "yafu"])
+        results["next_steps"].extend([
+            "Check if modulus can be factored",
+            "Look for small public exponent attacks",
+            "Check for common modulus attacks"
+        ])
+
+    # Vigenère cipher analysis
+    if cipher_type == "vigenere" or "vigenere" in additional_info.lower():
+        results["recommended_tools"].append("vigenere-solver")
+        results["next_steps"].extend([
+            "Perform Kasiski examination for key length",
+            "Use index of coincidence analysis",
+            "Try common key words"
+        ])
+
+    return results
+
+def analyze_http_response(url: str, header_names: List[str], text: str) -> List[Dict[str, Any]]:
+    """Missing security headers, secrets and SQL error strings in an HTTP response"""
+    vulns = []
+    present = {name.lower() for name in header_names}
+
+    # Check for missing security headers
+    for header, description in SECURITY_HEADERS.items():
+        if header.lower() not in present:
+            vulns.append({
+                'type': 'missing_security_header',
+                'severity': 'medium',
+                'description': description,
+                'url': url,
+                'header': header
+            })
+
+    # Check for sensitive information disclosure
+    for pattern, description in SENSITIVE_PATTERNS:
+        matches = pattern.findall(text)
+        if matches:
+            vulns.append({
+                'type': 'information_disclosure',
+                'severity': 'high',
+                'description': description,
+                'url': url,
+                'matches': matches[:5]  # Limit matches
+            })
+
+    # Check for SQL injection indicators
+    lowered = text.lower()
+    for error in SQL_ERRORS:
+        if error.lower() in lowered:
+            vulns.append({
+                'type': 'sql_injection_indicator',
+                'severity': 'high',
+                'description': f'Potential SQL injection: {error}',
+                'url': url
+            })
+
+    return vulns
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+HexStrike AI - Startup Benchmark Harness
+
+Measures the startup paths that dominate session latency:
+  - cold import of hexstrike_server and hexstrike_mcp (fresh interpreter per run)
+  - time from spawning the API server until /livez and /health first answer
+  - time for setup_mcp_server to register every MCP tool against a live server
+
+Results are printed as JSON. Use --save-baseline to record a baseline on a
+reference machine and run without it afterwards to compare against that file.
+"""
+
+import argparse
+import json
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import requests
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SERVER_SCRIPT = os.path.join(BENCH_DIR, "hexstrike_server.py")
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "hexstrike_benchmark_baseline.json")
+RESULT_MARKER = "__HEXSTRIKE_BENCH__"
+
+IMPORT_PROBE = """
+import sys, time, json
+started = time.perf_counter()
+import {module}
+print({marker!r} + json.dumps({{"seconds": time.perf_counter() - started}}), flush=True)
+"""
+
+REGISTRATION_PROBE = """
+import asyncio, json, time
+started = time.perf_counter()
+import hexstrike_mcp
+imported = time.perf_counter()
+client = hexstrike_mcp.HexStrikeClient({server_url!r})
+connected = time.perf_counter()
+mcp = hexstrike_mcp.setup_mcp_server(client)
+registered = time.perf_counter()
+tools = asyncio.run(mcp.list_tools())
+print({marker!r} + json.dumps({{
+    "import_seconds": imported - started,
+    "connect_seconds": connected - imported,
+    "register_seconds": registered - connected,
+    "total_seconds": registered - started,
+    "tool_count": len(tools)
+}}), flush=True)
+"""
+
+def _probe_env() -> dict:
+    """Environment for child interpreters: repo on the path, unbuffered output"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = BENCH_DIR + os.pathsep + env.get("PYTHONPATH", "")
+    env["PYTHONUNBUFFERED"] = "1"
+    return env
+
+def _run_probe(source: str, workdir: str, timeout: float) -> dict:
+    """Run a probe script in a fresh interpreter and return its marker payload"""
+    proc = subprocess.run(
+        [sys.executable, "-c", source],
+        cwd=workdir, env=_probe_env(), capture_output=True, text=True, timeout=timeout
+    )
+    for line in proc.stdout.splitlines():
+        if line.startswith(RESULT_MARKER):
+            return json.loads(line[len(RESULT_MARKER):])
+    raise RuntimeError(f"probe exited with code {proc.returncode}: {proc.stderr.strip()[-500:]}")
+
+def _summarize(samples: list) -> dict:
+    """Collapse a list of timings in seconds into millisecond statistics"""
+    ms = [s * 1000 for s in samples]
+    return {
+        "runs": len(ms),
+        "min_ms": round(min(ms), 2),
+        "median_ms": round(statistics.median(ms), 2),
+        "max_ms": round(max(ms), 2),
+        "samples_ms": [round(v, 2) for v in ms]
+    }
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def _wait_for(url: str, deadline: float, session: requests.Session) -> float:
+    """Poll url until it answers 200 and return the monotonic time it did"""
+    while time.perf_counter() < deadline:
+        try:
+            if session.get(url, timeout=1).status_code == 200:
+                return time.perf_counter()
+        except requests.exceptions.RequestException:
+            pass
+        time.sleep(0.005)
+    raise TimeoutError(f"{url} did not answer before the deadline")
+
+class ServerProcess:
+    """A hexstrike_server.py child process on a private port"""
+
+    def __init__(self, workdir: str, port: int = None):
+        self.workdir = workdir
+        self.port = port or _free_port()
+        self.url = f"http://127.0.0.1:{self.port}"
+        self.proc = None
+
+    def start(self) -> float:
+        self.proc = subprocess.Popen(
+            [sys.executable, SERVER_SCRIPT, "--port", str(self.port)],
+            cwd=self.workdir, env=_probe_env(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        return time.perf_counter()
+
+    def stop(self):
+        if self.proc and self.proc.poll() is None:
+            self.proc.terminate()
+            try:
+                self.proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+                self.proc.wait()
+
+def bench_imports(runs: int, workdir: str, timeout: float) -> dict:
+    """Cold import time of each entry module, one fresh interpreter per run"""
+    results = {}
+    for module in ("hexstrike_server", "hexstrike_mcp"):
+        source = IMPORT_PROBE.format(module=module, marker=RESULT_MARKER)
+        samples = [_run_probe(source, workdir, timeout)["seconds"] for _ in range(runs)]
+        results[module] = _summarize(samples)
+    return results
+
+def bench_first_health(runs: int, workdir: str, timeout: float) -> dict:
+    """Time from spawning the server until /livez and then /health first return 200"""
+    livez, health = [], []
+    session = requests.Session()
+    for _ in range(runs):
+        server = ServerProcess(workdir)
+        try:
+            spawned = server.start()
+            deadline = spawned + timeout
+            livez.append(_wait_for(f"{server.url}/livez", deadline, session) - spawned)
+            health.append(_wait_for(f"{server.url}/health", deadline, session) - spawned)
+        finally:
+            server.stop()
+    return {"livez": _summarize(livez), "health": _summarize(health)}
+
+def bench_mcp_registration(runs: int, workdir: str, timeout: float) -> dict:
+    """Import, connect and tool registration time of the MCP client against a live server"""
+    server = ServerProcess(workdir)
+    phases = {"import": [], "connect": [], "register": [], "total": []}
+    tool_counts = set()
+    try:
+        spawned = server.start()
+        _wait_for(f"{server.url}/livez", spawned + timeout, requests.Session())
+        source = REGISTRATION_PROBE.format(server_url=server.url, marker=RESULT_MARKER)
+        for _ in range(runs):
+            result = _run_probe(source, workdir, timeout)
+            for phase in phases:
+                phases[phase].append(result[f"{phase}_seconds"])
+            tool_counts.add(result["tool_count"])
+    finally:
+        server.stop()
+    report = {phase: _summarize(samples) for phase, samples in phases.items()}
+    report["tool_count"] = max(tool_counts) if tool_counts else 0
+    report["tool_count_stable"] = len(tool_counts) == 1
+    return report
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BENCH_DIR,
+                              capture_output=True, text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def run_benchmarks(runs: int, timeout: float, suites: list) -> dict:
+    """Run the selected suites and return a JSON-serializable report"""
+    report = {
+        "timestamp": datetime.now().isoformat(),
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": runs,
+        "metrics": {}
+    }
+    # Run children from a scratch directory so hexstrike.log and friends stay out of the tree
+    with tempfile.TemporaryDirectory(prefix="hexstrike_bench_") as workdir:
+        if "import" in suites:
+            report["metrics"]["import"] = bench_imports(runs, workdir, timeout)
+        if "health" in suites:
+            report["metrics"]["first_response"] = bench_first_health(runs, workdir, timeout)
+        if "mcp" in suites:
+            report["metrics"]["mcp_registration"] = bench_mcp_registration(runs, workdir, timeout)
+    return report
+
+def _medians(metrics: dict, prefix: str = "") -> dict:
+    """Flatten nested metric groups into {"group.name": median_ms}"""
+    flat = {}
+    for name, value in metrics.items():
+        if isinstance(value, dict):
+            if "median_ms" in value:
+                flat[prefix + name] = value["median_ms"]
+            else:
+                flat.update(_medians(value, f"{prefix}{name}."))
+    return flat
+
+def compare_to_baseline(report: dict, baseline: dict, tolerance: float) -> dict:
+    """Compare medians against a baseline; a metric regresses when it is slower by more than tolerance"""
+    current, previous = _medians(report["metrics"]), _medians(baseline.get("metrics", {}))
+    metrics, regressions = {}, []
+    for name, median_ms in current.items():
+        if name not in previous:
+            continue
+        base_ms = previous[name]
+        change = (median_ms - base_ms) / base_ms if base_ms else 0.0
+        metrics[name] = {
+            "baseline_ms": base_ms,
+            "current_ms": median_ms,
+            "change_pct": round(change * 100, 1),
+            "regressed": change > tolerance
+        }
+        if change > tolerance:
+            regressions.append(name)
+    return {
+        "baseline_revision": baseline.get("revision"),
+        "baseline_timestamp": baseline.get("timestamp"),
+        "tolerance_pct": round(tolerance * 100, 1),
+        "metrics": metrics,
+        "regressions": regressions
+    }
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark HexStrike AI server and MCP client startup")
+    parser.add_argument("--runs", type=int, default=5, help="Repetitions per measurement (default: 5)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Per-run timeout in seconds (default: 60)")
+    parser.add_argument("--suite", action="append", choices=["import", "health", "mcp"],
+                        help="Run only the given suite (repeatable; default: all)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help=f"Baseline file (default: {DEFAULT_BASELINE})")
+    parser.add_argument("--save-baseline", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.20,
+                        help="Allowed slowdown of a median before it counts as a regression (default: 0.20)")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit with status 1 if any metric regressed")
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    report = run_benchmarks(max(1, args.runs), args.timeout, args.suite or ["import", "health", "mcp"])
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        report["baseline_saved"] = args.baseline
+    elif os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            report["comparison"] = compare_to_baseline(report, json.load(f), args.tolerance)
+    else:
+        report["comparison"] = None
+
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+
+    comparison = report.get("comparison")
+    if args.fail_on_regression and comparison and comparison["regressions"]:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
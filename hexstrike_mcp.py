@@ -22,10 +22,16 @@ import os
 import json
 import argparse
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import requests
+import socket
+import threading
 import time
+import urllib.parse
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool
 
 from mcp.server.fastmcp import FastMCP
 
@@ -145,20 +151,92 @@ DEFAULT_HEXSTRIKE_SERVER = "http://127.0.0.1:8888"  # Default HexStrike server U
 DEFAULT_REQUEST_TIMEOUT = 300  # 5 minutes default timeout for API requests
 MAX_RETRIES = 3  # Maximum number of retries for connection attempts
 
+UNIX_SOCKET_SCHEME = "http+unix"  # Session URLs for a Unix socket server look like http+unix://%2Fpath%2Fto.sock/health
+
+class UnixSocketConnection(HTTPConnection):
+    """HTTP connection over a Unix domain socket"""
+
+    def __init__(self, socket_path: str, **kwargs):
+        super().__init__("localhost", **kwargs)
+        self.socket_path = socket_path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if isinstance(self.timeout, (int, float)):
+            sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+class UnixSocketConnectionPool(HTTPConnectionPool):
+    """Connection pool whose connections all go to one Unix socket"""
+
+    ConnectionCls = UnixSocketConnection
+
+    def __init__(self, socket_path: str, **kwargs):
+        super().__init__("localhost", **kwargs)
+        self.socket_path = socket_path
+
+    def _new_conn(self):
+        self.num_connections += 1
+        return self.ConnectionCls(self.socket_path, timeout=self.timeout.connect_timeout)
+
+class UnixSocketAdapter(HTTPAdapter):
+    """requests transport adapter for http+unix:// URLs, keeping one keep-alive pool per socket"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._pools = {}
+        self._pools_lock = threading.Lock()
+
+    def _pool_for(self, url: str) -> UnixSocketConnectionPool:
+        socket_path = urllib.parse.unquote(urllib.parse.urlparse(url).netloc)
+        with self._pools_lock:
+            pool = self._pools.get(socket_path)
+            if pool is None:
+                pool = self._pools[socket_path] = UnixSocketConnectionPool(socket_path, maxsize=self._pool_maxsize)
+            return pool
+
+    def get_connection_with_tls_context(self, request, verify, proxies=None, cert=None):
+        return self._pool_for(request.url)
+
+    def get_connection(self, url, proxies=None):
+        return self._pool_for(url)
+
+    def request_url(self, request, proxies):
+        return request.path_url
+
+    def close(self):
+        with self._pools_lock:
+            for pool in self._pools.values():
+                pool.close()
+            self._pools.clear()
+        super().close()
+
+def resolve_server_url(server_url: str) -> str:
+    """Map unix:///path/to.sock to the http+unix URL form the session adapter understands"""
+    if server_url.startswith("unix://"):
+        socket_path = server_url[len("unix://"):]
+        return f"{UNIX_SOCKET_SCHEME}://{urllib.parse.quote(socket_path, safe='')}"
+    return server_url.rstrip("/")
+
 class HexStrikeClient:
     """Enhanced client for communicating with the HexStrike AI API Server"""
 
-    def __init__(self, server_url: str, timeout: int = DEFAULT_REQUEST_TIMEOUT):
+    def __init__(self, server_url: str, timeout: int = DEFAULT_REQUEST_TIMEOUT, stream_output: bool = True):
         """
         Initialize the HexStrike AI Client
 
         Args:
             server_url: URL of the HexStrike AI API Server
             timeout: Request timeout in seconds
+            stream_output: Stream command and tool output so long scans are not cut off by the timeout
         """
-        self.server_url = server_url.rstrip("/")
+        self.server_url = resolve_server_url(server_url)
         self.timeout = timeout
+        self.stream_output = stream_output
         self.session = requests.Session()
+        if self.server_url.startswith(UNIX_SOCKET_SCHEME):
+            self.session.mount(f"{UNIX_SOCKET_SCHEME}://", UnixSocketAdapter())
 
         # Try to connect to server with retries
         connected = False
@@ -167,7 +245,10 @@ class HexStrikeClient:
                 logger.info(f"🔗 Attempting to connect to HexStrike AI API at {server_url} (attempt {i+1}/{MAX_RETRIES})")
                 # First try a direct connection test before using the health endpoint
                 try:
-                    test_response = self.session.get(f"{self.server_url}/health", timeout=5)
+                    # The liveness probe is constant time; older servers only have /health
+                    test_response = self.session.get(f"{self.server_url}/livez", timeout=5)
+                    if test_response.status_code == 404:
+                        test_response = self.session.get(f"{self.server_url}/health", timeout=5)
                     test_response.raise_for_status()
                     health_check = test_response.json()
                     connected = True
@@ -230,9 +311,12 @@ class HexStrikeClient:
             Response data as dictionary
         """
         url = f"{self.server_url}/{endpoint}"
+        stream = self.stream_output and (endpoint == "api/command" or endpoint.startswith("api/tools/"))
 
         try:
             logger.debug(f"📡 POST {url} with data: {json_data}")
+            if stream:
+                return self._post_streaming(url, json_data)
             response = self.session.post(url, json=json_data, timeout=self.timeout)
             response.raise_for_status()
             return response.json()
@@ -243,6 +327,44 @@ class HexStrikeClient:
             logger.error(f"💥 Unexpected error: {str(e)}")
             return {"error": f"Unexpected error: {str(e)}", "success": False}
 
+    def _post_streaming(self, url: str, json_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Perform a streamed POST request and return the final result.
+
+        The server sends output lines as Server-Sent Events followed by a result
+        trailer. The timeout applies between events, and the server sends
+        keepalives, so long-running scans no longer hit it.
+
+        Args:
+            url: Full endpoint URL
+            json_data: JSON data to send
+
+        Returns:
+            Response data as dictionary
+        """
+        with self.session.post(url, json=json_data, params={"stream": 1}, stream=True, timeout=self.timeout) as response:
+            response.raise_for_status()
+            if not response.headers.get("Content-Type", "").startswith("text/event-stream"):
+                # Older servers ignore ?stream=1 and answer with plain JSON
+                return response.json()
+
+            event = None
+            for line in response.iter_lines(decode_unicode=True):
+                if line.startswith("event:"):
+                    event = line[len("event:"):].strip()
+                elif line.startswith("data:"):
+                    data = json.loads(line[len("data:"):].strip())
+                    if event == "output":
+                        logger.debug(f"📤 {data['stream'].upper()}: {data['line'].rstrip()}")
+                    elif event == "result":
+                        result = data.get("result")
+                        if data.get("status_code", 200) >= 400:
+                            detail = result.get("error", "") if isinstance(result, dict) else result
+                            return {"error": f"Request failed: HTTP {data['status_code']}: {detail}", "success": False}
+                        return result
+
+        return {"error": "Request failed: stream ended without a result", "success": False}
+
     def execute_command(self, command: str, use_cache: bool = True) -> Dict[str, Any]:
         """
         Execute a generic command on the HexStrike server
@@ -3858,6 +3980,25 @@ def setup_mcp_server(hexstrike_client: HexStrikeClient) -> FastMCP:
             logger.error(f"❌ Failed to clear cache")
         return result
 
+    @mcp.tool()
+    def invalidate_cache_target(target: str) -> Dict[str, Any]:
+        """
+        Invalidate cached results for one host, domain (including subdomains) or CIDR on the HexStrike AI server.
+
+        Args:
+            target: Host, domain, URL or CIDR whose cached scan results should be dropped before a rescan
+
+        Returns:
+            Matched targets and the number of cache entries removed
+        """
+        logger.info(f"🧹 Invalidating cached results for {target}")
+        result = hexstrike_client.safe_post("api/cache/invalidate", {"target": target})
+        if result.get("success"):
+            logger.info(f"✅ Invalidated cache for {len(result.get('targets', []))} target(s)")
+        else:
+            logger.error(f"❌ Failed to invalidate cache for {target}")
+        return result
+
     @mcp.tool()
     def get_telemetry() -> Dict[str, Any]:
         """
@@ -3872,6 +4013,100 @@ def setup_mcp_server(hexstrike_client: HexStrikeClient) -> FastMCP:
             logger.info(f"📊 Commands executed: {result.get('commands_executed', 0)}")
         return result
 
+    @mcp.tool()
+    def get_route_latency(limit: int = 20) -> Dict[str, Any]:
+        """
+        Get per-endpoint latency percentiles from the HexStrike AI server, slowest first.
+
+        Args:
+            limit: Number of routes to return, ordered by p95 latency
+
+        Returns:
+            Request count, in-flight requests, errors and p50/p95/p99 latency per route
+        """
+        logger.info(f"⏱️  Getting route latency metrics")
+        result = hexstrike_client.safe_get("api/metrics/routes", {"limit": limit})
+        if result.get("success") and result.get("routes"):
+            slowest = result["routes"][0]
+            logger.info(f"🐢 Slowest route: {slowest['method']} {slowest['route']} p95={slowest['p95']:.3f}s")
+        return result
+
+    @mcp.tool()
+    def execute_batch(commands: List[str] = None, tool: str = "", targets: List[str] = None,
+                      params: Dict[str, Any] = None, target_param: str = "target",
+                      concurrency: int = 4, priority: str = "batch", use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Run many commands, or one tool against many targets, in a single request on the HexStrike AI server.
+
+        Args:
+            commands: Shell commands to run
+            tool: Tool endpoint name (e.g. "nmap", "httpx") to fan out over targets
+            targets: Targets to run the tool against, one invocation each
+            params: Extra parameters passed to every tool invocation
+            target_param: Name of the tool parameter that receives each target
+            concurrency: Maximum number of items running at once
+            priority: Pool priority class (interactive, batch, background)
+            use_cache: Reuse cached command results
+
+        Returns:
+            Batch id and per-item task ids; poll progress with get_batch_status
+        """
+        data = {
+            "commands": commands or [],
+            "concurrency": concurrency,
+            "priority": priority,
+            "use_cache": use_cache
+        }
+        if tool and targets:
+            data.update({"tool": tool, "targets": targets, "params": params or {}, "target_param": target_param})
+        logger.info(f"📦 Submitting batch of {len(data['commands']) + len(targets or [])} item(s)")
+        result = hexstrike_client.safe_post("api/process/execute-batch", data)
+        if result.get("success"):
+            logger.info(f"✅ Batch {result['batch_id']} submitted with {result['total']} item(s)")
+        else:
+            logger.error(f"❌ Batch submission failed: {result.get('error')}")
+        return result
+
+    @mcp.tool()
+    def get_batch_status(batch_id: str, wait: int = 0, include_results: bool = True) -> Dict[str, Any]:
+        """
+        Get aggregate progress and per-item results of a batch on the HexStrike AI server.
+
+        Args:
+            batch_id: The batch_id returned by execute_batch
+            wait: Seconds to wait for the batch to finish before answering (long-poll)
+            include_results: Include each finished item's result
+
+        Returns:
+            Status counts, progress percentage, ETA and per-item status and results
+        """
+        logger.info(f"📦 Getting status of batch {batch_id}")
+        result = hexstrike_client.safe_get(f"api/process/batch/{batch_id}",
+                                           {"wait": wait, "results": int(include_results)})
+        if result.get("success"):
+            logger.info(f"📊 Batch {batch_id}: {result['status']} ({result['progress']:.0f}%)")
+        return result
+
+    @mcp.tool()
+    def get_command_output(output_id: str, stream: str = "stdout", offset: int = 0, length: int = 65536) -> Dict[str, Any]:
+        """
+        Page through large command output that the server spilled to disk.
+
+        Args:
+            output_id: The output_id returned in a command result with output_spilled set
+            stream: Which stream to read (stdout or stderr)
+            offset: Byte offset to start reading from
+            length: Number of bytes to read
+
+        Returns:
+            The requested byte range with total_size, next_offset and eof markers
+        """
+        logger.info(f"📄 Reading {stream} of output {output_id} at offset {offset}")
+        result = hexstrike_client.safe_get(f"api/outputs/{output_id}", {"stream": stream, "offset": offset, "length": length})
+        if result.get("success"):
+            logger.info(f"📊 Read {result.get('length', 0)} of {result.get('total_size', 0)} bytes")
+        return result
+
     # ============================================================================
     # PROCESS MANAGEMENT TOOLS (v5.0 ENHANCEMENT)
     # ============================================================================
@@ -5495,10 +5730,12 @@ def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description="Run the HexStrike AI MCP Client")
     parser.add_argument("--server", type=str, default=DEFAULT_HEXSTRIKE_SERVER,
-                      help=f"HexStrike AI API server URL (default: {DEFAULT_HEXSTRIKE_SERVER})")
+                      help=f"HexStrike AI API server URL, or unix:///path/to.sock for a Unix socket (default: {DEFAULT_HEXSTRIKE_SERVER})")
     parser.add_argument("--timeout", type=int, default=DEFAULT_REQUEST_TIMEOUT,
                       help=f"Request timeout in seconds (default: {DEFAULT_REQUEST_TIMEOUT})")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    parser.add_argument("--no-stream", action="store_true",
+                      help="Wait for complete JSON responses instead of streaming command output")
     return parser.parse_args()
 
 def main():
@@ -5516,7 +5753,7 @@ def main():
 
     try:
         # Initialize the HexStrike AI client
-        hexstrike_client = HexStrikeClient(args.server, args.timeout)
+        hexstrike_client = HexStrikeClient(args.server, args.timeout, stream_output=not args.no_stream)
 
         # Check server health and log the result
         health = hexstrike_client.check_health()
@@ -28,20 +28,34 @@ import traceback
 import threading
 import time
 import hashlib
+import ipaddress
+import sqlite3
+import zlib
+import mmap
+import uuid
 import pickle
 import base64
 import queue
-from concurrent.futures import ThreadPoolExecutor
+import heapq
+import itertools
+import math
+import multiprocessing
+import importlib.machinery
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
-from collections import OrderedDict
+from collections import OrderedDict, deque
 import shutil
+import shlex
 import venv
 import zipfile
 from pathlib import Path
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response, copy_current_request_context, g, has_request_context
 import psutil
 import signal
+import stat
+import _thread
 import requests
 import re
 import socket
@@ -50,20 +64,10 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Set, Tuple
 import asyncio
-import aiohttp
 from urllib.parse import urljoin, urlparse, parse_qs
-from bs4 import BeautifulSoup
-import selenium
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
-import mitmproxy
-from mitmproxy import http as mitmhttp
-from mitmproxy.tools.dump import DumpMaster
-from mitmproxy.options import Options as MitmOptions
+import hexstrike_analysis
+# Heavy optional subsystems (bs4, selenium) are imported where they are used
+# so that cold start only pays for what the core API server needs.
 
 # ============================================================================
 # LOGGING CONFIGURATION (MUST BE FIRST)
@@ -98,6 +102,42 @@ app.config['JSON_SORT_KEYS'] = False
 API_PORT = int(os.environ.get('HEXSTRIKE_PORT', 8888))
 API_HOST = os.environ.get('HEXSTRIKE_HOST', '127.0.0.1')
 
+class LazyInstance:
+    """Module-level proxy that builds its manager on first use"""
+
+    def __init__(self, factory, name: str = None):
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_name", name or getattr(factory, "__name__", "instance"))
+        object.__setattr__(self, "_instance", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def _resolve(self):
+        """Return the wrapped instance, constructing it exactly once"""
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                instance = self._instance
+                if instance is None:
+                    started = time.perf_counter()
+                    instance = self._factory()
+                    object.__setattr__(self, "_instance", instance)
+                    logger.debug(f"💤 Lazily initialized {self._name} in {(time.perf_counter() - started) * 1000:.1f}ms")
+        return instance
+
+    @property
+    def initialized(self) -> bool:
+        return self._instance is not None
+
+    def __getattr__(self, name):
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._resolve(), name, value)
+
+    def __repr__(self):
+        state = "initialized" if self.initialized else "pending"
+        return f"<LazyInstance {self._name} ({state})>"
+
 # ============================================================================
 # MODERN VISUAL ENGINE (v2.0 ENHANCEMENT)
 # ============================================================================
@@ -2147,11 +2187,12 @@ class IntelligentErrorHandler:
     def _get_system_resources(self) -> Dict[str, Any]:
         """Get current system resource information"""
         try:
+            sample = resource_sampler.latest()
             return {
-                "cpu_percent": psutil.cpu_percent(),
-                "memory_percent": psutil.virtual_memory().percent,
-                "disk_percent": psutil.disk_usage('/').percent,
-                "load_average": os.getloadavg() if hasattr(os, 'getloadavg') else None,
+                "cpu_percent": sample["cpu_percent"],
+                "memory_percent": sample["memory_percent"],
+                "disk_percent": sample["disk_percent"],
+                "load_average": sample["load_average"],
                 "active_processes": len(psutil.pids())
             }
         except Exception:
@@ -2773,8 +2814,8 @@ class FileUploadTestingFramework:
         return workflow
 
 # Global bug bounty workflow manager
-bugbounty_manager = BugBountyWorkflowManager()
-fileupload_framework = FileUploadTestingFramework()
+bugbounty_manager = LazyInstance(BugBountyWorkflowManager)
+fileupload_framework = LazyInstance(FileUploadTestingFramework)
 
 # ============================================================================
 # CTF COMPETITION EXCELLENCE FRAMEWORK (v6.0 ENHANCEMENT)
@@ -3982,23 +4023,7 @@ class CTFChallengeAutomator:
 
     def _extract_flag_candidates(self, output: str) -> List[str]:
         """Extract potential flags from tool output"""
-        flag_patterns = [
-            r'flag\{[^}]+\}',
-            r'FLAG\{[^}]+\}',
-            r'ctf\{[^}]+\}',
-            r'CTF\{[^}]+\}',
-            r'[a-zA-Z0-9_]+\{[^}]+\}',
-            r'[0-9a-f]{32}',  # MD5 hash
-            r'[0-9a-f]{40}',  # SHA1 hash
-            r'[0-9a-f]{64}'   # SHA256 hash
-        ]
-
-        candidates = []
-        for pattern in flag_patterns:
-            matches = re.findall(pattern, output, re.IGNORECASE)
-            candidates.extend(matches)
-
-        return list(set(candidates))  # Remove duplicates
+        return run_analysis(hexstrike_analysis.extract_flag_candidates, output, size=len(output))
 
     def _validate_flag_format(self, flag: str) -> bool:
         """Validate if a string matches common flag formats"""
@@ -4541,6 +4566,73 @@ class FailureRecoverySystem:
                 return tool
         return "unknown"
 
+class ResourceSampler:
+    """Single background sampler keeping a ring buffer of system resource snapshots"""
+
+    def __init__(self, interval: float = 2.0, history_size: int = 300):
+        self.interval = interval
+        self.samples = deque(maxlen=history_size)
+        self.sample_lock = threading.Lock()
+        self.sampler_thread = None
+        # Prime the CPU counters so the first non-blocking reading is meaningful
+        psutil.cpu_percent(interval=None)
+        self.primed_at = time.time()
+
+    def _take_sample(self) -> Dict[str, Any]:
+        """Read CPU, memory, disk, network and load without blocking"""
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage('/')
+        network = psutil.net_io_counters()
+        sample = {
+            "cpu_percent": psutil.cpu_percent(interval=None),
+            "memory_percent": memory.percent,
+            "memory_available_gb": memory.available / (1024**3),
+            "disk_percent": disk.percent,
+            "disk_free_gb": disk.free / (1024**3),
+            "network_bytes_sent": network.bytes_sent if network else 0,
+            "network_bytes_recv": network.bytes_recv if network else 0,
+            "network_io": network._asdict() if network else {},
+            "load_average": os.getloadavg() if hasattr(os, 'getloadavg') else None,
+            "timestamp": time.time()
+        }
+        with self.sample_lock:
+            self.samples.append(sample)
+        return sample
+
+    def start(self):
+        """Start the background sampling thread"""
+        with self.sample_lock:
+            if self.sampler_thread is not None:
+                return
+            self.sampler_thread = threading.Thread(target=self._run, daemon=True, name="hexstrike-resource-sampler")
+        self.sampler_thread.start()
+
+    def _run(self):
+        while True:
+            try:
+                self._take_sample()
+            except Exception as e:
+                logger.error(f"💥 Resource sampler error: {str(e)}")
+            time.sleep(self.interval)
+
+    def latest(self) -> Dict[str, Any]:
+        """Most recent snapshot, never blocking on a CPU measurement interval"""
+        if self.sampler_thread is None:
+            self.start()
+        with self.sample_lock:
+            if self.samples:
+                return dict(self.samples[-1])
+        return self._take_sample()
+
+    def history(self, count: Optional[int] = None) -> list:
+        """Oldest-first snapshots from the ring buffer, optionally only the last count"""
+        with self.sample_lock:
+            samples = list(self.samples)
+        return samples[-count:] if count else samples
+
+# Global resource sampler
+resource_sampler = ResourceSampler(interval=float(os.environ.get("HEXSTRIKE_SAMPLE_INTERVAL", 2.0)))
+
 class PerformanceMonitor:
     """Advanced performance monitoring with automatic resource allocation"""
 
@@ -4579,18 +4671,14 @@ class PerformanceMonitor:
     def monitor_system_resources(self) -> Dict[str, float]:
         """Monitor current system resource usage"""
         try:
-            cpu_percent = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
-            network = psutil.net_io_counters()
-
+            sample = resource_sampler.latest()
             return {
-                "cpu_percent": cpu_percent,
-                "memory_percent": memory.percent,
-                "disk_percent": disk.percent,
-                "network_bytes_sent": network.bytes_sent,
-                "network_bytes_recv": network.bytes_recv,
-                "timestamp": time.time()
+                "cpu_percent": sample["cpu_percent"],
+                "memory_percent": sample["memory_percent"],
+                "disk_percent": sample["disk_percent"],
+                "network_bytes_sent": sample["network_bytes_sent"],
+                "network_bytes_recv": sample["network_bytes_recv"],
+                "timestamp": sample["timestamp"]
             }
         except Exception as e:
             logger.error(f"Error monitoring system resources: {str(e)}")
@@ -4874,25 +4962,567 @@ class ParameterOptimizer:
 # ADVANCED PROCESS MANAGEMENT AND MONITORING (v10.0 ENHANCEMENT)
 # ============================================================================
 
+class PriorityTaskQueue:
+    """Task queue ordered by priority class and deadline, with aging so lower classes are not starved"""
+
+    PRIORITIES = {"interactive": 0, "batch": 1, "background": 2}
+    AGING_INTERVAL = 60  # Seconds of queueing that lift a task by one priority class
+    URGENCY_WINDOW = 30  # Tasks this close to their deadline jump ahead of everything else
+
+    def __init__(self):
+        self.heaps = {name: [] for name in self.PRIORITIES}
+        self.entries = {}
+        self.counter = itertools.count()
+        self.shutdowns = 0
+        self.size = 0
+        self.not_empty = threading.Condition()
+
+    def put(self, task: Optional[Dict[str, Any]]):
+        """Queue a task, or a None shutdown sentinel which is delivered before any task"""
+        with self.not_empty:
+            if task is None:
+                self.shutdowns += 1
+            else:
+                self._push(task)
+            self.not_empty.notify()
+
+    def revoke_shutdowns(self, count: int) -> int:
+        """Withdraw up to count undelivered shutdown sentinels, returning how many were withdrawn"""
+        with self.not_empty:
+            revoked = min(count, self.shutdowns)
+            self.shutdowns -= revoked
+            return revoked
+
+    def _push(self, task: Dict[str, Any]):
+        entry = [task.get("deadline") or float("inf"), next(self.counter), task]
+        heapq.heappush(self.heaps[task["priority"]], entry)
+        self.entries[task["id"]] = entry
+        self.size += 1
+
+    def promote(self, task_id: str, priority: str) -> bool:
+        """Move a queued task into a more urgent priority class"""
+        with self.not_empty:
+            entry = self.entries.get(task_id)
+            if entry is None or self.PRIORITIES[priority] >= self.PRIORITIES[entry[2]["priority"]]:
+                return False
+            task = entry[2]
+            # Leave a tombstone in the old heap, it is skipped when it reaches the top
+            entry[2] = None
+            self.size -= 1
+            task["priority"] = priority
+            self._push(task)
+            return True
+
+    def _pop_next(self) -> Optional[Dict[str, Any]]:
+        """Pick the most urgent task: near-deadline first, then by aged priority (lock held)"""
+        now = time.time()
+        best_key = None
+        best_heap = None
+        for name, heap in self.heaps.items():
+            while heap and heap[0][2] is None:
+                heapq.heappop(heap)
+            if not heap:
+                continue
+
+            deadline, seq, task = heap[0]
+            if deadline - now <= self.URGENCY_WINDOW:
+                key = (0, deadline, seq)
+            else:
+                key = (1, self.PRIORITIES[name] - (now - task["submitted_at"]) / self.AGING_INTERVAL, seq)
+            if best_key is None or key < best_key:
+                best_key = key
+                best_heap = heap
+
+        if best_heap is None:
+            return None
+        task = heapq.heappop(best_heap)[2]
+        del self.entries[task["id"]]
+        self.size -= 1
+        return task
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Remove and return the next task, raising queue.Empty after timeout"""
+        end_time = None if timeout is None else time.time() + timeout
+        with self.not_empty:
+            while True:
+                if self.shutdowns:
+                    self.shutdowns -= 1
+                    return None
+                task = self._pop_next()
+                if task is not None:
+                    return task
+                remaining = None if end_time is None else end_time - time.time()
+                if remaining is not None and remaining <= 0:
+                    raise queue.Empty
+                self.not_empty.wait(remaining)
+
+    def task_done(self):
+        """Kept for queue.Queue compatibility"""
+
+    def qsize(self) -> int:
+        with self.not_empty:
+            return self.size
+
+    def qsize_by_priority(self) -> Dict[str, int]:
+        """Number of queued tasks in each priority class"""
+        with self.not_empty:
+            counts = {name: 0 for name in self.PRIORITIES}
+            for entry in self.entries.values():
+                counts[entry[2]["priority"]] += 1
+            return counts
+
+class TaskResultStore:
+    """Finished task results bounded by TTL, entry count and bytes, oldest evicted first"""
+
+    DEFAULT_TTL = int(os.environ.get("HEXSTRIKE_RESULT_TTL", 6 * 3600))  # Seconds a result is kept after it finishes
+    DEFAULT_MAX_ENTRIES = int(os.environ.get("HEXSTRIKE_RESULT_MAX_ENTRIES", 5000))
+    DEFAULT_MAX_BYTES = int(os.environ.get("HEXSTRIKE_RESULT_MAX_BYTES", 128 * 1024 * 1024))
+    SPILL_RESULTS = os.environ.get("HEXSTRIKE_RESULT_SPILL", "1").lower() in ("1", "true", "yes")  # Large stdout/stderr to the output store
+    TOMBSTONES = 10000  # Ids of removed results remembered so pollers learn why a result is gone
+
+    def __init__(self, ttl: int = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_bytes: int = DEFAULT_MAX_BYTES, spill: bool = SPILL_RESULTS):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.spill = spill
+        self.records = OrderedDict()  # task_id -> (record, size_bytes, stored_at), oldest first
+        self.tombstones = OrderedDict()  # task_id -> reason the result was removed
+        self.total_bytes = 0
+        self.lock = threading.Lock()
+        self.stats = {"stored": 0, "acknowledged": 0, "expired": 0, "evicted": 0, "evicted_bytes": 0, "spilled": 0}
+
+    def _spill(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Move large command output in a record's result to the output store"""
+        result = record.get("result")
+        if not self.spill or not isinstance(result, dict) or result.get("output_spilled"):
+            return record
+        if not isinstance(result.get("stdout", ""), str) or not isinstance(result.get("stderr", ""), str):
+            return record
+        spilled = output_store.store_result(result)
+        if spilled is result:
+            return record
+        with self.lock:
+            self.stats["spilled"] += 1
+        return {**record, "result": spilled}
+
+    @staticmethod
+    def _output_id(record: Dict[str, Any]) -> Optional[str]:
+        result = record.get("result")
+        return result.get("output_id") if isinstance(result, dict) else None
+
+    def _held_output(self, task_id: str, entry) -> List[Tuple[str, str]]:
+        """(output_id, task_id) to release for a removed entry, empty if it had no spilled output"""
+        output_id = self._output_id(entry[0]) if entry is not None else None
+        return [(output_id, task_id)] if output_id else []
+
+    @staticmethod
+    def _release(held: List[Tuple[str, str]]):
+        """Drop the task holds on spilled output; called without self.lock since it may delete files"""
+        for output_id, task_id in held:
+            try:
+                output_store.release(output_id, f"task:{task_id}")
+            except Exception as e:
+                logger.warning(f"⚠️  Could not delete spilled output {output_id}: {str(e)}")
+
+    def put(self, task_id: str, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Store a finished task's record, evicting the oldest results beyond the limits; returns the stored record"""
+        try:
+            record = self._spill(record)
+        except Exception as e:
+            logger.warning(f"⚠️  Could not spill result of task {task_id}: {str(e)}")
+        size = AdvancedCache._estimate_size(record)
+        output_id = self._output_id(record)
+        if output_id:
+            # The spool may be shared with a cache entry or other tasks; it is only deleted once nobody holds it
+            output_store.retain(output_id, f"task:{task_id}", time.time() + self.ttl)
+
+        with self.lock:
+            # A replaced record's hold is released unless the new record holds the same output
+            held = [(old_id, held_task) for old_id, held_task in self._held_output(task_id, self._remove(task_id, None))
+                    if old_id != output_id]
+            self.tombstones.pop(task_id, None)
+            self.records[task_id] = (record, size, time.time())
+            self.total_bytes += size
+            self.stats["stored"] += 1
+            self._expire(held)
+            # The newest record is never evicted for its own sake, even if it alone exceeds max_bytes
+            while len(self.records) > 1 and (len(self.records) > self.max_entries or self.total_bytes > self.max_bytes):
+                evicted_id = next(iter(self.records))
+                self.stats["evicted_bytes"] += self.records[evicted_id][1]
+                held += self._held_output(evicted_id, self._remove(evicted_id, "evicted"))
+        self._release(held)
+        return record
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """The stored record, a tombstone record if it was removed, or None if it is unknown"""
+        held = []
+        with self.lock:
+            entry = self.records.get(task_id)
+            if entry is not None and entry[2] + self.ttl <= time.time():
+                held = self._held_output(task_id, self._remove(task_id, "expired"))
+                entry = None
+            if entry is not None:
+                return entry[0]
+            reason = self.tombstones.get(task_id)
+        self._release(held)
+        if reason is None:
+            return None
+        return {"status": reason, "result": None, "removed": True,
+                "error": f"Result was {reason} and is no longer available"}
+
+    def __contains__(self, task_id: str) -> bool:
+        with self.lock:
+            return task_id in self.records
+
+    def acknowledge(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Delete a result the client has consumed, and its spilled output unless a cache entry or another task still uses it"""
+        with self.lock:
+            entry = self.records.get(task_id)
+            if entry is None:
+                return None
+            self._remove(task_id, "acknowledged")
+        self._release(self._held_output(task_id, entry))
+        return entry[0]
+
+    def expire(self) -> int:
+        """Drop results past their TTL"""
+        held = []
+        with self.lock:
+            expired = self._expire(held)
+        self._release(held)
+        return expired
+
+    def _expire(self, held: List[Tuple[str, str]]) -> int:
+        """Caller must hold self.lock and release what is added to held once it lets go of it; records are in
+        completion order so expiry stops at the first live one"""
+        cutoff = time.time() - self.ttl
+        expired = 0
+        while self.records:
+            task_id, (_, _, stored_at) = next(iter(self.records.items()))
+            if stored_at > cutoff:
+                break
+            held += self._held_output(task_id, self._remove(task_id, "expired"))
+            expired += 1
+        return expired
+
+    def _remove(self, task_id: str, reason: Optional[str]):
+        """Caller must hold self.lock; returns the removed entry or None"""
+        entry = self.records.pop(task_id, None)
+        if entry is None:
+            return None
+        self.total_bytes -= entry[1]
+        if reason:
+            self.stats[reason] += 1
+            self.tombstones[task_id] = reason
+            while len(self.tombstones) > self.TOMBSTONES:
+                self.tombstones.popitem(last=False)
+        return entry
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self.lock:
+            oldest = next(iter(self.records.values()))[2] if self.records else None
+            return {
+                "entries": len(self.records),
+                "bytes": self.total_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+                "byte_utilization": (self.total_bytes / self.max_bytes * 100) if self.max_bytes else 0.0,
+                "oldest_age": time.time() - oldest if oldest else 0.0,
+                **self.stats
+            }
+
+class TaskNotifier:
+    """Completion events for long-polling and per-client status push for pooled tasks"""
+
+    TERMINAL = ("completed", "failed", "expired")
+    CLIENT_HISTORY = 1000  # Latest status of this many tasks is kept per client for reconnect snapshots
+    MAX_CLIENTS = 1000  # Least recently active clients beyond this are forgotten
+    SUBSCRIBER_QUEUE = 1000  # Events buffered per connected subscriber before dropping
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.done_events = {}  # task_id -> Event set when the task reaches a terminal state
+        self.task_clients = {}  # task_id -> client ids watching it
+        self.client_tasks = OrderedDict()  # client_id -> OrderedDict(task_id -> latest event)
+        self.subscribers = {}  # client_id -> subscriber queues
+        self.stats = {"published": 0, "delivered": 0, "dropped": 0, "long_polls": 0, "long_poll_timeouts": 0}
+
+    def track(self, task_id: str, client_id: Optional[str] = None):
+        """Start tracking a submitted task so waiters can block on it"""
+        with self.lock:
+            self.done_events.setdefault(task_id, threading.Event())
+        if client_id:
+            self.watch(task_id, client_id)
+
+    def watch(self, task_id: str, client_id: str):
+        """Push a task's status changes to a client, e.g. one that joined a coalesced task"""
+        with self.lock:
+            self.task_clients.setdefault(task_id, set()).add(client_id)
+            self._client_history(client_id)
+
+    def _client_history(self, client_id: str) -> OrderedDict:
+        """Caller must hold self.lock"""
+        history = self.client_tasks.get(client_id)
+        if history is None:
+            history = self.client_tasks[client_id] = OrderedDict()
+            while len(self.client_tasks) > self.MAX_CLIENTS:
+                oldest = next(iter(self.client_tasks))
+                if oldest in self.subscribers:
+                    self.client_tasks.move_to_end(oldest)
+                    break
+                self.client_tasks.popitem(last=False)
+        self.client_tasks.move_to_end(client_id)
+        return history
+
+    def publish(self, task_id: str, status: str, **details):
+        """Record a status change, push it to watching clients and wake long-pollers on terminal states"""
+        event = {"task_id": task_id, "status": status, "timestamp": time.time(), **details}
+        done = None
+        with self.lock:
+            self.stats["published"] += 1
+            for client_id in self.task_clients.get(task_id, ()):
+                history = self._client_history(client_id)
+                history[task_id] = event
+                history.move_to_end(task_id)
+                while len(history) > self.CLIENT_HISTORY:
+                    history.popitem(last=False)
+                for subscriber in self.subscribers.get(client_id, ()):
+                    try:
+                        subscriber.put_nowait(event)
+                        self.stats["delivered"] += 1
+                    except queue.Full:
+                        self.stats["dropped"] += 1
+            if status in self.TERMINAL:
+                done = self.done_events.pop(task_id, None)
+                self.task_clients.pop(task_id, None)
+        if done is not None:
+            done.set()
+
+    def wait(self, task_id: str, timeout: float) -> bool:
+        """Block until the task finishes or timeout passes; True if it is no longer pending"""
+        with self.lock:
+            done = self.done_events.get(task_id)
+            self.stats["long_polls"] += 1
+        if done is None or done.wait(timeout):
+            return True
+        with self.lock:
+            self.stats["long_poll_timeouts"] += 1
+        return False
+
+    def subscribe(self, client_id: str) -> Tuple[queue.Queue, List[Dict[str, Any]]]:
+        """Register a push subscriber; returns its queue and the client's latest known task statuses"""
+        subscriber = queue.Queue(maxsize=self.SUBSCRIBER_QUEUE)
+        with self.lock:
+            self.subscribers.setdefault(client_id, []).append(subscriber)
+            snapshot = list(self._client_history(client_id).values())
+        return subscriber, snapshot
+
+    def unsubscribe(self, client_id: str, subscriber: queue.Queue):
+        with self.lock:
+            remaining = [q for q in self.subscribers.get(client_id, []) if q is not subscriber]
+            if remaining:
+                self.subscribers[client_id] = remaining
+            else:
+                self.subscribers.pop(client_id, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                "pending_tasks": len(self.done_events),
+                "clients": len(self.client_tasks),
+                "subscribers": sum(len(queues) for queues in self.subscribers.values()),
+                **self.stats
+            }
+
+class PoolAutoscaler:
+    """Single controller sizing the process pool on queue wait time, bounded by CPU and memory headroom"""
+
+    INTERVAL = 5  # Seconds between decisions
+    TARGET_QUEUE_WAIT = float(os.environ.get("HEXSTRIKE_TARGET_QUEUE_WAIT", 2.0))  # p95 seconds a task may wait for a worker
+    WAIT_WINDOW = 60  # Seconds of task starts the wait percentile is computed over
+    IDLE_WAIT_RATIO = 0.25  # Scale down only once waits fall well below target (hysteresis band)
+    IDLE_UTILIZATION = 0.5  # ... and at most this share of workers is busy
+    UP_STREAK = 2  # Consecutive observations needed before scaling up
+    DOWN_STREAK = 6  # ... and before scaling down, so brief lulls do not shed workers
+    UP_COOLDOWN = 15  # Seconds after any resize before the next scale up
+    DOWN_COOLDOWN = 60  # Seconds after any resize before the next scale down
+    MAX_STEP = 4  # Most workers added in one decision
+    DEFAULT_THRESHOLDS = {
+        "cpu_high": 85.0,  # Shed a worker above this CPU utilisation
+        "memory_high": 90.0,  # ... or above this memory utilisation
+        "cpu_scale_up_max": 75.0  # Never add workers above this CPU utilisation
+    }
+
+    def __init__(self, pool: "ProcessPool"):
+        self.pool = pool
+        self.enabled = True
+        self.target_wait = self.TARGET_QUEUE_WAIT
+        self.thresholds = dict(self.DEFAULT_THRESHOLDS)
+        self.waits = deque(maxlen=2000)  # (started_at, queue wait) of recent task starts
+        self.up_streak = 0
+        self.down_streak = 0
+        self.last_resize = 0.0
+        self.decisions = {}  # (action, reason) -> count
+        self.workers_added = 0
+        self.workers_removed = 0
+        self.last_signals = {}
+        self.history = deque(maxlen=50)  # Recent resizes, newest last
+        self.stats_lock = threading.Lock()
+
+    def observe_wait(self, started_at: float, wait: float):
+        """Called by a worker each time it picks up a task"""
+        self.waits.append((started_at, wait))
+
+    def _signals(self) -> Dict[str, Any]:
+        """Queue wait, queue depth, utilisation and resource readings the decision is based on"""
+        now = time.time()
+        recent = sorted(wait for started_at, wait in list(self.waits) if now - started_at <= self.WAIT_WINDOW)
+        with self.pool.pool_lock:
+            workers = len(self.pool.workers) - self.pool.retiring
+            busy = sum(1 for task in self.pool.active_tasks.values() if task["status"] == "running")
+            queued_since = [task["submitted_at"] for task in self.pool.active_tasks.values() if task["status"] == "queued"]
+            worker_threads = [worker.ident for worker in self.pool.workers.values()]
+        # Workers parked on the admission controller are not doing work, and more of them would only park too
+        admission_waiting = admission_controller.waiting_among(worker_threads)
+        busy = max(0, busy - admission_waiting)
+        sample = resource_sampler.latest()
+        wait_p95 = recent[round(0.95 * (len(recent) - 1))] if recent else 0.0
+        oldest_queued = now - min(queued_since) if queued_since else 0.0
+        return {
+            "workers": workers,
+            "busy": busy,
+            "admission_waiting": admission_waiting,
+            "queued": self.pool.task_queue.qsize(),
+            "utilization": busy / workers if workers else 1.0,
+            "wait_p95": wait_p95,
+            "oldest_queued": oldest_queued,
+            # Tasks stuck in the queue have no recorded wait yet, so their age counts too
+            "queue_wait": max(wait_p95, oldest_queued),
+            "cpu_percent": sample["cpu_percent"],
+            "memory_percent": sample["memory_percent"]
+        }
+
+    def _decide(self, signals: Dict[str, Any], now: float):
+        """Return (action, workers to change, reason)"""
+        workers = signals["workers"]
+        since_resize = now - self.last_resize
+        cpu, memory = signals["cpu_percent"], signals["memory_percent"]
+
+        if cpu > self.thresholds["cpu_high"] or memory > self.thresholds["memory_high"]:
+            self.up_streak, self.down_streak = 0, self.down_streak + 1
+            reason = "memory_pressure" if memory > self.thresholds["memory_high"] else "cpu_saturated"
+            if workers <= self.pool.min_workers:
+                return "hold", 0, "at_min_workers"
+            if self.down_streak < self.UP_STREAK or since_resize < self.UP_COOLDOWN:
+                return "hold", 0, "cooldown"
+            return "scale_down", 1, reason
+
+        if signals["queued"] and signals["queue_wait"] > self.target_wait:
+            self.up_streak, self.down_streak = self.up_streak + 1, 0
+            if signals["admission_waiting"]:
+                # The queue is backed up behind admission limits, not behind a shortage of workers
+                return "hold", 0, "admission_bound"
+            if workers >= self.pool.max_workers:
+                return "hold", 0, "at_max_workers"
+            if cpu > self.thresholds["cpu_scale_up_max"]:
+                return "hold", 0, "cpu_headroom_exhausted"
+            if self.up_streak < self.UP_STREAK or since_resize < self.UP_COOLDOWN:
+                return "hold", 0, "cooldown"
+            # Grow in proportion to how far over target the queue is, but not past the backlog
+            step = math.ceil(workers * (signals["queue_wait"] / self.target_wait - 1)) if self.target_wait > 0 else self.MAX_STEP
+            step = max(1, min(step, self.MAX_STEP, signals["queued"], self.pool.max_workers - workers))
+            return "scale_up", step, "queue_wait_above_target"
+
+        if (not signals["queued"] and signals["queue_wait"] < self.target_wait * self.IDLE_WAIT_RATIO
+                and signals["utilization"] < self.IDLE_UTILIZATION):
+            self.up_streak, self.down_streak = 0, self.down_streak + 1
+            if workers <= self.pool.min_workers:
+                return "hold", 0, "at_min_workers"
+            if self.down_streak < self.DOWN_STREAK or since_resize < self.DOWN_COOLDOWN:
+                return "hold", 0, "cooldown"
+            return "scale_down", 1, "idle"
+
+        # Inside the hysteresis band
+        self.up_streak = self.down_streak = 0
+        return "hold", 0, "steady"
+
+    def tick(self) -> Dict[str, Any]:
+        """Take one scaling decision and apply it"""
+        now = time.time()
+        signals = self._signals()
+        action, count, reason = self._decide(signals, now)
+        if action == "scale_up":
+            count = self.pool._scale_up(count)
+        elif action == "scale_down":
+            count = self.pool._scale_down(count)
+        if action != "hold":
+            self.up_streak = self.down_streak = 0
+            logger.info(f"{'📈' if action == 'scale_up' else '📉'} Autoscaler {action.replace('_', ' ')} by {count} "
+                        f"({reason}) | queue wait {signals['queue_wait']:.2f}s | CPU {signals['cpu_percent']:.1f}% | "
+                        f"workers {signals['workers']} → {self.pool.target_workers()}")
+        return self.record(action, count, reason, signals, now)
+
+    def record(self, action: str, count: int, reason: str, signals: Optional[Dict[str, Any]] = None,
+               now: Optional[float] = None) -> Dict[str, Any]:
+        """Count a decision; resizes (including manual ones) also restart the cooldown"""
+        now = now or time.time()
+        decision = {"action": action, "count": count, "reason": reason, "timestamp": now}
+        with self.stats_lock:
+            self.decisions[(action, reason)] = self.decisions.get((action, reason), 0) + 1
+            if signals is not None:
+                self.last_signals = signals
+            if action != "hold" and count:
+                self.last_resize = now
+                if action == "scale_up":
+                    self.workers_added += count
+                else:
+                    self.workers_removed += count
+                self.history.append({**decision, "workers": self.pool.target_workers()})
+        return decision
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self.stats_lock:
+            return {
+                "enabled": self.enabled,
+                "target_queue_wait": self.target_wait,
+                "thresholds": dict(self.thresholds),
+                "signals": dict(self.last_signals),
+                "decisions": [{"action": action, "reason": reason, "count": n}
+                              for (action, reason), n in sorted(self.decisions.items())],
+                "workers_added": self.workers_added,
+                "workers_removed": self.workers_removed,
+                "last_resize": self.last_resize or None,
+                "recent_resizes": list(self.history)
+            }
+
 class ProcessPool:
     """Intelligent process pool with auto-scaling capabilities"""
 
-    def __init__(self, min_workers=2, max_workers=20, scale_threshold=0.8):
+    def __init__(self, min_workers=2, max_workers=20):
         self.min_workers = min_workers
         self.max_workers = max_workers
-        self.scale_threshold = scale_threshold
-        self.workers = []
-        self.task_queue = queue.Queue()
-        self.results = {}
+        self.workers = {}  # worker_id -> thread; a worker removes its own entry when it exits
+        self.worker_ids = itertools.count()
+        self.retiring = 0  # Shutdown sentinels queued but not yet taken by a worker
+        self.task_queue = PriorityTaskQueue()
+        self.results = TaskResultStore()
+        self.notifier = TaskNotifier()
         self.pool_lock = threading.Lock()
         self.active_tasks = {}
+        self.aliases = {}  # task_id -> ids handed to coalesced callers of the same task
+        self.alias_of = {}  # alias id -> task_id while the task is pending
+        self.wait_times = {name: deque(maxlen=1000) for name in PriorityTaskQueue.PRIORITIES}
         self.performance_metrics = {
             "tasks_completed": 0,
             "tasks_failed": 0,
             "avg_task_time": 0.0,
             "cpu_usage": 0.0,
-            "memory_usage": 0.0
+            "memory_usage": 0.0,
+            "tasks_expired": 0
         }
+        self.autoscaler = PoolAutoscaler(self)
 
         # Initialize minimum workers
         self._scale_up(self.min_workers)
@@ -4901,54 +5531,155 @@ class ProcessPool:
         self.monitor_thread = threading.Thread(target=self._monitor_performance, daemon=True)
         self.monitor_thread.start()
 
-    def submit_task(self, task_id: str, func, *args, **kwargs) -> str:
-        """Submit a task to the process pool"""
+    def submit_task(self, task_id: str, func, *args, priority: str = "batch", deadline: Optional[float] = None,
+                    client_id: Optional[str] = None, **kwargs) -> str:
+        """Submit a task to the process pool with a priority class, optional deadline (epoch seconds) and owning client"""
+        if priority not in PriorityTaskQueue.PRIORITIES:
+            raise ValueError(f"Unknown priority '{priority}', expected one of {', '.join(PriorityTaskQueue.PRIORITIES)}")
+
         task = {
             "id": task_id,
             "func": func,
             "args": args,
             "kwargs": kwargs,
+            "priority": priority,
+            "deadline": deadline,
             "submitted_at": time.time(),
             "status": "queued"
         }
 
+        self.notifier.track(task_id, client_id)
         with self.pool_lock:
             self.active_tasks[task_id] = task
-            self.task_queue.put(task)
+        # Announce the task before a worker can see it, so "running" never arrives ahead of "queued"
+        self.notifier.publish(task_id, "queued", priority=priority)
+        self.task_queue.put(task)
 
-        logger.info(f"📋 Task submitted to pool: {task_id}")
+        logger.info(f"📋 Task submitted to pool: {task_id} | Priority: {priority}")
         return task_id
 
+    def complete_task(self, task_id: str, result: Any, client_id: Optional[str] = None) -> str:
+        """Record a result that was available without running the task, e.g. from cache"""
+        self.results.put(task_id, {
+            "status": "completed",
+            "result": result,
+            "execution_time": 0.0,
+            "cached": True,
+            "completed_at": time.time()
+        })
+        self.notifier.track(task_id, client_id)
+        self.notifier.publish(task_id, "completed", execution_time=0.0, cached=True)
+        return task_id
+
+    def alias_task(self, task_id: str, alias_id: str, client_id: Optional[str] = None) -> bool:
+        """Give a coalesced caller its own id for a pending task, so its result can be read and acknowledged independently"""
+        with self.pool_lock:
+            task = self.active_tasks.get(task_id)
+            if task is not None:
+                self.aliases.setdefault(task_id, []).append(alias_id)
+                self.alias_of[alias_id] = task_id
+                self.notifier.track(alias_id, client_id)
+                self.notifier.publish(alias_id, task["status"], coalesced_with=task_id)
+                return True
+
+        # The task finished in the meantime: share its stored result if it is still there
+        record = self.results.get(task_id)
+        if record is None or record.get("removed"):
+            return False
+        self.results.put(alias_id, record)
+        self.notifier.track(alias_id, client_id)
+        self.notifier.publish(alias_id, record["status"], coalesced_with=task_id)
+        return True
+
+    def _publish(self, task_id: str, status: str, **details):
+        """Publish a status change for a task and the coalesced callers sharing it"""
+        with self.pool_lock:
+            aliases = list(self.aliases.get(task_id, ()))
+        for each in [task_id] + aliases:
+            self.notifier.publish(each, status, **details)
+
+    def _finish(self, task_id: str, record: Dict[str, Any], status: str, **details):
+        """Store a finished task's record under its own id and every alias, then announce it"""
+        stored = self.results.put(task_id, record)
+        with self.pool_lock:
+            self.active_tasks.pop(task_id, None)
+            aliases = self.aliases.pop(task_id, [])
+            for alias_id in aliases:
+                self.results.put(alias_id, stored)
+                self.alias_of.pop(alias_id, None)
+        for each in [task_id] + aliases:
+            self.notifier.publish(each, status, **details)
+
+    def wait_for_task(self, task_id: str, timeout: float) -> bool:
+        """Long-poll: block until the task finishes or timeout passes"""
+        return self.notifier.wait(task_id, timeout)
+
+    def promote_task(self, task_id: str, priority: str) -> bool:
+        """Raise the priority of a task that is still queued"""
+        promoted = self.task_queue.promote(task_id, priority)
+        if promoted:
+            logger.info(f"⏫ Task {task_id} promoted to {priority}")
+        return promoted
+
     def get_task_result(self, task_id: str) -> Dict[str, Any]:
         """Get result of a submitted task"""
         with self.pool_lock:
-            if task_id in self.results:
-                return self.results[task_id]
-            elif task_id in self.active_tasks:
-                return {"status": self.active_tasks[task_id]["status"], "result": None}
-            else:
-                return {"status": "not_found", "result": None}
+            active = self.active_tasks.get(self.alias_of.get(task_id, task_id))
+            if active is not None:
+                return {"status": active["status"], "result": None}
+        stored = self.results.get(task_id)
+        return stored if stored is not None else {"status": "not_found", "result": None}
+
+    def acknowledge_task(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Release a finished task's stored result once the client has consumed it"""
+        return self.results.acknowledge(task_id)
 
     def _worker_thread(self, worker_id: int):
         """Worker thread that processes tasks"""
         logger.info(f"🔧 Process pool worker {worker_id} started")
+        try:
+            self._worker_loop(worker_id)
+        finally:
+            with self.pool_lock:
+                self.workers.pop(worker_id, None)
+            logger.info(f"🔧 Process pool worker {worker_id} stopped")
 
+    def _worker_loop(self, worker_id: int):
         while True:
             try:
                 # Get task from queue with timeout
                 task = self.task_queue.get(timeout=30)
-                if task is None:  # Shutdown signal
+                if task is None:  # Shutdown signal, whichever worker takes it is the one that retires
+                    with self.pool_lock:
+                        self.retiring -= 1
                     break
 
                 task_id = task["id"]
                 start_time = time.time()
 
+                # Drop tasks whose deadline passed while they were queued
+                if task["deadline"] and start_time > task["deadline"]:
+                    with self.pool_lock:
+                        self.performance_metrics["tasks_expired"] += 1
+                    self._finish(task_id, {
+                        "status": "expired",
+                        "error": "Deadline passed before the task could start",
+                        "priority": task["priority"],
+                        "queue_wait": start_time - task["submitted_at"],
+                        "expired_at": start_time
+                    }, "expired", queue_wait=start_time - task["submitted_at"])
+                    logger.warning(f"⌛ Task expired before start: {task_id}")
+                    continue
+
                 # Update task status
                 with self.pool_lock:
                     if task_id in self.active_tasks:
                         self.active_tasks[task_id]["status"] = "running"
                         self.active_tasks[task_id]["worker_id"] = worker_id
                         self.active_tasks[task_id]["started_at"] = start_time
+                    self.wait_times[task["priority"]].append(start_time - task["submitted_at"])
+                self.autoscaler.observe_wait(start_time, start_time - task["submitted_at"])
+                self._publish(task_id, "running", worker_id=worker_id, queue_wait=start_time - task["submitted_at"])
 
                 try:
                     # Execute task
@@ -4957,14 +5688,6 @@ class ProcessPool:
                     # Store result
                     execution_time = time.time() - start_time
                     with self.pool_lock:
-                        self.results[task_id] = {
-                            "status": "completed",
-                            "result": result,
-                            "execution_time": execution_time,
-                            "worker_id": worker_id,
-                            "completed_at": time.time()
-                        }
-
                         # Update performance metrics
                         self.performance_metrics["tasks_completed"] += 1
                         self.performance_metrics["avg_task_time"] = (
@@ -4972,28 +5695,28 @@ class ProcessPool:
                             self.performance_metrics["tasks_completed"]
                         )
 
-                        # Remove from active tasks
-                        if task_id in self.active_tasks:
-                            del self.active_tasks[task_id]
-
+                    # Store result and remove from active tasks
+                    self._finish(task_id, {
+                        "status": "completed",
+                        "result": result,
+                        "execution_time": execution_time,
+                        "worker_id": worker_id,
+                        "completed_at": time.time()
+                    }, "completed", execution_time=execution_time,
+                        success=result.get("success") if isinstance(result, dict) else None)
                     logger.info(f"✅ Task completed: {task_id} in {execution_time:.2f}s")
 
                 except Exception as e:
                     # Handle task failure
                     with self.pool_lock:
-                        self.results[task_id] = {
-                            "status": "failed",
-                            "error": str(e),
-                            "execution_time": time.time() - start_time,
-                            "worker_id": worker_id,
-                            "failed_at": time.time()
-                        }
-
                         self.performance_metrics["tasks_failed"] += 1
-
-                        if task_id in self.active_tasks:
-                            del self.active_tasks[task_id]
-
+                    self._finish(task_id, {
+                        "status": "failed",
+                        "error": str(e),
+                        "execution_time": time.time() - start_time,
+                        "worker_id": worker_id,
+                        "failed_at": time.time()
+                    }, "failed", error=str(e))
                     logger.error(f"❌ Task failed: {task_id} - {str(e)}")
 
                 self.task_queue.task_done()
@@ -5005,43 +5728,26 @@ class ProcessPool:
                 logger.error(f"💥 Worker {worker_id} error: {str(e)}")
 
     def _monitor_performance(self):
-        """Monitor pool performance and auto-scale"""
+        """Run the autoscaler and expire uncollected results"""
         while True:
             try:
-                time.sleep(10)  # Monitor every 10 seconds
+                time.sleep(PoolAutoscaler.INTERVAL)
 
-                with self.pool_lock:
-                    queue_size = self.task_queue.qsize()
-                    active_workers = len([w for w in self.workers if w.is_alive()])
-                    active_tasks_count = len(self.active_tasks)
+                if self.autoscaler.enabled:
+                    self.autoscaler.tick()
 
-                # Calculate load metrics
-                if active_workers > 0:
-                    load_ratio = (active_tasks_count + queue_size) / active_workers
-                else:
-                    load_ratio = float('inf')
-
-                # Auto-scaling logic
-                if load_ratio > self.scale_threshold and active_workers < self.max_workers:
-                    # Scale up
-                    new_workers = min(2, self.max_workers - active_workers)
-                    self._scale_up(new_workers)
-                    logger.info(f"📈 Scaled up process pool: +{new_workers} workers (total: {active_workers + new_workers})")
-
-                elif load_ratio < 0.3 and active_workers > self.min_workers:
-                    # Scale down
-                    workers_to_remove = min(1, active_workers - self.min_workers)
-                    self._scale_down(workers_to_remove)
-                    logger.info(f"📉 Scaled down process pool: -{workers_to_remove} workers (total: {active_workers - workers_to_remove})")
+                # Release results nobody collected within their TTL
+                expired = self.results.expire()
+                if expired:
+                    logger.info(f"🧹 Expired {expired} uncollected task results")
 
                 # Update performance metrics
                 try:
-                    cpu_percent = psutil.cpu_percent()
-                    memory_info = psutil.virtual_memory()
+                    sample = resource_sampler.latest()
 
                     with self.pool_lock:
-                        self.performance_metrics["cpu_usage"] = cpu_percent
-                        self.performance_metrics["memory_usage"] = memory_info.percent
+                        self.performance_metrics["cpu_usage"] = sample["cpu_percent"]
+                        self.performance_metrics["memory_usage"] = sample["memory_percent"]
 
                 except Exception:
                     pass  # Ignore psutil errors
@@ -5049,72 +5755,123 @@ class ProcessPool:
             except Exception as e:
                 logger.error(f"💥 Pool monitor error: {str(e)}")
 
-    def _scale_up(self, count: int):
-        """Add workers to the pool"""
+    def target_workers(self) -> int:
+        """Workers the pool is sized to, not counting ones that have been told to retire"""
+        with self.pool_lock:
+            return len(self.workers) - self.retiring
+
+    def _scale_up(self, count: int) -> int:
+        """Add up to count workers without exceeding max_workers, returning how many were added"""
         with self.pool_lock:
-            for i in range(count):
-                worker_id = len(self.workers)
-                worker = threading.Thread(target=self._worker_thread, args=(worker_id,), daemon=True)
+            count = max(0, min(count, self.max_workers - (len(self.workers) - self.retiring)))
+            # Withdraw shutdown sentinels no worker has taken yet before starting new threads
+            revoked = self.task_queue.revoke_shutdowns(min(count, self.retiring))
+            self.retiring -= revoked
+            for _ in range(count - revoked):
+                worker_id = next(self.worker_ids)
+                worker = threading.Thread(target=self._worker_thread, args=(worker_id,), daemon=True,
+                                          name=f"hexstrike-pool-worker-{worker_id}")
+                self.workers[worker_id] = worker
                 worker.start()
-                self.workers.append(worker)
+        return count
 
-    def _scale_down(self, count: int):
-        """Remove workers from the pool"""
+    def _scale_down(self, count: int) -> int:
+        """Retire up to count workers without going below min_workers, returning how many were signalled"""
         with self.pool_lock:
+            count = max(0, min(count, len(self.workers) - self.retiring - self.min_workers))
             for _ in range(count):
-                if len(self.workers) > self.min_workers:
-                    # Signal worker to shutdown by putting None in queue
-                    self.task_queue.put(None)
-                    # Remove from workers list (worker will exit naturally)
-                    if self.workers:
-                        self.workers.pop()
+                # The next idle worker takes the sentinel and removes itself from self.workers
+                self.task_queue.put(None)
+            self.retiring += count
+        return count
+
+    @staticmethod
+    def _wait_percentiles(samples) -> Dict[str, Any]:
+        """p50/p95/p99 of queue wait times in seconds"""
+        if not samples:
+            return {"samples": 0, "p50": 0.0, "p95": 0.0, "p99": 0.0}
+        ordered = sorted(samples)
+        last = len(ordered) - 1
+        return {
+            "samples": len(ordered),
+            "p50": ordered[round(0.50 * last)],
+            "p95": ordered[round(0.95 * last)],
+            "p99": ordered[round(0.99 * last)]
+        }
 
     def get_pool_stats(self) -> Dict[str, Any]:
         """Get current pool statistics"""
         with self.pool_lock:
-            active_workers = len([w for w in self.workers if w.is_alive()])
-            return {
-                "active_workers": active_workers,
+            all_waits = [wait for waits in self.wait_times.values() for wait in waits]
+            stats = {
+                "active_workers": len(self.workers) - self.retiring,
+                "worker_threads": len(self.workers),
+                "retiring_workers": self.retiring,
                 "queue_size": self.task_queue.qsize(),
+                "queued_by_priority": self.task_queue.qsize_by_priority(),
+                "queue_wait": {
+                    "overall": self._wait_percentiles(all_waits),
+                    **{name: self._wait_percentiles(waits) for name, waits in self.wait_times.items()}
+                },
                 "active_tasks": len(self.active_tasks),
+                "results": self.results.get_stats(),
+                "notifications": self.notifier.get_stats(),
                 "performance_metrics": self.performance_metrics.copy(),
                 "min_workers": self.min_workers,
                 "max_workers": self.max_workers
             }
+        stats["autoscaler"] = self.autoscaler.get_stats()
+        return stats
 
 class AdvancedCache:
-    """Advanced caching system with intelligent TTL and LRU eviction"""
+    """Advanced caching system with TTL expiry and size-aware LRU eviction"""
 
-    def __init__(self, max_size=1000, default_ttl=3600):
+    def __init__(self, max_size=1000, default_ttl=3600, max_bytes=256 * 1024 * 1024):
         self.max_size = max_size
+        self.max_bytes = max_bytes
         self.default_ttl = default_ttl
-        self.cache = {}
-        self.access_times = {}
-        self.ttl_times = {}
+        self.cache = OrderedDict()  # key -> (value, size_bytes, expires_at), least recently used first
+        self.expiry_heap = []  # (expires_at, key), stale pairs are skipped lazily
+        self.total_bytes = 0
         self.cache_lock = threading.RLock()
         self.hit_count = 0
         self.miss_count = 0
+        self.eviction_count = 0
+        self.expired_count = 0
+        self.evicted_bytes = 0
 
         # Start cleanup thread
         self.cleanup_thread = threading.Thread(target=self._cleanup_expired, daemon=True)
         self.cleanup_thread.start()
 
+    @classmethod
+    def _estimate_size(cls, value: Any) -> int:
+        """Approximate memory footprint of a cached value in bytes"""
+        if isinstance(value, str):
+            return 49 + len(value)
+        if isinstance(value, (bytes, bytearray)):
+            return 33 + len(value)
+        if isinstance(value, dict):
+            return 64 + sum(cls._estimate_size(k) + cls._estimate_size(v) for k, v in value.items())
+        if isinstance(value, (list, tuple, set)):
+            return 56 + sum(cls._estimate_size(item) for item in value)
+        return sys.getsizeof(value)
+
     def get(self, key: str) -> Any:
         """Get value from cache"""
         with self.cache_lock:
-            current_time = time.time()
+            entry = self.cache.get(key)
 
-            # Check if key exists and is not expired
-            if key in self.cache and (key not in self.ttl_times or self.ttl_times[key] > current_time):
-                # Update access time for LRU
-                self.access_times[key] = current_time
+            if entry is not None and entry[2] > time.time():
+                # Mark as most recently used
+                self.cache.move_to_end(key)
                 self.hit_count += 1
-                return self.cache[key]
+                return entry[0]
 
             # Cache miss or expired
-            if key in self.cache:
-                # Remove expired entry
+            if entry is not None:
                 self._remove_key(key)
+                self.expired_count += 1
 
             self.miss_count += 1
             return None
@@ -5128,14 +5885,30 @@ class AdvancedCache:
             if ttl is None:
                 ttl = self.default_ttl
 
-            # Check if we need to evict entries
-            if len(self.cache) >= self.max_size and key not in self.cache:
+            size = self._estimate_size(value)
+            self._remove_key(key)
+            if size > self.max_bytes:
+                logger.debug(f"🗑️ Not caching {key}: {size} bytes exceeds the cache budget")
+                return
+
+            # Drop expired entries first, then least recently used ones until the new value fits
+            self._expire(current_time)
+            while self.cache and (len(self.cache) >= self.max_size or self.total_bytes + size > self.max_bytes):
                 self._evict_lru()
 
-            # Set the value
-            self.cache[key] = value
-            self.access_times[key] = current_time
-            self.ttl_times[key] = current_time + ttl
+            expires_at = current_time + ttl
+            self.cache[key] = (value, size, expires_at)
+            self.total_bytes += size
+            heapq.heappush(self.expiry_heap, (expires_at, key))
+
+            # Rebuild the heap when overwritten keys have left too many stale pairs behind
+            if len(self.expiry_heap) > 2 * len(self.cache) + 64:
+                self.expiry_heap = [(entry[2], k) for k, entry in self.cache.items()]
+                heapq.heapify(self.expiry_heap)
+
+    def __contains__(self, key: str) -> bool:
+        with self.cache_lock:
+            return key in self.cache
 
     def delete(self, key: str) -> bool:
         """Delete key from cache"""
@@ -5149,43 +5922,47 @@ class AdvancedCache:
         """Clear all cache entries"""
         with self.cache_lock:
             self.cache.clear()
-            self.access_times.clear()
-            self.ttl_times.clear()
+            self.expiry_heap.clear()
+            self.total_bytes = 0
 
     def _remove_key(self, key: str) -> None:
-        """Remove key and associated metadata"""
-        self.cache.pop(key, None)
-        self.access_times.pop(key, None)
-        self.ttl_times.pop(key, None)
+        """Remove key and account for its size"""
+        entry = self.cache.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry[1]
 
     def _evict_lru(self) -> None:
         """Evict least recently used entry"""
-        if not self.access_times:
-            return
-
-        # Find least recently used key
-        lru_key = min(self.access_times.keys(), key=lambda k: self.access_times[k])
-        self._remove_key(lru_key)
-        logger.debug(f"🗑️ Evicted LRU cache entry: {lru_key}")
+        key, (_, size, _) = self.cache.popitem(last=False)
+        self.total_bytes -= size
+        self.eviction_count += 1
+        self.evicted_bytes += size
+        logger.debug(f"🗑️ Evicted LRU cache entry: {key} ({size} bytes)")
+
+    def _expire(self, current_time: float) -> int:
+        """Remove entries whose TTL has passed, oldest expiry first"""
+        expired = 0
+        while self.expiry_heap and self.expiry_heap[0][0] <= current_time:
+            expires_at, key = heapq.heappop(self.expiry_heap)
+            entry = self.cache.get(key)
+            # Skip pairs left behind by keys that were overwritten or removed
+            if entry is not None and entry[2] == expires_at:
+                self._remove_key(key)
+                expired += 1
+        self.expired_count += expired
+        return expired
 
     def _cleanup_expired(self) -> None:
         """Cleanup expired entries periodically"""
         while True:
             try:
                 time.sleep(60)  # Cleanup every minute
-                current_time = time.time()
-                expired_keys = []
 
                 with self.cache_lock:
-                    for key, expiry_time in self.ttl_times.items():
-                        if expiry_time <= current_time:
-                            expired_keys.append(key)
-
-                    for key in expired_keys:
-                        self._remove_key(key)
+                    expired = self._expire(time.time())
 
-                if expired_keys:
-                    logger.debug(f"🧹 Cleaned up {len(expired_keys)} expired cache entries")
+                if expired:
+                    logger.debug(f"🧹 Cleaned up {expired} expired cache entries")
 
             except Exception as e:
                 logger.error(f"💥 Cache cleanup error: {str(e)}")
@@ -5199,10 +5976,16 @@ class AdvancedCache:
             return {
                 "size": len(self.cache),
                 "max_size": self.max_size,
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
                 "hit_count": self.hit_count,
                 "miss_count": self.miss_count,
                 "hit_rate": hit_rate,
-                "utilization": (len(self.cache) / self.max_size * 100)
+                "eviction_count": self.eviction_count,
+                "evicted_bytes": self.evicted_bytes,
+                "expired_count": self.expired_count,
+                "utilization": (len(self.cache) / self.max_size * 100),
+                "byte_utilization": (self.total_bytes / self.max_bytes * 100) if self.max_bytes else 0
             }
 
 class EnhancedProcessManager:
@@ -5210,55 +5993,106 @@ class EnhancedProcessManager:
 
     def __init__(self):
         self.process_pool = ProcessPool(min_workers=4, max_workers=32)
-        self.cache = AdvancedCache(max_size=2000, default_ttl=1800)  # 30 minutes default TTL
         self.resource_monitor = ResourceMonitor()
         self.process_registry = {}
         self.registry_lock = threading.RLock()
+        self.inflight_commands = {}
+        self.coalesced_count = 0
         self.performance_dashboard = PerformanceDashboard()
 
         # Process termination and recovery
         self.termination_handlers = {}
         self.recovery_strategies = {}
 
-        # Auto-scaling configuration
+        # Auto-scaling configuration, shared with the pool's autoscaler
         self.auto_scaling_enabled = True
-        self.resource_thresholds = {
-            "cpu_high": 85.0,
-            "memory_high": 90.0,
+        self.resource_thresholds = self.process_pool.autoscaler.thresholds
+        self.resource_thresholds.update({
             "disk_high": 95.0,
             "load_high": 0.8
-        }
+        })
 
         # Start background monitoring
         self.monitor_thread = threading.Thread(target=self._monitor_system, daemon=True)
         self.monitor_thread.start()
 
-    def execute_command_async(self, command: str, context: Dict[str, Any] = None) -> str:
-        """Execute command asynchronously using process pool"""
-        task_id = f"cmd_{int(time.time() * 1000)}_{hash(command) % 10000}"
+    @property
+    def auto_scaling_enabled(self) -> bool:
+        return self.process_pool.autoscaler.enabled
 
-        # Check cache first
-        cache_key = f"cmd_result_{hash(command)}"
-        cached_result = self.cache.get(cache_key)
-        if cached_result and context and context.get("use_cache", True):
-            logger.info(f"📋 Using cached result for command: {command[:50]}...")
-            return cached_result
+    @auto_scaling_enabled.setter
+    def auto_scaling_enabled(self, enabled: bool):
+        self.process_pool.autoscaler.enabled = bool(enabled)
+
+    def execute_command_async(self, command: str, context: Dict[str, Any] = None, priority: str = "batch",
+                              deadline: Optional[float] = None, client_id: Optional[str] = None) -> str:
+        """Execute command asynchronously using process pool"""
+        task_id = f"cmd_{int(time.time() * 1000)}_{hash(command) % 10000}_{uuid.uuid4().hex[:6]}"
+
+        # Check the shared result cache first
+        if (context or {}).get("use_cache", True):
+            cached_result = self.cache.get(command)
+            if cached_result is not None:
+                logger.info(f"📋 Using cached result for command: {command[:50]}...")
+                return self.process_pool.complete_task(task_id, cached_result, client_id=client_id)
+
+        # Join the running task if an identical command is already queued or executing; the caller
+        # gets its own task id sharing that task's result, so acknowledging it does not affect the others
+        flight_key = SingleFlight.normalize(command)
+        with self.registry_lock:
+            inflight_task_id = self.inflight_commands.get(flight_key)
+            if inflight_task_id and self.process_pool.alias_task(inflight_task_id, task_id, client_id):
+                self.coalesced_count += 1
+                logger.info(f"🔗 Coalesced with in-flight task {inflight_task_id}: {command[:50]}...")
+                # A more urgent caller should not wait behind the original caller's priority
+                self.process_pool.promote_task(inflight_task_id, priority)
+                return task_id
+            self.inflight_commands[flight_key] = task_id
 
         # Submit to process pool
-        self.process_pool.submit_task(
-            task_id,
-            self._execute_command_internal,
-            command,
-            context or {}
-        )
+        try:
+            self.process_pool.submit_task(
+                task_id,
+                self._execute_coalesced,
+                flight_key,
+                task_id,
+                command,
+                context or {},
+                priority=priority,
+                deadline=deadline,
+                client_id=client_id
+            )
+        except Exception:
+            with self.registry_lock:
+                self.inflight_commands.pop(flight_key, None)
+            raise
 
         return task_id
 
+    def _execute_coalesced(self, flight_key: str, task_id: str, command: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a pooled command and release its in-flight slot when it finishes"""
+        try:
+            return self._execute_command_internal(command, context)
+        finally:
+            with self.registry_lock:
+                if self.inflight_commands.get(flight_key) == task_id:
+                    del self.inflight_commands[flight_key]
+
+    @property
+    def cache(self) -> "HexStrikeCache":
+        """The shared command result cache"""
+        return cache
+
     def _execute_command_internal(self, command: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Internal command execution with enhanced monitoring"""
         start_time = time.time()
+        original_command = command
+        ticket = None
+        process = None
 
         try:
+            ticket = admission_controller.acquire(command)
+
             # Resource-aware execution
             resource_usage = self.resource_monitor.get_current_usage()
 
@@ -5292,7 +6126,7 @@ class EnhancedProcessManager:
             stdout, stderr = process.communicate()
             execution_time = time.time() - start_time
 
-            result = {
+            result = output_store.store_result({
                 "success": process.returncode == 0,
                 "stdout": stdout,
                 "stderr": stderr,
@@ -5300,13 +6134,11 @@ class EnhancedProcessManager:
                 "execution_time": execution_time,
                 "pid": process.pid,
                 "resource_usage": self.resource_monitor.get_process_usage(process.pid)
-            }
+            })
 
             # Cache successful results
             if result["success"] and context.get("cache_result", True):
-                cache_key = f"cmd_result_{hash(command)}"
-                cache_ttl = context.get("cache_ttl", 1800)  # 30 minutes default
-                self.cache.set(cache_key, result, cache_ttl)
+                self.cache.set(original_command, result, context.get("cache_ttl"))
 
             # Update performance metrics
             self.performance_dashboard.record_execution(command, result)
@@ -5324,10 +6156,14 @@ class EnhancedProcessManager:
                 "error": str(e)
             }
 
+            if isinstance(e, AdmissionRejected):
+                error_result["retry_after"] = e.retry_after
+
             self.performance_dashboard.record_execution(command, error_result)
             return error_result
 
         finally:
+            admission_controller.release(ticket)
             # Cleanup process registry
             with self.registry_lock:
                 if hasattr(process, 'pid') and process.pid in self.process_registry:
@@ -5337,6 +6173,10 @@ class EnhancedProcessManager:
         """Get result of async task"""
         return self.process_pool.get_task_result(task_id)
 
+    def acknowledge_task_result(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Delete a consumed async task result"""
+        return self.process_pool.acknowledge_task(task_id)
+
     def terminate_process_gracefully(self, pid: int, timeout: int = 30) -> bool:
         """Terminate process with graceful degradation"""
         try:
@@ -5368,7 +6208,7 @@ class EnhancedProcessManager:
             return False
 
     def _monitor_system(self):
-        """Monitor system resources and auto-scale"""
+        """Feed system resource usage into the performance dashboard (pool sizing is the autoscaler's job)"""
         while True:
             try:
                 time.sleep(15)  # Monitor every 15 seconds
@@ -5376,38 +6216,12 @@ class EnhancedProcessManager:
                 # Get current resource usage
                 resource_usage = self.resource_monitor.get_current_usage()
 
-                # Auto-scaling based on resource usage
-                if self.auto_scaling_enabled:
-                    self._auto_scale_based_on_resources(resource_usage)
-
                 # Update performance dashboard
                 self.performance_dashboard.update_system_metrics(resource_usage)
 
             except Exception as e:
                 logger.error(f"💥 System monitoring error: {str(e)}")
 
-    def _auto_scale_based_on_resources(self, resource_usage: Dict[str, float]):
-        """Auto-scale process pool based on resource usage"""
-        pool_stats = self.process_pool.get_pool_stats()
-        current_workers = pool_stats["active_workers"]
-
-        # Scale down if resources are constrained
-        if (resource_usage["cpu_percent"] > self.resource_thresholds["cpu_high"] or
-            resource_usage["memory_percent"] > self.resource_thresholds["memory_high"]):
-
-            if current_workers > self.process_pool.min_workers:
-                self.process_pool._scale_down(1)
-                logger.info(f"📉 Auto-scaled down due to high resource usage: CPU {resource_usage['cpu_percent']:.1f}%, Memory {resource_usage['memory_percent']:.1f}%")
-
-        # Scale up if resources are available and there's demand
-        elif (resource_usage["cpu_percent"] < 60 and
-              resource_usage["memory_percent"] < 70 and
-              pool_stats["queue_size"] > 2):
-
-            if current_workers < self.process_pool.max_workers:
-                self.process_pool._scale_up(1)
-                logger.info(f"📈 Auto-scaled up due to available resources and demand")
-
     def get_comprehensive_stats(self) -> Dict[str, Any]:
         """Get comprehensive system and process statistics"""
         return {
@@ -5415,6 +6229,12 @@ class EnhancedProcessManager:
             "cache": self.cache.get_stats(),
             "resource_usage": self.resource_monitor.get_current_usage(),
             "active_processes": len(self.process_registry),
+            "admission": admission_controller.get_stats(),
+            "coalescing": {
+                "in_flight_tasks": len(self.inflight_commands),
+                "coalesced_tasks": self.coalesced_count,
+                "commands": command_flights.get_stats()
+            },
             "performance_dashboard": self.performance_dashboard.get_summary(),
             "auto_scaling_enabled": self.auto_scaling_enabled,
             "resource_thresholds": self.resource_thresholds
@@ -5423,37 +6243,17 @@ class EnhancedProcessManager:
 class ResourceMonitor:
     """Advanced resource monitoring with historical tracking"""
 
-    def __init__(self, history_size=100):
-        self.history_size = history_size
-        self.usage_history = []
-        self.history_lock = threading.Lock()
+    USAGE_FIELDS = ("cpu_percent", "memory_percent", "memory_available_gb", "disk_percent", "disk_free_gb",
+                    "network_bytes_sent", "network_bytes_recv", "timestamp")
+
+    def __init__(self, sampler: ResourceSampler = None):
+        self.sampler = sampler or resource_sampler
 
     def get_current_usage(self) -> Dict[str, float]:
-        """Get current system resource usage"""
+        """Get current system resource usage from the latest background sample"""
         try:
-            cpu_percent = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
-            network = psutil.net_io_counters()
-
-            usage = {
-                "cpu_percent": cpu_percent,
-                "memory_percent": memory.percent,
-                "memory_available_gb": memory.available / (1024**3),
-                "disk_percent": disk.percent,
-                "disk_free_gb": disk.free / (1024**3),
-                "network_bytes_sent": network.bytes_sent,
-                "network_bytes_recv": network.bytes_recv,
-                "timestamp": time.time()
-            }
-
-            # Add to history
-            with self.history_lock:
-                self.usage_history.append(usage)
-                if len(self.usage_history) > self.history_size:
-                    self.usage_history.pop(0)
-
-            return usage
+            sample = self.sampler.latest()
+            return {field: sample[field] for field in self.USAGE_FIELDS}
 
         except Exception as e:
             logger.error(f"💥 Error getting resource usage: {str(e)}")
@@ -5484,21 +6284,21 @@ class ResourceMonitor:
 
     def get_usage_trends(self) -> Dict[str, Any]:
         """Get resource usage trends"""
-        with self.history_lock:
-            if len(self.usage_history) < 2:
-                return {}
+        history = self.sampler.history()
+        if len(history) < 2:
+            return {}
 
-            recent = self.usage_history[-10:]  # Last 10 measurements
+        recent = history[-10:]  # Last 10 measurements
 
-            cpu_trend = sum(u["cpu_percent"] for u in recent) / len(recent)
-            memory_trend = sum(u["memory_percent"] for u in recent) / len(recent)
+        cpu_trend = sum(u["cpu_percent"] for u in recent) / len(recent)
+        memory_trend = sum(u["memory_percent"] for u in recent) / len(recent)
 
-            return {
-                "cpu_avg_10": cpu_trend,
-                "memory_avg_10": memory_trend,
-                "measurements": len(self.usage_history),
-                "trend_period_minutes": len(recent) * 15 / 60  # 15 second intervals
-            }
+        return {
+            "cpu_avg_10": cpu_trend,
+            "memory_avg_10": memory_trend,
+            "measurements": len(history),
+            "trend_period_minutes": (recent[-1]["timestamp"] - recent[0]["timestamp"]) / 60
+        }
 
 class PerformanceDashboard:
     """Real-time performance monitoring dashboard"""
@@ -5560,10 +6360,10 @@ parameter_optimizer = ParameterOptimizer()
 enhanced_process_manager = EnhancedProcessManager()
 
 # Global CTF framework instances
-ctf_manager = CTFWorkflowManager()
-ctf_tools = CTFToolManager()
-ctf_automator = CTFChallengeAutomator()
-ctf_coordinator = CTFTeamCoordinator()
+ctf_manager = LazyInstance(CTFWorkflowManager)
+ctf_tools = LazyInstance(CTFToolManager)
+ctf_automator = LazyInstance(CTFChallengeAutomator)
+ctf_coordinator = LazyInstance(CTFTeamCoordinator)
 
 # ============================================================================
 # PROCESS MANAGEMENT FOR COMMAND TERMINATION (v5.0 ENHANCEMENT)
@@ -5592,23 +6392,37 @@ class ProcessManager:
             }
             logger.info(f"🆔 REGISTERED: Process {pid} - {command[:50]}...")
 
+    @staticmethod
+    def _apply_progress(pid, progress, last_output="", bytes_processed=0, progress_bar=None):
+        """Apply a progress update; caller must hold process_lock"""
+        if pid in active_processes:
+            active_processes[pid]["progress"] = progress
+            active_processes[pid]["last_output"] = last_output
+            active_processes[pid]["bytes_processed"] = bytes_processed
+            runtime = time.time() - active_processes[pid]["start_time"]
+
+            # Calculate ETA if progress > 0
+            eta = 0
+            if progress > 0:
+                eta = (runtime / progress) * (1.0 - progress)
+
+            active_processes[pid]["runtime"] = runtime
+            active_processes[pid]["eta"] = eta
+            if progress_bar is not None:
+                active_processes[pid]["progress_bar"] = progress_bar
+
     @staticmethod
     def update_process_progress(pid, progress, last_output="", bytes_processed=0):
         """Update process progress and stats"""
         with process_lock:
-            if pid in active_processes:
-                active_processes[pid]["progress"] = progress
-                active_processes[pid]["last_output"] = last_output
-                active_processes[pid]["bytes_processed"] = bytes_processed
-                runtime = time.time() - active_processes[pid]["start_time"]
-
-                # Calculate ETA if progress > 0
-                eta = 0
-                if progress > 0:
-                    eta = (runtime / progress) * (1.0 - progress)
+            ProcessManager._apply_progress(pid, progress, last_output, bytes_processed)
 
-                active_processes[pid]["runtime"] = runtime
-                active_processes[pid]["eta"] = eta
+    @staticmethod
+    def update_processes_progress(updates):
+        """Update progress for many processes in a single pass under process_lock"""
+        with process_lock:
+            for pid, update in updates.items():
+                ProcessManager._apply_progress(pid, **update)
 
     @staticmethod
     def terminate_process(pid):
@@ -5741,7 +6555,7 @@ class PythonEnvironmentManager:
         return str(env_path / "bin" / "python")
 
 # Global environment manager
-env_manager = PythonEnvironmentManager()
+env_manager = LazyInstance(PythonEnvironmentManager)
 
 # ============================================================================
 # ADVANCED VULNERABILITY INTELLIGENCE SYSTEM (v6.0 ENHANCEMENT)
@@ -6664,75 +7478,827 @@ DEBUG_MODE = os.environ.get("DEBUG_MODE", "0").lower() in ("1", "true", "yes", "
 COMMAND_TIMEOUT = 300  # 5 minutes default timeout
 CACHE_SIZE = 1000
 CACHE_TTL = 3600  # 1 hour
+CACHE_MAX_BYTES = int(os.environ.get("HEXSTRIKE_CACHE_BYTES", 256 * 1024 * 1024))  # In-memory result cache budget
+# Cache TTL policy: a tool's own TTL wins, then its category's, then CACHE_TTL
+CACHE_TTL_BY_CATEGORY = {
+    "tool_check": 7 * 24 * 3600,  # Tool availability
+    "passive_recon": 12 * 3600,
+    "dns": 6 * 3600,
+    "port_scan": 4 * 3600,
+    "web_discovery": 2 * 3600,
+    "vuln_scan": 30 * 60,
+}
+CACHE_TOOL_CATEGORIES = {
+    "which": "tool_check", "whereis": "tool_check",
+    "subfinder": "passive_recon", "amass": "passive_recon", "gau": "passive_recon",
+    "waybackurls": "passive_recon", "assetfinder": "passive_recon", "theharvester": "passive_recon",
+    "dig": "dns", "host": "dns", "nslookup": "dns", "dnsenum": "dns", "fierce": "dns", "dnsx": "dns",
+    "nmap": "port_scan", "masscan": "port_scan", "rustscan": "port_scan", "naabu": "port_scan",
+    "gobuster": "web_discovery", "ffuf": "web_discovery", "feroxbuster": "web_discovery",
+    "dirsearch": "web_discovery", "dirb": "web_discovery", "katana": "web_discovery",
+    "hakrawler": "web_discovery", "httpx": "web_discovery", "whatweb": "web_discovery",
+    "nuclei": "vuln_scan", "nikto": "vuln_scan", "sqlmap": "vuln_scan", "wpscan": "vuln_scan",
+    "dalfox": "vuln_scan", "jaeles": "vuln_scan",
+}
+CACHE_TTL_BY_TOOL = json.loads(os.environ.get("HEXSTRIKE_CACHE_TTLS", "{}"))  # e.g. '{"nuclei": 600}'
+# Stale-while-revalidate: how long past its TTL a result may still be served while it refreshes, by tool or category
+CACHE_STALE_WINDOWS = {
+    "passive_recon": 24 * 3600,
+}
+HEALTH_SNAPSHOT_INTERVAL = int(os.environ.get("HEXSTRIKE_HEALTH_INTERVAL", 30))  # Seconds between background health report rebuilds
+TOOL_REGISTRY_RECHECK = 2.0  # Minimum seconds between PATH directory mtime checks
+TOOL_VERSION_PROBES = os.environ.get("HEXSTRIKE_TOOL_VERSIONS", "0").lower() in ("1", "true", "yes")  # Probe --version in the background
+MAX_OUTPUT_BYTES = int(os.environ.get("HEXSTRIKE_MAX_OUTPUT_BYTES", 32 * 1024 * 1024))  # Per-stream cap, 0 = unlimited
+OUTPUT_READ_CHUNK = 64 * 1024  # Max bytes consumed per pipe read
+OUTPUT_STORE_DIR = os.environ.get("HEXSTRIKE_OUTPUT_DIR", "/tmp/hexstrike_outputs")
+OUTPUT_SPILL_THRESHOLD = int(os.environ.get("HEXSTRIKE_OUTPUT_SPILL_THRESHOLD", 1024 * 1024))  # Spill streams above 1 MiB
+OUTPUT_PREVIEW_BYTES = 64 * 1024  # Output kept inline once a stream has been spilled
+OUTPUT_RETENTION = int(os.environ.get("HEXSTRIKE_OUTPUT_RETENTION", 24 * 3600))  # Spool files kept for 24 hours
+OUTPUT_MAX_RANGE = 4 * 1024 * 1024  # Largest byte range served per request
+EXECUTOR_BACKEND = os.environ.get("HEXSTRIKE_EXECUTOR_BACKEND", "asyncio")  # "asyncio" or "thread"
+PROGRESS_TICK_INTERVAL = float(os.environ.get("HEXSTRIKE_PROGRESS_INTERVAL", 1.0))  # Seconds between progress updates
+PROGRESS_CONSUMER_TTL = 30  # Seconds a dashboard poll keeps progress bar rendering enabled
+STREAM_KEEPALIVE_INTERVAL = 15  # Seconds between SSE keepalive comments
+STREAM_QUEUE_SIZE = 10000  # Output lines buffered per streaming client before dropping
+LONG_POLL_MAX_WAIT = 60  # Longest ?wait= a task result request may block for
+BATCH_MAX_ITEMS = int(os.environ.get("HEXSTRIKE_BATCH_MAX_ITEMS", 500))  # Items accepted in one execute-batch request
+BATCH_DEFAULT_CONCURRENCY = 4  # Items of one batch in flight at once unless the request asks otherwise
+BATCH_MAX_CONCURRENCY = 32
+BATCH_HISTORY = 200  # Finished batches kept for status queries
+ANALYSIS_WORKERS = int(os.environ.get("HEXSTRIKE_ANALYSIS_WORKERS", min(8, os.cpu_count() or 1)))  # Analysis worker processes, 0 = run inline
+ANALYSIS_INLINE_BYTES = int(os.environ.get("HEXSTRIKE_ANALYSIS_INLINE_BYTES", 64 * 1024))  # Smaller inputs are not worth the IPC round trip
+ANALYSIS_TIMEOUT = float(os.environ.get("HEXSTRIKE_ANALYSIS_TIMEOUT", 60))  # Seconds an offloaded job may run before it fails
+DISK_CACHE_DIR = os.environ.get("HEXSTRIKE_CACHE_DIR", "")  # Persistent result cache directory, empty = memory only
+DISK_CACHE_MAX_BYTES = int(os.environ.get("HEXSTRIKE_CACHE_DISK_BYTES", 1024 * 1024 * 1024))  # Compressed bytes kept on disk
+SERVE_MODE = os.environ.get("HEXSTRIKE_SERVE_MODE", "dev")  # "dev" (Werkzeug), "waitress", "gunicorn" or "asgi"
+SERVE_WORKERS = int(os.environ.get("HEXSTRIKE_WORKERS", 1))  # Worker processes (gunicorn/asgi); state is per process
+SERVE_THREADS = int(os.environ.get("HEXSTRIKE_THREADS", 32))  # Request threads per worker (waitress/gunicorn)
+SERVE_KEEPALIVE = int(os.environ.get("HEXSTRIKE_KEEPALIVE", 5))  # Seconds an idle keep-alive connection stays open
+SERVE_DRAIN_TIMEOUT = float(os.environ.get("HEXSTRIKE_DRAIN_TIMEOUT", 60))  # Seconds to let in-flight tool runs finish on shutdown
+SERVE_UNIX_SOCKET = os.environ.get("HEXSTRIKE_UNIX_SOCKET", "")  # Bind a Unix socket instead of TCP when set
+ADMISSION_GLOBAL_SLOTS = int(os.environ.get("HEXSTRIKE_MAX_CONCURRENT", max(4, (os.cpu_count() or 2) * 2)))  # Total cost units running at once
+ADMISSION_TARGET_SLOTS = int(os.environ.get("HEXSTRIKE_MAX_PER_TARGET", 4))  # Concurrent commands against one host
+ADMISSION_MAX_WAIT = float(os.environ.get("HEXSTRIKE_ADMISSION_WAIT", 30))  # Seconds to queue before rejecting
+# Per-tool concurrency caps and cost weights, override with HEXSTRIKE_TOOL_LIMITS='{"nmap": {"max": 2}}'
+TOOL_ADMISSION_LIMITS = {
+    "masscan": {"max": 2, "cost": 4},
+    "rustscan": {"max": 2, "cost": 3},
+    "nmap": {"max": 4, "cost": 2},
+    "sqlmap": {"max": 4, "cost": 2},
+    "nuclei": {"max": 4, "cost": 2},
+    "hydra": {"max": 2, "cost": 3},
+    "medusa": {"max": 2, "cost": 3},
+    "hashcat": {"max": 1, "cost": 4},
+    "john": {"max": 2, "cost": 3},
+    "amass": {"max": 2, "cost": 2},
+    "ffuf": {"max": 4, "cost": 2},
+    "feroxbuster": {"max": 4, "cost": 2},
+    "gobuster": {"max": 4, "cost": 2},
+    "dirsearch": {"max": 4, "cost": 2},
+    "wpscan": {"max": 2, "cost": 2},
+    "nikto": {"max": 4, "cost": 2},
+}
+for _tool, _limits in json.loads(os.environ.get("HEXSTRIKE_TOOL_LIMITS", "{}")).items():
+    TOOL_ADMISSION_LIMITS.setdefault(_tool, {}).update(_limits)
+
+class AnalysisExecutor:
+    """Warm worker processes for CPU-bound pure-Python analysis, so it runs on all cores instead of under the request threads' GIL"""
+
+    HARD_TIMEOUT_GRACE = 5  # Extra seconds before a worker that ignored its deadline is given up on
+
+    def __init__(self, workers: int = ANALYSIS_WORKERS, inline_bytes: int = ANALYSIS_INLINE_BYTES,
+                 timeout: float = ANALYSIS_TIMEOUT):
+        self.workers = workers
+        self.inline_bytes = inline_bytes
+        self.timeout = timeout
+        self.executor = None
+        self.lock = threading.Lock()
+        # Launching waits for every worker to start, so it must not hold up stats and bookkeeping under self.lock
+        self.launch_lock = threading.Lock()
+        self.stats = {"offloaded": 0, "inline": 0, "fallbacks": 0, "timeouts": 0, "restarts": 0}
+        self.in_flight = 0
+
+    @property
+    def available(self) -> bool:
+        # Workers come from a forkserver: forking this process directly would copy locks held by its many threads
+        return self.workers > 0 and "forkserver" in multiprocessing.get_all_start_methods()
+
+    @staticmethod
+    def _detach_main():
+        """Stop multiprocessing from re-running the main script in every worker
+
+        Children are told to import __main__ again from its spec or file, which here would be this whole server
+        with its threads. The workers only need hexstrike_analysis, and a main spec named "__main__" is one
+        multiprocessing leaves alone. Set once; nothing else in the server reads the main module's spec.
+        """
+        main_module = sys.modules.get("__main__")
+        if main_module is not None and getattr(main_module.__spec__, "name", None) != "__main__":
+            main_module.__spec__ = importlib.machinery.ModuleSpec("__main__", None)
+
+    def _launch(self) -> ProcessPoolExecutor:
+        """Start every worker from the forkserver and wait until they are up"""
+        self._detach_main()
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(["hexstrike_analysis"])
+        # Each worker waits for the others in its initializer, so the pings below start all of them now
+        ready = context.Barrier(self.workers)
+        executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context,
+                                       initializer=hexstrike_analysis.worker_init, initargs=(ready,))
+        pings = [executor.submit(hexstrike_analysis.ping) for _ in range(self.workers)]
+        for ping in pings:
+            ping.result(timeout=60)
+        return executor
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        executor = self.executor
+        if executor is not None:
+            return executor
+        with self.launch_lock:
+            if self.executor is None:
+                self.executor = self._launch()
+            return self.executor
+
+    def _retire(self, executor: ProcessPoolExecutor):
+        """Send later jobs to a fresh pool; jobs already in the old one still finish there"""
+        with self.launch_lock:
+            if self.executor is not executor:
+                return
+            self.executor = None
+        self._count("restarts")
+        executor.shutdown(wait=False)
+
+    def start(self) -> bool:
+        """Start the workers now so the first heavy request does not pay for it"""
+        if not self.available:
+            return False
+        self._get_executor()
+        logger.info(f"🧮 Analysis workers ready: {self.workers} processes")
+        return True
+
+    def _count(self, key: str):
+        with self.lock:
+            self.stats[key] += 1
+
+    def run(self, func, *args, size: Optional[int] = None, **kwargs):
+        """Run func(*args, **kwargs) in a worker process, or inline when the input is small or workers are unavailable
+
+        Raises hexstrike_analysis.AnalysisTimeout when an offloaded job runs past the timeout.
+        """
+        if not self.available or (size is not None and size < self.inline_bytes):
+            self._count("inline")
+            return func(*args, **kwargs)
+
+        executor = self._get_executor()
+        with self.lock:
+            self.in_flight += 1
+            self.stats["offloaded"] += 1
+        try:
+            # The worker stops the job at the deadline itself and stays in the pool for the next one
+            future = executor.submit(hexstrike_analysis.run_with_deadline, self.timeout, func, *args, **kwargs)
+            return future.result(timeout=self.timeout + self.HARD_TIMEOUT_GRACE)
+        except BrokenProcessPool:
+            logger.warning(f"⚠️  Analysis worker died, running {func.__name__} inline")
+            self._retire(executor)
+            self._count("fallbacks")
+            return func(*args, **kwargs)
+        except hexstrike_analysis.AnalysisTimeout as e:
+            logger.warning(f"⏰ Analysis job timed out: {str(e)}")
+            self._count("timeouts")
+            raise
+        except FutureTimeoutError:
+            # The worker is stuck where its deadline cannot interrupt it; it keeps that slot until it returns
+            logger.warning(f"⏰ Analysis worker ignored the {self.timeout:g}s deadline for {func.__name__}, moving to a fresh pool")
+            self._count("timeouts")
+            self._retire(executor)
+            raise hexstrike_analysis.AnalysisTimeout(f"{func.__name__} did not finish within {self.timeout:g}s") from None
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                "available": self.available,
+                "started": self.executor is not None,
+                "workers": self.workers,
+                "inline_bytes": self.inline_bytes,
+                "timeout": self.timeout,
+                "in_flight": self.in_flight,
+                **self.stats
+            }
+
+# Global analysis executor
+analysis_executor = AnalysisExecutor()
+
+def run_analysis(func, *args, size: Optional[int] = None, **kwargs):
+    """Route a hexstrike_analysis function to the analysis workers; size is the input length used to skip tiny jobs"""
+    return analysis_executor.run(func, *args, size=size, **kwargs)
+
+class DiskCache:
+    """Persistent, compressed result cache tier backed by SQLite that survives restarts"""
+
+    def __init__(self, directory: str, max_bytes: int = DISK_CACHE_MAX_BYTES):
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, "results.sqlite3")
+        self.max_bytes = max_bytes
+        self.db_lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "writes": 0, "expired": 0, "pruned": 0}
+        self.db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+            "created_at REAL NOT NULL, expires_at REAL NOT NULL)"
+        )
+        columns = [row[1] for row in self.db.execute("PRAGMA table_info(entries)")]
+        if "target" not in columns:
+            self.db.execute("ALTER TABLE entries ADD COLUMN target TEXT")
+        if "fresh_until" not in columns:
+            self.db.execute("ALTER TABLE entries ADD COLUMN fresh_until REAL")
+        self.db.execute("CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at)")
+        self.db.execute("CREATE INDEX IF NOT EXISTS entries_target ON entries (target)")
+
+        # Start cleanup thread
+        self.cleanup_thread = threading.Thread(target=self._cleanup_expired, daemon=True)
+        self.cleanup_thread.start()
+        logger.info(f"💽 Persistent result cache: {self.path}")
+
+    def load(self, key: str):
+        """Return (value, created_at, fresh_until, expires_at) for a live entry, or None"""
+        with self.db_lock:
+            row = self.db.execute(
+                "SELECT value, expires_at, created_at, COALESCE(fresh_until, expires_at) FROM entries WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+            if row[1] <= time.time():
+                self.db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self.stats["expired"] += 1
+                self.stats["misses"] += 1
+                return None
+            self.stats["hits"] += 1
+
+        return json.loads(zlib.decompress(row[0])), row[2], row[3], row[1]
+
+    def store(self, key: str, value: Any, ttl: float, target: Optional[str] = None, stale_window: float = 0):
+        """Compress and persist a value with its TTL, stale window and the target it was produced for"""
+        blob = zlib.compress(json.dumps(value, default=str).encode(), 6)
+        now = time.time()
+        with self.db_lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, created_at, expires_at, target, fresh_until) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, blob, len(blob), now, now + ttl + stale_window, target, now + ttl)
+            )
+            self.stats["writes"] += 1
+
+    def delete_targets(self, matches) -> int:
+        """Remove every entry whose target satisfies matches(target)"""
+        with self.db_lock:
+            targets = [row[0] for row in self.db.execute("SELECT DISTINCT target FROM entries WHERE target IS NOT NULL")]
+            removed = 0
+            for target in filter(matches, targets):
+                removed += self.db.execute("DELETE FROM entries WHERE target = ?", (target,)).rowcount
+            return removed
+
+    def delete(self, key: str):
+        """Remove one entry"""
+        with self.db_lock:
+            self.db.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self, prefix: str = ""):
+        """Remove all entries, or only those whose key starts with prefix"""
+        with self.db_lock:
+            if prefix:
+                self.db.execute("DELETE FROM entries WHERE substr(key, 1, ?) = ?", (len(prefix), prefix))
+            else:
+                self.db.execute("DELETE FROM entries")
+
+    def _cleanup_expired(self):
+        """Drop expired entries and keep the store within its byte budget"""
+        while True:
+            try:
+                time.sleep(300)  # Cleanup every 5 minutes
+
+                with self.db_lock:
+                    expired = self.db.execute("DELETE FROM entries WHERE expires_at <= ?", (time.time(),)).rowcount
+                    total = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+                    pruned = 0
+                    if total > self.max_bytes:
+                        # Oldest entries go first
+                        for key, size in self.db.execute("SELECT key, size FROM entries ORDER BY created_at").fetchall():
+                            if total <= self.max_bytes:
+                                break
+                            self.db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                            total -= size
+                            pruned += 1
+                    self.stats["expired"] += expired
+                    self.stats["pruned"] += pruned
+
+                if expired or pruned:
+                    logger.debug(f"🧹 Disk cache cleanup: {expired} expired, {pruned} pruned")
+
+            except Exception as e:
+                logger.error(f"💥 Disk cache cleanup error: {str(e)}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get disk cache statistics"""
+        with self.db_lock:
+            entries, total = self.db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+            return {
+                "path": self.path,
+                "entries": entries,
+                "bytes": total,
+                "max_bytes": self.max_bytes,
+                **self.stats
+            }
+
+# Global persistent cache tier (disabled unless HEXSTRIKE_CACHE_DIR is set)
+disk_cache = DiskCache(DISK_CACHE_DIR) if DISK_CACHE_DIR else None
+
+class ShellTokenizer(shlex.shlex):
+    """POSIX shell word splitting that also tells unquoted operators apart from quoted words spelling the same"""
+
+    def __init__(self, command: str):
+        super().__init__(command, posix=True, punctuation_chars=True)
+        self.whitespace_split = True
+        self.commenters = ""
+        self.operator = False
+        self.io_number = False
+
+    def read_token(self):
+        # Only a token starting with an unquoted punctuation character is lexed as an operator
+        if self._pushback_chars:
+            nextchar = self._pushback_chars[-1]
+        else:
+            position = self.instream.tell()
+            nextchar = self.instream.read().lstrip(self.whitespace)[:1]
+            self.instream.seek(position)
+        self.operator = bool(nextchar) and nextchar in self.punctuation_chars
+        token = super().read_token()
+        # A file descriptor number written right against a redirection (2>&1) belongs to the operator
+        self.io_number = (nextchar.isdigit() and bool(token) and token.isdigit()
+                          and bool(self._pushback_chars) and self._pushback_chars[-1] in "<>")
+        return token
+
+    @classmethod
+    def tokens(cls, command: str) -> List[Tuple[str, bool]]:
+        """(token, is_operator) pairs; raises ValueError on unbalanced quotes"""
+        lexer = cls(command)
+        result = []
+        io_number = ""
+        while True:
+            token = lexer.get_token()
+            if token is None:
+                return result
+            if lexer.io_number:
+                io_number = token
+                continue
+            result.append((io_number + token, lexer.operator))
+            io_number = ""
 
 class HexStrikeCache:
-    """Advanced caching system for command results"""
+    """Thread-safe command result cache shared by every execution path, with an optional disk tier"""
 
-    def __init__(self, max_size: int = CACHE_SIZE, ttl: int = CACHE_TTL):
-        self.cache = OrderedDict()
-        self.max_size = max_size
+    # Tools whose flags may be given in any order without changing the result
+    ORDER_INSENSITIVE_TOOLS = {
+        "nmap", "masscan", "rustscan", "nuclei", "gobuster", "ffuf", "feroxbuster", "dirsearch", "dirb",
+        "sqlmap", "nikto", "wpscan", "whatweb", "wafw00f", "subfinder", "amass", "httpx", "katana",
+        "hakrawler", "dalfox", "arjun", "paramspider", "gau", "waybackurls", "dnsenum", "fierce"
+    }
+    # Tools taking their target as a trailing positional argument rather than a flag value
+    POSITIONAL_TARGET_TOOLS = {"nmap", "masscan", "whatweb", "wafw00f"}
+    NUMBER_PATTERN = re.compile(r'^-\d+(\.\d+)?$')
+    SAME_BINARY_CACHE = 1024  # Path-qualified argv[0] values remembered by _canonical_tool
+    _same_binary = {}  # argv[0] -> (path its name resolves to, whether both are the same file)
+
+    def __init__(self, max_size: int = CACHE_SIZE, ttl: int = CACHE_TTL, max_bytes: int = CACHE_MAX_BYTES):
         self.ttl = ttl
-        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self.memory = AdvancedCache(max_size=max_size, default_ttl=ttl, max_bytes=max_bytes)
+        self.stats_lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "disk_hits": 0, "stale_hits": 0, "revalidations": 0}
+        self.revalidating = set()
+        # Secondary index from scan target to the cache keys holding its results
+        self.index_lock = threading.Lock()
+        self.target_keys = {}
+        self.key_targets = {}
+
+    @classmethod
+    def canonical_command(cls, command: str) -> str:
+        """Normalize a command line: whitespace and quoting, tool path, and flag order where the tool allows it"""
+        try:
+            tokens = ShellTokenizer.tokens(command)
+        except ValueError:
+            return " ".join(command.split())
+        if not tokens:
+            return ""
+
+        if not tokens[0][1]:
+            tokens[0] = (cls._canonical_tool(tokens[0][0]), False)
+
+        # Operators stay bare and words are quoted, so a quoted "|" never shares a key with a pipe
+        if any(operator for _, operator in tokens):
+            return " ".join(token if operator else shlex.quote(token) for token, operator in tokens)
+
+        tool = tokens[0][0]
+        tool_name = os.path.basename(tool)
+        args = [token for token, _ in tokens[1:]]
+        if tool_name in cls.ORDER_INSENSITIVE_TOOLS:
+            # A trailing target is positional, not the value of the flag before it
+            trailing = []
+            if tool_name in cls.POSITIONAL_TARGET_TOOLS and len(args) > 1 and AdmissionController._extract_host(args[-1]):
+                trailing = args[-1:]
+                args = args[:-1]
+
+            # Each flag keeps the values that follow it; the flag groups are then sorted
+            leading, groups = [], []
+            for arg in args:
+                if arg.startswith("-") and len(arg) > 1 and not cls.NUMBER_PATTERN.match(arg):
+                    groups.append([arg])
+                elif groups:
+                    groups[-1].append(arg)
+                else:
+                    leading.append(arg)
+            args = leading + [arg for group in sorted(groups) for arg in group] + trailing
+
+        return " ".join(shlex.quote(arg) for arg in [tool] + args)
+
+    @classmethod
+    def _canonical_tool(cls, path: str) -> str:
+        """Shorten argv[0] to its name only when that name runs the same binary"""
+        name = os.path.basename(path)
+        if name == path:
+            return name
+        resolved = tool_registry.which(name)
+        if not resolved:
+            return path
+
+        # Remembered per argv[0] and rechecked only when PATH resolves the name elsewhere
+        same = cls._same_binary.get(path)
+        if same is None or same[0] != resolved:
+            same = (resolved, os.path.realpath(resolved) == os.path.realpath(path))
+            if len(cls._same_binary) >= cls.SAME_BINARY_CACHE:
+                cls._same_binary.clear()
+            cls._same_binary[path] = same
+        return name if same[1] else path
+
+    def key(self, command: str) -> str:
+        """Stable digest of the canonical command, identical across processes and restarts"""
+        return hashlib.sha256(self.canonical_command(command).encode()).hexdigest()
+
+    def ttl_for(self, command: str) -> int:
+        """TTL from the policy table: tool override, then tool category, then the default"""
+        tool, _ = AdmissionController.describe(command)
+        if tool in CACHE_TTL_BY_TOOL:
+            return CACHE_TTL_BY_TOOL[tool]
+        category = CACHE_TOOL_CATEGORIES.get(tool)
+        return CACHE_TTL_BY_CATEGORY.get(category, self.ttl)
+
+    def stale_window_for(self, command: str) -> int:
+        """How long past its TTL a result may be served stale while it is refreshed"""
+        tool, _ = AdmissionController.describe(command)
+        if tool in CACHE_STALE_WINDOWS:
+            return CACHE_STALE_WINDOWS[tool]
+        return CACHE_STALE_WINDOWS.get(CACHE_TOOL_CATEGORIES.get(tool), 0)
+
+    def _index(self, key: str, target: Optional[str]):
+        """Record which target a cache key belongs to"""
+        if not target:
+            return
+        with self.index_lock:
+            self.target_keys.setdefault(target, set()).add(key)
+            self.key_targets[key] = target
+
+            # Forget keys the memory tier has evicted once the index outgrows it
+            if len(self.key_targets) > 2 * self.memory.max_size:
+                for stale_key in [k for k in self.key_targets if k not in self.memory]:
+                    self._unindex(stale_key)
+
+    def _unindex(self, key: str):
+        """Drop a key from the target index (index lock held)"""
+        target = self.key_targets.pop(key, None)
+        if target is not None:
+            keys = self.target_keys.get(target)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.target_keys[target]
 
-    def _generate_key(self, command: str, params: Dict[str, Any]) -> str:
-        """Generate cache key from command and parameters"""
-        key_data = f"{command}:{json.dumps(params, sort_keys=True)}"
-        return hashlib.md5(key_data.encode()).hexdigest()
+    @staticmethod
+    def _target_matcher(spec: str):
+        """Build a predicate matching cached targets against a host, domain or CIDR"""
+        spec = spec.strip().lower()
+        if "://" in spec:
+            spec = urllib.parse.urlparse(spec).hostname or ""
+        if not spec:
+            raise ValueError("Target must be a host, domain or CIDR")
 
-    def _is_expired(self, timestamp: float) -> bool:
-        """Check if cache entry is expired"""
-        return time.time() - timestamp > self.ttl
+        try:
+            network = ipaddress.ip_network(spec, strict=False)
+        except ValueError:
+            # Domains match themselves and every subdomain
+            return lambda target: target == spec or target.endswith("." + spec)
 
-    def get(self, command: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Get cached result if available and not expired"""
-        key = self._generate_key(command, params)
+        def matches(target: str) -> bool:
+            try:
+                return ipaddress.ip_network(target, strict=False).overlaps(network)
+            except ValueError:
+                return False
+        return matches
+
+    def invalidate_target(self, spec: str) -> Dict[str, Any]:
+        """Remove every cached result for a host, domain or CIDR from both tiers"""
+        matches = self._target_matcher(spec)
+
+        with self.index_lock:
+            targets = [target for target in self.target_keys if matches(target)]
+            keys = set()
+            for target in targets:
+                keys.update(self.target_keys[target])
+            for key in keys:
+                self._unindex(key)
+
+        memory_removed = sum(1 for key in keys if self.memory.delete(key))
+        disk_removed = disk_cache.delete_targets(matches) if disk_cache else 0
+        return {
+            "targets": sorted(targets),
+            "memory_entries_removed": memory_removed,
+            "disk_entries_removed": disk_removed
+        }
 
-        if key in self.cache:
-            timestamp, data = self.cache[key]
-            if not self._is_expired(timestamp):
-                # Move to end (most recently used)
-                self.cache.move_to_end(key)
-                self.stats["hits"] += 1
-                logger.info(f"💾 Cache HIT for command: {command}")
-                return data
-            else:
-                # Remove expired entry
-                del self.cache[key]
+    def _count(self, stat: str):
+        with self.stats_lock:
+            self.stats[stat] += 1
 
-        self.stats["misses"] += 1
-        logger.info(f"🔍 Cache MISS for command: {command}")
-        return None
+    def get(self, command: str) -> Optional[Dict[str, Any]]:
+        """Get a cached result from memory, falling back to the persistent tier
 
-    def set(self, command: str, params: Dict[str, Any], result: Dict[str, Any]):
-        """Store result in cache"""
-        key = self._generate_key(command, params)
+        Results past their TTL but inside their stale window are returned marked stale,
+        and a background refresh is queued.
+        """
+        key = self.key(command)
+
+        # Memory entries are (result, stored_at, fresh_until)
+        entry = self.memory.get(key)
+        tier = "💾 Cache"
+        if entry is None and disk_cache:
+            row = disk_cache.load(f"cmd:{key}")
+            if row:
+                data, stored_at, fresh_until, expires_at = row
+                entry = (data, stored_at, fresh_until)
+                # Warm memory with the remaining lifetime
+                self.memory.set(key, entry, max(1, expires_at - time.time()))
+                self._retain_output(key, data, expires_at)
+                self._index(key, AdmissionController.describe(command)[1])
+                self._count("disk_hits")
+                tier = "💽 Disk cache"
+
+        if entry is None:
+            self._count("misses")
+            logger.info(f"🔍 Cache MISS for command: {command}")
+            return None
+
+        data, stored_at, fresh_until = entry
+        self._count("hits")
+        now = time.time()
+        if now < fresh_until:
+            logger.info(f"{tier} HIT for command: {command}")
+            return data
+
+        age = now - stored_at
+        self._count("stale_hits")
+        logger.info(f"{tier} STALE HIT ({age:.0f}s old) for command: {command}")
+        self._revalidate(command, key)
+        return {**data, "stale": True, "age": age}
+
+    def _revalidate(self, command: str, key: str):
+        """Queue a background refresh of a stale entry through the process pool"""
+        with self.stats_lock:
+            if key in self.revalidating:
+                return
+            self.revalidating.add(key)
+            self.stats["revalidations"] += 1
+
+        def refresh():
+            try:
+                return _execute_and_cache(command)
+            finally:
+                with self.stats_lock:
+                    self.revalidating.discard(key)
 
-        # Remove oldest entries if cache is full
-        while len(self.cache) >= self.max_size:
-            oldest_key = next(iter(self.cache))
-            del self.cache[oldest_key]
-            self.stats["evictions"] += 1
+        try:
+            enhanced_process_manager.process_pool.submit_task(
+                f"revalidate_{int(time.time() * 1000)}_{key[:8]}", refresh, priority="background"
+            )
+            logger.info(f"♻️  Revalidating in background: {command[:80]}")
+        except Exception as e:
+            with self.stats_lock:
+                self.revalidating.discard(key)
+            logger.error(f"💥 Could not queue cache revalidation: {str(e)}")
 
-        self.cache[key] = (time.time(), result)
-        logger.info(f"💾 Cached result for command: {command}")
+    @staticmethod
+    def _retain_output(key: str, result: Any, until: float):
+        """Keep a cached result's spilled output on disk for as long as the entry may be served"""
+        output_id = result.get("output_id") if isinstance(result, dict) else None
+        if output_id:
+            output_store.retain(output_id, f"cache:{key}", until)
+
+    def set(self, command: str, result: Dict[str, Any], ttl: Optional[int] = None):
+        """Store result in cache"""
+        key = self.key(command)
+        ttl = ttl if ttl is not None else self.ttl_for(command)
+        stale_window = self.stale_window_for(command)
+        target = AdmissionController.describe(command)[1]
+        now = time.time()
+        self.memory.set(key, (result, now, now + ttl), ttl + stale_window)
+        self._index(key, target)
+        self._retain_output(key, result, now + ttl + stale_window)
+        if disk_cache:
+            disk_cache.store(f"cmd:{key}", result, ttl, target, stale_window)
+        logger.info(f"💾 Cached result for command: {command} (TTL {ttl}s)")
+
+    def delete(self, command: str) -> bool:
+        """Remove a command's cached result from both tiers"""
+        key = self.key(command)
+        with self.index_lock:
+            self._unindex(key)
+        if disk_cache:
+            disk_cache.delete(f"cmd:{key}")
+        return self.memory.delete(key)
+
+    def clear(self):
+        """Clear both tiers and reset statistics"""
+        self.memory.clear()
+        with self.index_lock:
+            self.target_keys.clear()
+            self.key_targets.clear()
+        if disk_cache:
+            disk_cache.clear("cmd:")
+        with self.stats_lock:
+            self.stats = {"hits": 0, "misses": 0, "disk_hits": 0, "stale_hits": 0, "revalidations": 0}
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
-        total_requests = self.stats["hits"] + self.stats["misses"]
-        hit_rate = (self.stats["hits"] / total_requests * 100) if total_requests > 0 else 0
+        memory_stats = self.memory.get_stats()
+        with self.stats_lock:
+            stats = dict(self.stats)
+        total_requests = stats["hits"] + stats["misses"]
 
         return {
-            "size": len(self.cache),
-            "max_size": self.max_size,
-            "hit_rate": f"{hit_rate:.1f}%",
-            "hits": self.stats["hits"],
-            "misses": self.stats["misses"],
-            "evictions": self.stats["evictions"]
+            "size": memory_stats["size"],
+            "max_size": memory_stats["max_size"],
+            "bytes": memory_stats["bytes"],
+            "max_bytes": memory_stats["max_bytes"],
+            "hit_rate": (stats["hits"] / total_requests * 100) if total_requests > 0 else 0,
+            "hits": stats["hits"],
+            "misses": stats["misses"],
+            "disk_hits": stats["disk_hits"],
+            "stale_hits": stats["stale_hits"],
+            "revalidations": stats["revalidations"],
+            "evictions": memory_stats["eviction_count"],
+            "evicted_bytes": memory_stats["evicted_bytes"],
+            "expired": memory_stats["expired_count"],
+            "utilization": memory_stats["utilization"],
+            "byte_utilization": memory_stats["byte_utilization"],
+            "indexed_targets": len(self.target_keys),
+            "disk": disk_cache.get_stats() if disk_cache else None
         }
 
 # Global cache instance
 cache = HexStrikeCache()
 
+class ToolRegistry:
+    """In-process tool availability lookup over cached PATH directory listings"""
+
+    def __init__(self, recheck_interval: float = TOOL_REGISTRY_RECHECK, probe_versions: bool = TOOL_VERSION_PROBES):
+        self.recheck_interval = recheck_interval
+        self.probe_versions = probe_versions
+        self.registry_lock = threading.Lock()
+        self.path = None
+        self.dir_listings = {}  # directory -> (mtime_ns, {name: full path})
+        self.executables = {}  # name -> full path of the first match on PATH
+        self.checked_at = 0.0
+        self.scans = 0
+        self.versions = {}  # tool -> (path, version line)
+        self.probe_queue = queue.Queue()
+        self.probe_thread = None
+
+    @staticmethod
+    def _list_directory(directory: str) -> Dict[str, str]:
+        """Executable files in one PATH directory"""
+        found = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file() and os.access(entry.path, os.X_OK):
+                            found[entry.name] = entry.path
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return found
+
+    def _refresh(self):
+        """Rescan PATH directories whose mtime changed since the last scan (lock held)"""
+        now = time.time()
+        path = os.environ.get("PATH", os.defpath)
+        if path == self.path and now - self.checked_at < self.recheck_interval:
+            return
+        self.checked_at = now
+
+        directories = list(dict.fromkeys(d for d in path.split(os.pathsep) if d))
+        changed = path != self.path
+        listings = {}
+        for directory in directories:
+            try:
+                mtime = os.stat(directory).st_mtime_ns
+            except OSError:
+                mtime = None
+            cached = self.dir_listings.get(directory)
+            if cached and cached[0] == mtime:
+                listings[directory] = cached
+            else:
+                listings[directory] = (mtime, self._list_directory(directory) if mtime is not None else {})
+                changed = True
+
+        if not changed:
+            return
+
+        # Earlier PATH entries win, like shutil.which
+        executables = {}
+        for directory in reversed(directories):
+            executables.update(listings[directory][1])
+        self.path = path
+        self.dir_listings = listings
+        self.executables = executables
+        self.scans += 1
+        logger.debug(f"🔎 Tool registry rescanned PATH: {len(executables)} executables")
+
+    def which(self, tool: str) -> Optional[str]:
+        """Full path of a tool, or None if it is not installed"""
+        if os.sep in tool:
+            return tool if os.path.isfile(tool) and os.access(tool, os.X_OK) else None
+        with self.registry_lock:
+            self._refresh()
+            return self.executables.get(tool)
+
+    def status(self, tools) -> Dict[str, bool]:
+        """Availability of many tools with a single PATH check"""
+        with self.registry_lock:
+            self._refresh()
+            status = {tool: tool in self.executables for tool in tools}
+        if self.probe_versions:
+            self._queue_version_probes([tool for tool, available in status.items() if available])
+        return status
+
+    def _queue_version_probes(self, tools):
+        """Probe versions of tools not yet probed at their current path"""
+        for tool in tools:
+            path = self.which(tool)
+            probed = self.versions.get(tool)
+            if path and (probed is None or probed[0] != path):
+                self.versions[tool] = (path, None)
+                self.probe_queue.put((tool, path))
+        if self.probe_thread is None and not self.probe_queue.empty():
+            self.probe_thread = threading.Thread(target=self._probe_versions, daemon=True, name="hexstrike-tool-versions")
+            self.probe_thread.start()
+
+    def _probe_versions(self):
+        """Run '<tool> --version' one tool at a time in the background"""
+        while True:
+            tool, path = self.probe_queue.get()
+            try:
+                completed = subprocess.run(
+                    [path, "--version"], stdin=subprocess.DEVNULL, capture_output=True, text=True,
+                    errors="replace", timeout=5
+                )
+                output = (completed.stdout or completed.stderr).strip()
+                version = output.splitlines()[0][:200] if output else ""
+            except Exception as e:
+                version = f"unknown ({type(e).__name__})"
+            self.versions[tool] = (path, version)
+
+    def get_versions(self) -> Dict[str, Optional[str]]:
+        """Probed version strings, None while a probe is pending"""
+        return {tool: version for tool, (_, version) in sorted(self.versions.items())}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get registry statistics"""
+        with self.registry_lock:
+            return {
+                "path_directories": len(self.dir_listings),
+                "executables": len(self.executables),
+                "scans": self.scans,
+                "version_probes": self.probe_versions
+            }
+
+# Global tool registry
+tool_registry = ToolRegistry()
+
 class TelemetryCollector:
     """Collect and manage system telemetry"""
 
@@ -6756,11 +8322,12 @@ class TelemetryCollector:
 
     def get_system_metrics(self) -> Dict[str, Any]:
         """Get current system metrics"""
+        sample = resource_sampler.latest()
         return {
-            "cpu_percent": psutil.cpu_percent(interval=1),
-            "memory_percent": psutil.virtual_memory().percent,
-            "disk_usage": psutil.disk_usage('/').percent,
-            "network_io": psutil.net_io_counters()._asdict() if psutil.net_io_counters() else {}
+            "cpu_percent": sample["cpu_percent"],
+            "memory_percent": sample["memory_percent"],
+            "disk_usage": sample["disk_percent"],
+            "network_io": sample["network_io"]
         }
 
     def get_stats(self) -> Dict[str, Any]:
@@ -6780,15 +8347,847 @@ class TelemetryCollector:
 # Global telemetry collector
 telemetry = TelemetryCollector()
 
+class OutputBuffer:
+    """Chunked byte buffer for subprocess output with an optional head/tail byte cap"""
+
+    def __init__(self, max_bytes: int = 0, spool_path: Optional[Path] = None, spill_threshold: int = 0):
+        self.spool_path = spool_path
+        self.spill_threshold = spill_threshold
+        self.spool = None
+        self.closed = False
+        # Reader threads can still be appending when the executor closes the buffer
+        self.lock = threading.Lock()
+        self._reset(max_bytes)
+
+    def _reset(self, max_bytes: int):
+        """Empty the in-memory buffer and apply a new byte cap"""
+        self.max_bytes = max(0, max_bytes)
+        self.head_limit = self.max_bytes // 2
+        self.tail_limit = self.max_bytes - self.head_limit
+        self.head = bytearray()
+        self.tail = deque()
+        self.tail_size = 0
+        self.total_bytes = 0
+
+    @property
+    def spilled(self) -> bool:
+        """Whether the full output is being written to a spool file"""
+        return self.spool is not None
+
+    def _start_spool(self):
+        """Move the output to the spool file and keep only a preview in memory"""
+        existing = self.getvalue()
+        self.spool = open(self.spool_path, "wb")
+        self._reset(min(self.max_bytes or OUTPUT_PREVIEW_BYTES, OUTPUT_PREVIEW_BYTES))
+        # Re-appending writes the existing output to the spool and rebuilds the preview
+        if existing:
+            self._append(existing)
+
+    def close(self):
+        """Flush and close the spool file, if any; later appends are dropped"""
+        with self.lock:
+            self.closed = True
+            if self.spool is not None and not self.spool.closed:
+                self.spool.close()
+
+    @property
+    def truncated(self) -> bool:
+        """Whether any output was dropped because of the byte cap"""
+        return self.max_bytes > 0 and self.total_bytes > self.max_bytes
+
+    def append(self, data: bytes):
+        """Append a chunk of raw output"""
+        if not data:
+            return
+        with self.lock:
+            # Output from a straggler that outlived the command must not reopen or write a finished spool
+            if not self.closed:
+                self._append(data)
+
+    def _append(self, data: bytes):
+        """Caller must hold self.lock"""
+        if self.spool_path is not None and self.spool is None:
+            # Spill before the cap would drop anything so the spool file is complete
+            limit = min(self.spill_threshold, self.max_bytes) if self.max_bytes else self.spill_threshold
+            if self.total_bytes + len(data) > limit:
+                self._start_spool()
+        if self.spool is not None:
+            self.spool.write(data)
+
+        self.total_bytes += len(data)
+
+        if self.max_bytes == 0:
+            self.tail.append(data)
+            self.tail_size += len(data)
+            return
+
+        # Fill the head first so the start of the output is always kept
+        if len(self.head) < self.head_limit:
+            room = self.head_limit - len(self.head)
+            self.head += data[:room]
+            data = data[room:]
+            if not data:
+                return
+
+        self.tail.append(data)
+        self.tail_size += len(data)
+
+        # Drop whole chunks from the front of the tail once it is over budget
+        while self.tail and self.tail_size - len(self.tail[0]) >= self.tail_limit:
+            self.tail_size -= len(self.tail.popleft())
+
+    def getvalue(self) -> bytes:
+        """Join the buffered chunks, inserting a marker where output was dropped"""
+        tail = b"".join(self.tail)
+        if not self.truncated:
+            return bytes(self.head) + tail
+
+        tail = tail[-self.tail_limit:] if self.tail_limit else b""
+        omitted = self.total_bytes - len(self.head) - len(tail)
+        marker = f"\n... [{omitted} bytes truncated, output cap {self.max_bytes} bytes] ...\n".encode()
+        return bytes(self.head) + marker + tail
+
+    def decode(self, encoding: str = "utf-8") -> str:
+        """Decode the buffered output once, replacing invalid byte sequences"""
+        return self.getvalue().decode(encoding, errors="replace")
+
+class OutputStore:
+    """Spill-to-disk store for large command output, served back as mmap'd byte ranges"""
+
+    STREAMS = ("stdout", "stderr")
+
+    def __init__(self, base_dir: str = OUTPUT_STORE_DIR, spill_threshold: int = OUTPUT_SPILL_THRESHOLD,
+                 retention: int = OUTPUT_RETENTION):
+        self.base_dir = Path(base_dir)
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.spill_threshold = spill_threshold
+        self.retention = retention
+        self.references = {}  # output_id -> {holder: expires_at} for cached results and task records pointing at a spool
+        self.reference_lock = threading.Lock()
+
+        # Start cleanup thread
+        self.cleanup_thread = threading.Thread(target=self._cleanup_expired, daemon=True)
+        self.cleanup_thread.start()
+
+    def new_id(self) -> str:
+        """Allocate an id for a command's output"""
+        return uuid.uuid4().hex
+
+    def _path(self, output_id: str, stream: str) -> Path:
+        """Resolve the spool file for an output stream, rejecting malformed ids"""
+        if stream not in self.STREAMS or not re.fullmatch(r"[0-9a-f]{32}", output_id or ""):
+            raise ValueError(f"Invalid output reference: {output_id}/{stream}")
+        return self.base_dir / f"{output_id}.{stream}"
+
+    def create_buffer(self, output_id: str, stream: str, max_bytes: int = MAX_OUTPUT_BYTES) -> OutputBuffer:
+        """Create an output buffer that spills to this store above the threshold"""
+        return OutputBuffer(max_bytes, spool_path=self._path(output_id, stream), spill_threshold=self.spill_threshold)
+
+    def write(self, output_id: str, stream: str, data: bytes):
+        """Write a complete stream to the store"""
+        with open(self._path(output_id, stream), "wb") as f:
+            f.write(data)
+
+    def store_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Spill the stdout/stderr of an already-built result dict if it is large"""
+        encoded = {stream: (result.get(stream) or "").encode(errors="replace") for stream in self.STREAMS}
+        if max(len(data) for data in encoded.values()) <= self.spill_threshold:
+            return result
+
+        output_id = self.new_id()
+        spilled = dict(result)
+        for stream, data in encoded.items():
+            self.write(output_id, stream, data)
+            if len(data) > OUTPUT_PREVIEW_BYTES:
+                preview = OutputBuffer(OUTPUT_PREVIEW_BYTES)
+                preview.append(data)
+                spilled[stream] = preview.decode()
+            spilled[f"{stream}_bytes"] = len(data)
+
+        spilled["output_id"] = output_id
+        spilled["output_spilled"] = True
+        logger.info(f"💽 Spilled {sum(len(d) for d in encoded.values())} bytes of output to store: {output_id}")
+        return spilled
+
+    def read_range(self, output_id: str, stream: str, offset: int = 0, length: int = OUTPUT_PREVIEW_BYTES) -> Optional[Dict[str, Any]]:
+        """Read a byte range of a stored stream, or None if it does not exist"""
+        path = self._path(output_id, stream)
+        if not path.exists():
+            return None
+
+        offset = max(0, offset)
+        length = max(0, min(length, OUTPUT_MAX_RANGE))
+        with open(path, "rb") as f:
+            total_size = os.fstat(f.fileno()).st_size
+            if total_size == 0 or offset >= total_size:
+                data = b""
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    data = mapped[offset:offset + length]
+
+        next_offset = offset + len(data)
+        return {
+            "data": data,
+            "offset": offset,
+            "length": len(data),
+            "total_size": total_size,
+            "next_offset": next_offset,
+            "eof": next_offset >= total_size
+        }
+
+    def retain(self, output_id: str, holder: str, until: float):
+        """Record that a cached result or task record points at a spool until the given time"""
+        with self.reference_lock:
+            holders = self.references.setdefault(output_id, {})
+            holders[holder] = max(holders.get(holder, 0.0), until)
+        # Push the spool's mtime forward so the retention sweep keeps it that long, also after a restart
+        keep_from = until - self.retention
+        for stream in self.STREAMS:
+            path = self._path(output_id, stream)
+            try:
+                if path.stat().st_mtime < keep_from:
+                    os.utime(path, (keep_from, keep_from))
+            except FileNotFoundError:
+                pass
+
+    def _referenced(self, output_id: str) -> bool:
+        """Whether any holder still points at the spool (reference lock held)"""
+        now = time.time()
+        holders = self.references.get(output_id)
+        if holders:
+            for holder, until in list(holders.items()):
+                if until <= now:
+                    del holders[holder]
+        if not holders:
+            self.references.pop(output_id, None)
+            return False
+        return True
+
+    def release(self, output_id: str, holder: str) -> bool:
+        """Drop one holder's reference and delete the spool once nothing else points at it"""
+        with self.reference_lock:
+            self.references.get(output_id, {}).pop(holder, None)
+            if self._referenced(output_id):
+                return False
+        return self.delete(output_id)
+
+    def delete(self, output_id: str) -> bool:
+        """Delete all stored streams for an output id"""
+        deleted = False
+        for stream in self.STREAMS:
+            path = self._path(output_id, stream)
+            if path.exists():
+                path.unlink()
+                deleted = True
+        return deleted
+
+    def _cleanup_expired(self):
+        """Remove spool files older than the retention period"""
+        while True:
+            try:
+                time.sleep(300)  # Cleanup every 5 minutes
+                cutoff = time.time() - self.retention
+                removed = 0
+                for path in self.base_dir.iterdir():
+                    if path.is_file() and path.stat().st_mtime < cutoff:
+                        with self.reference_lock:
+                            if self._referenced(path.name.split(".")[0]):
+                                continue
+                        path.unlink()
+                        removed += 1
+
+                if removed:
+                    logger.debug(f"🧹 Removed {removed} expired output spool files")
+
+            except Exception as e:
+                logger.error(f"💥 Output store cleanup error: {str(e)}")
+
+# Global output store
+output_store = OutputStore()
+
+class CommandStream:
+    """Forwards command output lines and the final result of a request as Server-Sent Events"""
+
+    _local = threading.local()
+
+    def __init__(self):
+        self.events = queue.Queue(maxsize=STREAM_QUEUE_SIZE)
+        self.started_at = time.time()
+        self.lines_streamed = 0
+        self.lines_dropped = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cancelled = False
+        self.pids = []
+        self.flights = []
+        self.cancel_lock = threading.Lock()
+
+    @classmethod
+    def current(cls) -> Optional["CommandStream"]:
+        """Stream bound to the calling thread, if the request asked for streaming"""
+        return getattr(cls._local, "stream", None)
+
+    @classmethod
+    def bind(cls, stream: Optional["CommandStream"]):
+        """Bind a stream to the calling thread"""
+        cls._local.stream = stream
+
+    def emit_line(self, stream_name: str, line: str):
+        """Queue an output line without ever blocking the pipe reader"""
+        try:
+            self.events.put_nowait(("output", {"stream": stream_name, "line": line}))
+            self.lines_streamed += 1
+        except queue.Full:
+            self.lines_dropped += 1
+
+    def record_cache(self, hit: bool):
+        """Record whether a command executed by this request was served from cache"""
+        if hit:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+
+    def attach(self, pid: int):
+        """Record a process started for this request; one started after the client left is stopped at once"""
+        with self.cancel_lock:
+            self.pids.append(pid)
+            cancelled = self.cancelled
+        if cancelled:
+            ProcessManager.terminate_process(pid)
+
+    def joined(self, flight: "CommandFlight"):
+        """Record a shared execution this request subscribed to"""
+        with self.cancel_lock:
+            self.flights.append(flight)
+            cancelled = self.cancelled
+        if cancelled:
+            flight.leave(self)
+
+    def cancel(self):
+        """Stop the commands of a request whose client disconnected before the result was sent"""
+        with self.cancel_lock:
+            if self.cancelled:
+                return
+            self.cancelled = True
+            pids, flights = list(self.pids), list(self.flights)
+        for flight in flights:
+            flight.leave(self)
+        for pid in pids:
+            ProcessManager.terminate_process(pid)
+
+    def finish(self, status_code: int, payload: Any):
+        """Queue the final result trailer"""
+        if self.cancelled:
+            # Nobody reads the queue anymore, and a full one would block the request thread forever
+            return
+        self.events.put(("result", {
+            "status_code": status_code,
+            "result": payload,
+            "cache": {"hits": self.cache_hits, "misses": self.cache_misses},
+            "lines_streamed": self.lines_streamed,
+            "lines_dropped": self.lines_dropped,
+            "elapsed": time.time() - self.started_at
+        }))
+
+    def iter_events(self):
+        """Yield SSE frames until the result trailer has been sent"""
+        while True:
+            try:
+                event, data = self.events.get(timeout=STREAM_KEEPALIVE_INTERVAL)
+            except queue.Empty:
+                yield ": keepalive\n\n"
+                continue
+
+            yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+            if event == "result":
+                return
+
+class CommandFlight:
+    """A command execution in progress that identical requests can join"""
+
+    def __init__(self, key: str):
+        self.key = key
+        self.started_at = time.time()
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.followers = 0
+        self.departed = 0
+        self.sinks = []
+        self.pids = []
+        self.sink_lock = threading.Lock()
+
+    def subscribe(self, sink):
+        """Forward output lines of this execution to another stream"""
+        if sink is not None:
+            with self.sink_lock:
+                self.sinks.append(sink)
+            sink.joined(self)
+
+    def attach(self, pid: int):
+        """Record a process started for this execution; stop it at once if every request has left"""
+        with self.sink_lock:
+            self.pids.append(pid)
+            abandoned = self.departed > self.followers
+        if abandoned:
+            ProcessManager.terminate_process(pid)
+
+    def leave(self, sink):
+        """Drop a stream whose client disconnected, stopping the execution once no request waits for it"""
+        with self.sink_lock:
+            if sink in self.sinks:
+                self.sinks.remove(sink)
+            self.departed += 1
+            # The leader plus every follower is a request waiting for this result
+            pids = list(self.pids) if self.departed > self.followers else []
+        if pids:
+            logger.info(f"🔌 Every client of this execution disconnected, stopping it: {self.key[:80]}")
+        for pid in pids:
+            ProcessManager.terminate_process(pid)
+
+    def emit_line(self, stream_name: str, line: str):
+        """Fan an output line out to every subscribed stream"""
+        with self.sink_lock:
+            sinks = list(self.sinks)
+        for sink in sinks:
+            sink.emit_line(stream_name, line)
+
+class SingleFlight:
+    """Coalesces identical in-flight executions so only one of them actually runs"""
+
+    def __init__(self):
+        self.flights = {}
+        self.flight_lock = threading.Lock()
+        self.stats = {"executions": 0, "coalesced": 0}
+
+    @staticmethod
+    def normalize(command: str) -> str:
+        """Normalize quoting and whitespace so equivalent command lines share a key"""
+        try:
+            return " ".join(token if operator else shlex.quote(token)
+                            for token, operator in ShellTokenizer.tokens(command))
+        except ValueError:
+            return " ".join(command.split())
+
+    def run(self, key: str, func, sink=None) -> Dict[str, Any]:
+        """Run func(flight) unless the same key is already running, in which case wait for its result"""
+        with self.flight_lock:
+            flight = self.flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = CommandFlight(key)
+                self.flights[key] = flight
+                self.stats["executions"] += 1
+            else:
+                flight.followers += 1
+                self.stats["coalesced"] += 1
+            flight.subscribe(sink)
+
+        if not leader:
+            logger.info(f"🔗 Joining in-flight execution ({time.time() - flight.started_at:.1f}s old): {key[:80]}")
+            flight.done.wait()
+            if flight.error is not None:
+                if isinstance(flight.error, AdmissionRejected):
+                    flight.error.flag_request()
+                raise flight.error
+            return {**flight.result, "coalesced": True}
+
+        try:
+            flight.result = func(flight)
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self.flight_lock:
+                self.flights.pop(key, None)
+            flight.done.set()
+
+        if flight.followers:
+            logger.info(f"🔗 Shared result with {flight.followers} coalesced request(s): {key[:80]}")
+        return flight.result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescing statistics"""
+        with self.flight_lock:
+            return {
+                "in_flight": len(self.flights),
+                "executions": self.stats["executions"],
+                "coalesced": self.stats["coalesced"]
+            }
+
+# Global in-flight command registry
+command_flights = SingleFlight()
+
+class AdmissionRejected(Exception):
+    """Raised when a command could not be admitted within the allowed wait"""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(f"Server busy: {reason}, retry after {retry_after}s")
+        self.reason = reason
+        self.retry_after = retry_after
+
+    def flag_request(self):
+        """Mark the current request so its response is turned into a 429"""
+        if has_request_context():
+            g.admission_rejected = self
+
+@dataclass
+class AdmissionTicket:
+    """Slots held by one admitted command"""
+    tool: str
+    target: Optional[str]
+    cost: int
+    admitted_at: float = field(default_factory=time.time)
+    released: bool = False
+
+class AdmissionController:
+    """Global admission control with per-tool and per-target concurrency limits and weighted costs"""
+
+    WRAPPERS = {"sudo", "nice", "ionice", "timeout", "stdbuf", "env", "nohup", "proxychains", "proxychains4"}
+    IPV4_PATTERN = re.compile(r'^\d{1,3}(?:\.\d{1,3}){3}(?:/\d{1,2})?(?::\d+)?$')
+    DOMAIN_PATTERN = re.compile(r'^(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,63}(?::\d+)?$')
+    FILE_EXTENSIONS = (".txt", ".lst", ".json", ".xml", ".csv", ".log", ".yaml", ".yml", ".conf", ".py", ".sh")
+
+    def __init__(self, global_slots: int = ADMISSION_GLOBAL_SLOTS, target_slots: int = ADMISSION_TARGET_SLOTS,
+                 max_wait: float = ADMISSION_MAX_WAIT, tool_limits: Dict[str, Dict[str, int]] = None):
+        self.global_slots = max(1, global_slots)
+        self.target_slots = max(1, target_slots)
+        self.max_wait = max_wait
+        self.tool_limits = tool_limits if tool_limits is not None else TOOL_ADMISSION_LIMITS
+        self.condition = threading.Condition()
+        self.global_used = 0
+        self.tool_running = {}
+        self.target_running = {}
+        self.waiting = 0
+        self.waiting_threads = set()  # Idents of threads blocked in acquire(), so the pool autoscaler can discount them
+        self.avg_hold_time = 0.0
+        self.stats = {"admitted": 0, "queued": 0, "rejected": 0, "total_wait": 0.0}
+
+    @classmethod
+    def describe(cls, command: str):
+        """Extract the tool name and target host from a command line"""
+        try:
+            argv = shlex.split(command)
+        except ValueError:
+            argv = command.split()
+
+        # Skip privilege/priority wrappers and their arguments
+        index = 0
+        while index < len(argv):
+            name = os.path.basename(argv[index])
+            if name in cls.WRAPPERS or "=" in argv[index] or argv[index].startswith("-") or argv[index].isdigit():
+                index += 1
+                continue
+            break
+        if index >= len(argv):
+            return "unknown", None
+
+        tool = os.path.basename(argv[index])
+        for arg in argv[index + 1:]:
+            target = cls._extract_host(arg)
+            if target:
+                return tool, target
+        return tool, None
+
+    @classmethod
+    def _extract_host(cls, arg: str) -> Optional[str]:
+        """Return the host an argument points at, if it looks like a URL, IP, CIDR or domain"""
+        if arg.startswith("-") or len(arg) > 2048:
+            return None
+        if "://" in arg:
+            try:
+                return urllib.parse.urlparse(arg).hostname
+            except ValueError:
+                return None
+        arg = arg.lower()
+        if cls.IPV4_PATTERN.match(arg):
+            return arg.split(":")[0]
+        if arg.endswith(cls.FILE_EXTENSIONS) or os.path.exists(arg):
+            return None
+        if cls.DOMAIN_PATTERN.match(arg):
+            return arg.split(":")[0]
+        return None
+
+    def _blocked_by(self, tool: str, target: Optional[str], cost: int) -> Optional[str]:
+        """Name the limit preventing admission, or None if the command fits (lock held)"""
+        if self.global_used + cost > self.global_slots:
+            return f"global limit ({self.global_used}/{self.global_slots} slots in use)"
+        tool_max = self.tool_limits.get(tool, {}).get("max")
+        if tool_max and self.tool_running.get(tool, 0) >= tool_max:
+            return f"{tool} limit ({tool_max} running)"
+        if target and self.target_running.get(target, 0) >= self.target_slots:
+            return f"target limit for {target} ({self.target_slots} running)"
+        return None
+
+    def _retry_after(self) -> int:
+        """Suggest how long a rejected client should back off"""
+        return int(min(300, max(1, round(self.avg_hold_time or 5))))
+
+    def acquire(self, command: str, wait: Optional[float] = None) -> AdmissionTicket:
+        """Wait for capacity to run a command, raising AdmissionRejected if none frees up in time"""
+        tool, target = self.describe(command)
+        cost = min(max(1, int(self.tool_limits.get(tool, {}).get("cost", 1))), self.global_slots)
+        requested_at = time.time()
+        deadline = requested_at + (self.max_wait if wait is None else wait)
+
+        with self.condition:
+            reason = self._blocked_by(tool, target, cost)
+            if reason:
+                self.stats["queued"] += 1
+                self.waiting += 1
+                self.waiting_threads.add(threading.get_ident())
+                logger.info(f"🚦 Queued {tool}: {reason}")
+                try:
+                    while reason:
+                        remaining = deadline - time.time()
+                        if remaining <= 0:
+                            self.stats["rejected"] += 1
+                            rejection = AdmissionRejected(reason, self._retry_after())
+                            rejection.flag_request()
+                            logger.warning(f"🚫 Rejected {tool} after {time.time() - requested_at:.1f}s: {reason}")
+                            raise rejection
+                        self.condition.wait(remaining)
+                        reason = self._blocked_by(tool, target, cost)
+                finally:
+                    self.waiting -= 1
+                    self.waiting_threads.discard(threading.get_ident())
+
+            self.global_used += cost
+            self.tool_running[tool] = self.tool_running.get(tool, 0) + 1
+            if target:
+                self.target_running[target] = self.target_running.get(target, 0) + 1
+            self.stats["admitted"] += 1
+            self.stats["total_wait"] += time.time() - requested_at
+
+        return AdmissionTicket(tool=tool, target=target, cost=cost)
+
+    def waiting_among(self, thread_ids) -> int:
+        """How many of the given threads are blocked waiting for admission"""
+        with self.condition:
+            return len(self.waiting_threads.intersection(thread_ids))
+
+    def release(self, ticket: Optional[AdmissionTicket]):
+        """Return a ticket's slots and wake queued commands"""
+        if ticket is None or ticket.released:
+            return
+
+        with self.condition:
+            ticket.released = True
+            self.global_used -= ticket.cost
+            self.tool_running[ticket.tool] -= 1
+            if not self.tool_running[ticket.tool]:
+                del self.tool_running[ticket.tool]
+            if ticket.target:
+                self.target_running[ticket.target] -= 1
+                if not self.target_running[ticket.target]:
+                    del self.target_running[ticket.target]
+            # Exponential moving average of how long commands hold their slots
+            hold_time = time.time() - ticket.admitted_at
+            self.avg_hold_time = hold_time if not self.avg_hold_time else 0.8 * self.avg_hold_time + 0.2 * hold_time
+            self.condition.notify_all()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get admission statistics"""
+        with self.condition:
+            admitted = self.stats["admitted"]
+            return {
+                "global_slots": self.global_slots,
+                "global_used": self.global_used,
+                "target_slots": self.target_slots,
+                "waiting": self.waiting,
+                "running_by_tool": dict(self.tool_running),
+                "running_by_target": dict(self.target_running),
+                "admitted": admitted,
+                "queued": self.stats["queued"],
+                "rejected": self.stats["rejected"],
+                "avg_wait": self.stats["total_wait"] / admitted if admitted else 0.0,
+                "avg_hold_time": self.avg_hold_time
+            }
+
+# Global admission controller
+admission_controller = AdmissionController()
+
+class ExitAwareStreamProtocol(asyncio.subprocess.SubprocessStreamProtocol):
+    """Subprocess protocol that signals process exit without waiting for the pipes to close"""
+
+    def __init__(self, limit: int, loop: asyncio.AbstractEventLoop):
+        super().__init__(limit=limit, loop=loop)
+        self.exited = loop.create_future()
+
+    def process_exited(self):
+        super().process_exited()
+        if not self.exited.done():
+            self.exited.set_result(None)
+
+class AsyncProcessHandle:
+    """Popen-like view of an asyncio subprocess that other threads can poll and signal"""
+
+    def __init__(self, process: asyncio.subprocess.Process, loop: asyncio.AbstractEventLoop):
+        self._process = process
+        self._loop = loop
+        self.pid = process.pid
+
+    def poll(self) -> Optional[int]:
+        """Return the exit code, or None while the process is running"""
+        return self._process.returncode
+
+    def _send_signal(self, sig: int):
+        if self._process.returncode is None:
+            try:
+                self._process.send_signal(sig)
+            except ProcessLookupError:
+                pass
+
+    def terminate(self):
+        """Send SIGTERM from any thread"""
+        self._loop.call_soon_threadsafe(self._send_signal, signal.SIGTERM)
+
+    def kill(self):
+        """Send SIGKILL from any thread"""
+        self._loop.call_soon_threadsafe(self._send_signal, signal.SIGKILL)
+
+class AsyncCommandRunner:
+    """Single dedicated event loop thread that drives every asyncio-backed command"""
+
+    def __init__(self):
+        self.loop = None
+        self.loop_thread = None
+        self.start_lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the event loop thread on first use"""
+        with self.start_lock:
+            if self.loop is None:
+                self.loop = asyncio.new_event_loop()
+                ready = threading.Event()
+                self.loop_thread = threading.Thread(target=self._run_loop, args=(ready,), daemon=True,
+                                                    name="hexstrike-command-loop")
+                self.loop_thread.start()
+                ready.wait()
+                logger.info("🔁 Async command runner event loop started")
+        return self.loop
+
+    def _run_loop(self, ready: threading.Event):
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(ready.set)
+        self.loop.run_forever()
+
+    def run(self, coro) -> Any:
+        """Run a coroutine on the event loop and block the calling thread until it finishes"""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop()).result()
+
+# Global async command runner
+async_command_runner = AsyncCommandRunner()
+
+class ProgressTicker:
+    """Single background ticker that updates progress for all running commands in one pass"""
+
+    def __init__(self, interval: float = PROGRESS_TICK_INTERVAL):
+        self.interval = interval
+        self.executors = {}
+        self.ticker_lock = threading.Lock()
+        self.tick = 0
+        self.consumer_seen_at = 0.0
+        self.tty_attached = sys.stdout.isatty()
+        self.ticker_thread = None
+
+    def register(self, executor):
+        """Track a running executor, starting the ticker thread on first use"""
+        with self.ticker_lock:
+            self.executors[id(executor)] = executor
+            if self.ticker_thread is None:
+                self.ticker_thread = threading.Thread(target=self._run, daemon=True, name="hexstrike-progress")
+                self.ticker_thread.start()
+
+    def unregister(self, executor):
+        """Stop tracking an executor"""
+        with self.ticker_lock:
+            self.executors.pop(id(executor), None)
+
+    def attach_consumer(self):
+        """Note that a dashboard is watching, which enables progress bar rendering for a while"""
+        self.consumer_seen_at = time.time()
+
+    @property
+    def rendering(self) -> bool:
+        """Render progress bars only when someone can see them"""
+        return self.tty_attached or time.time() - self.consumer_seen_at < PROGRESS_CONSUMER_TTL
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self._tick_once()
+            except Exception as e:
+                logger.error(f"💥 Progress ticker error: {str(e)}")
+
+    def _tick_once(self):
+        """Compute progress for every running process and publish it under one lock acquisition"""
+        with self.ticker_lock:
+            executors = list(self.executors.values())
+        if not executors:
+            return
+
+        self.tick += 1
+        now = time.time()
+        render = self.rendering
+        progress_chars = ModernVisualEngine.PROGRESS_STYLES['dots']
+        char = progress_chars[self.tick % len(progress_chars)]
+        updates = {}
+
+        for executor in executors:
+            process = executor.process
+            if process is None or process.poll() is not None:
+                continue
+
+            snapshot = executor.progress_snapshot(now)
+            update = {
+                "progress": snapshot["progress"],
+                "last_output": f"Running for {snapshot['elapsed']:.1f}s",
+                "bytes_processed": snapshot["bytes_processed"]
+            }
+
+            if render:
+                elapsed = snapshot["elapsed"]
+                speed = f"{snapshot['bytes_processed']/elapsed:.0f} B/s" if elapsed > 0 else "0 B/s"
+                # Create beautiful progress bar using ModernVisualEngine
+                update["progress_bar"] = ModernVisualEngine.render_progress_bar(
+                    snapshot["progress"],
+                    width=30,
+                    style='cyber',
+                    label=f"⚡ PROGRESS {char}",
+                    eta=snapshot["eta"],
+                    speed=speed
+                )
+                if self.tty_attached:
+                    logger.info(f"{update['progress_bar']} | {elapsed:.1f}s | PID: {process.pid}")
+
+            updates[process.pid] = update
+
+        ProcessManager.update_processes_progress(updates)
+
+# Global progress ticker
+progress_ticker = ProgressTicker()
+
 class EnhancedCommandExecutor:
     """Enhanced command executor with caching, progress tracking, and better output handling"""
 
-    def __init__(self, command: str, timeout: int = COMMAND_TIMEOUT):
+    def __init__(self, command: str, timeout: int = COMMAND_TIMEOUT, max_output_bytes: int = MAX_OUTPUT_BYTES,
+                 spill_output: bool = True, backend: Optional[str] = None):
         self.command = command
         self.timeout = timeout
         self.process = None
+        self.output_id = output_store.new_id() if spill_output else None
+        if spill_output:
+            self.stdout_buffer = output_store.create_buffer(self.output_id, "stdout", max_output_bytes)
+            self.stderr_buffer = output_store.create_buffer(self.output_id, "stderr", max_output_bytes)
+        else:
+            self.stdout_buffer = OutputBuffer(max_output_bytes)
+            self.stderr_buffer = OutputBuffer(max_output_bytes)
         self.stdout_data = ""
         self.stderr_data = ""
+        self.line_sink = CommandStream.current()
+        self.backend = backend or EXECUTOR_BACKEND
         self.stdout_thread = None
         self.stderr_thread = None
         self.return_code = None
@@ -6796,157 +9195,280 @@ class EnhancedCommandExecutor:
         self.start_time = None
         self.end_time = None
 
+    def _handle_stdout(self, line: bytes):
+        """Capture, forward and display a chunk of stdout"""
+        self.stdout_buffer.append(line)
+        text = line.decode(errors='replace')
+        if self.line_sink:
+            self.line_sink.emit_line("stdout", text)
+        # Real-time output display
+        logger.info(f"📤 STDOUT: {text.strip()}")
+
+    def _handle_stderr(self, line: bytes):
+        """Capture, forward and display a chunk of stderr"""
+        self.stderr_buffer.append(line)
+        text = line.decode(errors='replace')
+        if self.line_sink:
+            self.line_sink.emit_line("stderr", text)
+        # Real-time error output display
+        logger.warning(f"📥 STDERR: {text.strip()}")
+
     def _read_stdout(self):
         """Thread function to continuously read and display stdout"""
         try:
-            for line in iter(self.process.stdout.readline, ''):
-                if line:
-                    self.stdout_data += line
-                    # Real-time output display
-                    logger.info(f"📤 STDOUT: {line.strip()}")
+            for line in iter(lambda: self.process.stdout.readline(OUTPUT_READ_CHUNK), b''):
+                self._handle_stdout(line)
         except Exception as e:
             logger.error(f"Error reading stdout: {e}")
 
     def _read_stderr(self):
         """Thread function to continuously read and display stderr"""
         try:
-            for line in iter(self.process.stderr.readline, ''):
-                if line:
-                    self.stderr_data += line
-                    # Real-time error output display
-                    logger.warning(f"📥 STDERR: {line.strip()}")
+            for line in iter(lambda: self.process.stderr.readline(OUTPUT_READ_CHUNK), b''):
+                self._handle_stderr(line)
         except Exception as e:
             logger.error(f"Error reading stderr: {e}")
 
-    def _show_progress(self, duration: float):
-        """Show enhanced progress indication for long-running commands"""
-        if duration > 2:  # Show progress for commands taking more than 2 seconds
-            progress_chars = ModernVisualEngine.PROGRESS_STYLES['dots']
-            start = time.time()
-            i = 0
-            while self.process and self.process.poll() is None:
-                elapsed = time.time() - start
-                char = progress_chars[i % len(progress_chars)]
-
-                # Calculate progress percentage (rough estimate)
-                progress_percent = min((elapsed / self.timeout) * 100, 99.9)
-                progress_fraction = progress_percent / 100
-
-                # Calculate ETA
-                eta = 0
-                if progress_percent > 5:  # Only show ETA after 5% progress
-                    eta = ((elapsed / progress_percent) * 100) - elapsed
-
-                # Calculate speed
-                bytes_processed = len(self.stdout_data) + len(self.stderr_data)
-                speed = f"{bytes_processed/elapsed:.0f} B/s" if elapsed > 0 else "0 B/s"
-
-                # Update process manager with progress
-                ProcessManager.update_process_progress(
-                    self.process.pid,
-                    progress_fraction,
-                    f"Running for {elapsed:.1f}s",
-                    bytes_processed
-                )
+    async def _pump_stream(self, stream: asyncio.StreamReader, handler):
+        """Coroutine that reads a pipe line by line, in bounded chunks, until EOF"""
+        try:
+            while True:
+                try:
+                    line = await stream.readuntil(b'\n')
+                except asyncio.LimitOverrunError as e:
+                    # Over-long line: hand over what is buffered instead of growing without bound
+                    line = await stream.read(e.consumed)
+                except asyncio.IncompleteReadError as e:
+                    if e.partial:
+                        handler(e.partial)
+                    return
+                handler(line)
+        except Exception as e:
+            logger.error(f"Error reading output stream: {e}")
+
+    def _finalize_output(self):
+        """Decode the captured output buffers once the readers are done"""
+        for buffer in (self.stdout_buffer, self.stderr_buffer):
+            buffer.close()
+
+        # Once one stream is spilled, store the other too so both are addressable by id
+        if self.output_spilled:
+            for stream, buffer in (("stdout", self.stdout_buffer), ("stderr", self.stderr_buffer)):
+                if not buffer.spilled:
+                    output_store.write(self.output_id, stream, buffer.getvalue())
+
+        self.stdout_data = self.stdout_buffer.decode()
+        self.stderr_data = self.stderr_buffer.decode()
+
+    @property
+    def output_spilled(self) -> bool:
+        """Whether any output stream was spilled to the output store"""
+        return self.stdout_buffer.spilled or self.stderr_buffer.spilled
+
+    def _output_reference(self) -> Dict[str, Any]:
+        """Result fields pointing at spilled output in the output store"""
+        if not self.output_spilled:
+            return {}
+        return {
+            "output_id": self.output_id,
+            "output_spilled": True,
+            "stdout_bytes": self.stdout_buffer.total_bytes,
+            "stderr_bytes": self.stderr_buffer.total_bytes
+        }
 
-                # Create beautiful progress bar using ModernVisualEngine
-                progress_bar = ModernVisualEngine.render_progress_bar(
-                    progress_fraction,
-                    width=30,
-                    style='cyber',
-                    label=f"⚡ PROGRESS {char}",
-                    eta=eta,
-                    speed=speed
-                )
+    def progress_snapshot(self, now: float) -> Dict[str, Any]:
+        """Estimate progress, ETA and throughput for the progress ticker"""
+        elapsed = now - self.start_time
 
-                logger.info(f"{progress_bar} | {elapsed:.1f}s | PID: {self.process.pid}")
-                time.sleep(0.8)
-                i += 1
-                if elapsed > self.timeout:
-                    break
+        # Calculate progress percentage (rough estimate)
+        progress_percent = min((elapsed / self.timeout) * 100, 99.9)
 
-    def execute(self) -> Dict[str, Any]:
-        """Execute the command with enhanced monitoring and output"""
-        self.start_time = time.time()
+        # Calculate ETA
+        eta = 0
+        if progress_percent > 5:  # Only show ETA after 5% progress
+            eta = ((elapsed / progress_percent) * 100) - elapsed
 
-        logger.info(f"🚀 EXECUTING: {self.command}")
-        logger.info(f"⏱️  TIMEOUT: {self.timeout}s | PID: Starting...")
+        return {
+            "elapsed": elapsed,
+            "progress": progress_percent / 100,
+            "eta": eta,
+            "bytes_processed": self.stdout_buffer.total_bytes + self.stderr_buffer.total_bytes
+        }
 
+    def _log_completion(self):
+        """Log and record the outcome of a process that exited on its own"""
+        execution_time = self.end_time - self.start_time
+        if self.return_code == 0:
+            logger.info(f"✅ SUCCESS: Command completed | Exit Code: {self.return_code} | Duration: {execution_time:.2f}s")
+            telemetry.record_execution(True, execution_time)
+        else:
+            logger.warning(f"⚠️  WARNING: Command completed with errors | Exit Code: {self.return_code} | Duration: {execution_time:.2f}s")
+            telemetry.record_execution(False, execution_time)
+
+    def _signal_group(self, sig: int):
+        """Signal the shell and every process it started; commands run in their own session"""
         try:
-            self.process = subprocess.Popen(
-                self.command,
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1
-            )
+            os.killpg(self.process.pid, sig)
+        except (ProcessLookupError, PermissionError):
+            pass
 
-            pid = self.process.pid
-            logger.info(f"🆔 PROCESS: PID {pid} started")
+    def _run_threaded(self):
+        """Run the command with one reader thread per pipe"""
+        self.process = subprocess.Popen(
+            self.command,
+            shell=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=True
+        )
 
-            # Register process with ProcessManager (v5.0 enhancement)
-            ProcessManager.register_process(pid, self.command, self.process)
+        pid = self.process.pid
+        logger.info(f"🆔 PROCESS: PID {pid} started")
 
-            # Start threads to read output continuously
-            self.stdout_thread = threading.Thread(target=self._read_stdout)
-            self.stderr_thread = threading.Thread(target=self._read_stderr)
-            self.stdout_thread.daemon = True
-            self.stderr_thread.daemon = True
-            self.stdout_thread.start()
-            self.stderr_thread.start()
+        # Register process with ProcessManager (v5.0 enhancement)
+        ProcessManager.register_process(pid, self.command, self.process)
+        if self.line_sink:
+            self.line_sink.attach(pid)
 
-            # Start progress tracking in a separate thread
-            progress_thread = threading.Thread(target=self._show_progress, args=(self.timeout,))
-            progress_thread.daemon = True
-            progress_thread.start()
+        # Start threads to read output continuously
+        self.stdout_thread = threading.Thread(target=self._read_stdout)
+        self.stderr_thread = threading.Thread(target=self._read_stderr)
+        self.stdout_thread.daemon = True
+        self.stderr_thread.daemon = True
+        self.stdout_thread.start()
+        self.stderr_thread.start()
 
-            # Wait for the process to complete or timeout
-            try:
-                self.return_code = self.process.wait(timeout=self.timeout)
-                self.end_time = time.time()
+        progress_ticker.register(self)
 
-                # Process completed, join the threads
-                self.stdout_thread.join(timeout=1)
-                self.stderr_thread.join(timeout=1)
+        # Wait for the process to complete or timeout
+        try:
+            self.return_code = self.process.wait(timeout=self.timeout)
+            self.end_time = time.time()
 
-                execution_time = self.end_time - self.start_time
+            # Process completed, join the threads
+            self.stdout_thread.join(timeout=1)
+            self.stderr_thread.join(timeout=1)
 
-                # Cleanup process from registry (v5.0 enhancement)
-                ProcessManager.cleanup_process(pid)
+            # Cleanup process from registry (v5.0 enhancement)
+            ProcessManager.cleanup_process(pid)
+            self._log_completion()
 
-                if self.return_code == 0:
-                    logger.info(f"✅ SUCCESS: Command completed | Exit Code: {self.return_code} | Duration: {execution_time:.2f}s")
-                    telemetry.record_execution(True, execution_time)
-                else:
-                    logger.warning(f"⚠️  WARNING: Command completed with errors | Exit Code: {self.return_code} | Duration: {execution_time:.2f}s")
-                    telemetry.record_execution(False, execution_time)
+        except subprocess.TimeoutExpired:
+            self.end_time = time.time()
+            execution_time = self.end_time - self.start_time
+
+            # Process timed out but we might have partial results
+            self.timed_out = True
+            logger.warning(f"⏰ TIMEOUT: Command timed out after {self.timeout}s | Terminating PID {self.process.pid}")
 
+            # Try to terminate gracefully first
+            self._signal_group(signal.SIGTERM)
+            try:
+                self.process.wait(timeout=5)
             except subprocess.TimeoutExpired:
+                # Force kill if it doesn't terminate
+                logger.error(f"🔪 FORCE KILL: Process {self.process.pid} not responding to termination")
+            # Children of the shell that ignored SIGTERM would otherwise keep the pipes open
+            self._signal_group(signal.SIGKILL)
+
+            self.return_code = -1
+            telemetry.record_execution(False, execution_time)
+
+            # Give the readers a moment to drain what the process wrote before dying
+            self.stdout_thread.join(timeout=1)
+            self.stderr_thread.join(timeout=1)
+
+    async def _run_async(self):
+        """Run the command on the shared event loop with concurrent pipe readers"""
+        loop = asyncio.get_running_loop()
+        transport, protocol = await loop.subprocess_shell(
+            lambda: ExitAwareStreamProtocol(OUTPUT_READ_CHUNK, loop),
+            self.command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True
+        )
+        process = asyncio.subprocess.Process(transport, protocol, loop)
+        self.process = AsyncProcessHandle(process, loop)
+
+        pid = process.pid
+        logger.info(f"🆔 PROCESS: PID {pid} started")
+
+        # Register process with ProcessManager (v5.0 enhancement)
+        ProcessManager.register_process(pid, self.command, self.process)
+        if self.line_sink:
+            self.line_sink.attach(pid)
+
+        readers = asyncio.gather(
+            self._pump_stream(process.stdout, self._handle_stdout),
+            self._pump_stream(process.stderr, self._handle_stderr)
+        )
+        progress_ticker.register(self)
+
+        try:
+            await asyncio.wait_for(asyncio.shield(protocol.exited), timeout=self.timeout)
+            self.return_code = process.returncode
+            self.end_time = time.time()
+
+            # Process completed, let the readers drain
+            await asyncio.wait_for(readers, timeout=1)
+
+        except asyncio.TimeoutError:
+            if self.return_code is None:
                 self.end_time = time.time()
                 execution_time = self.end_time - self.start_time
 
                 # Process timed out but we might have partial results
                 self.timed_out = True
-                logger.warning(f"⏰ TIMEOUT: Command timed out after {self.timeout}s | Terminating PID {self.process.pid}")
+                logger.warning(f"⏰ TIMEOUT: Command timed out after {self.timeout}s | Terminating PID {pid}")
 
                 # Try to terminate gracefully first
-                self.process.terminate()
+                self._signal_group(signal.SIGTERM)
                 try:
-                    self.process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
+                    await asyncio.wait_for(asyncio.shield(protocol.exited), timeout=5)
+                except asyncio.TimeoutError:
                     # Force kill if it doesn't terminate
-                    logger.error(f"🔪 FORCE KILL: Process {self.process.pid} not responding to termination")
-                    self.process.kill()
+                    logger.error(f"🔪 FORCE KILL: Process {pid} not responding to termination")
+                # Children of the shell that ignored SIGTERM would otherwise keep the pipes open
+                self._signal_group(signal.SIGKILL)
 
                 self.return_code = -1
                 telemetry.record_execution(False, execution_time)
 
+                # Give the readers a moment to drain what the process wrote before dying
+                try:
+                    await asyncio.wait_for(readers, timeout=1)
+                except asyncio.TimeoutError:
+                    pass
+                return
+            # Otherwise only the readers timed out (a child still holds the pipes open)
+
+        # Cleanup process from registry (v5.0 enhancement)
+        ProcessManager.cleanup_process(pid)
+        self._log_completion()
+
+    def execute(self) -> Dict[str, Any]:
+        """Execute the command with enhanced monitoring and output"""
+        ticket = admission_controller.acquire(self.command)
+        self.start_time = time.time()
+
+        logger.info(f"🚀 EXECUTING: {self.command}")
+        logger.info(f"⏱️  TIMEOUT: {self.timeout}s | PID: Starting...")
+
+        try:
+            if self.backend == "asyncio":
+                async_command_runner.run(self._run_async())
+            else:
+                self._run_threaded()
+
+            self._finalize_output()
+
             # Always consider it a success if we have output, even with timeout
             success = True if self.timed_out and (self.stdout_data or self.stderr_data) else (self.return_code == 0)
 
             # Log enhanced final results with summary using ModernVisualEngine
-            output_size = len(self.stdout_data) + len(self.stderr_data)
+            output_size = self.stdout_buffer.total_bytes + self.stderr_buffer.total_bytes
+            output_truncated = (self.stdout_buffer.truncated or self.stderr_buffer.truncated) and not self.output_spilled
             execution_time = self.end_time - self.start_time if self.end_time else 0
 
             # Create status summary
@@ -6961,7 +9483,7 @@ class EnhancedCommandExecutor:
 {ModernVisualEngine.COLORS['BOLD']}├─────────────────────────────────────────────────────────────────────────────┤{ModernVisualEngine.COLORS['RESET']}
 {ModernVisualEngine.COLORS['BOLD']}│{ModernVisualEngine.COLORS['RESET']} {ModernVisualEngine.COLORS['NEON_BLUE']}🚀 Command:{ModernVisualEngine.COLORS['RESET']} {self.command[:55]}{'...' if len(self.command) > 55 else ''}
 {ModernVisualEngine.COLORS['BOLD']}│{ModernVisualEngine.COLORS['RESET']} {ModernVisualEngine.COLORS['CYBER_ORANGE']}⏱️  Duration:{ModernVisualEngine.COLORS['RESET']} {execution_time:.2f}s{timeout_status}
-{ModernVisualEngine.COLORS['BOLD']}│{ModernVisualEngine.COLORS['RESET']} {ModernVisualEngine.COLORS['WARNING']}📊 Output Size:{ModernVisualEngine.COLORS['RESET']} {output_size} bytes
+{ModernVisualEngine.COLORS['BOLD']}│{ModernVisualEngine.COLORS['RESET']} {ModernVisualEngine.COLORS['WARNING']}📊 Output Size:{ModernVisualEngine.COLORS['RESET']} {output_size} bytes{' (truncated)' if output_truncated else ''}
 {ModernVisualEngine.COLORS['BOLD']}│{ModernVisualEngine.COLORS['RESET']} {ModernVisualEngine.COLORS['ELECTRIC_PURPLE']}🔢 Exit Code:{ModernVisualEngine.COLORS['RESET']} {self.return_code}
 {ModernVisualEngine.COLORS['BOLD']}│{ModernVisualEngine.COLORS['RESET']} {status_color}📈 Status:{ModernVisualEngine.COLORS['RESET']} {'SUCCESS' if success else 'FAILED'} | Cached: Yes
 {ModernVisualEngine.COLORS['MATRIX_GREEN']}{ModernVisualEngine.COLORS['BOLD']}╰─────────────────────────────────────────────────────────────────────────────╯{ModernVisualEngine.COLORS['RESET']}
@@ -6979,6 +9501,8 @@ class EnhancedCommandExecutor:
                 "success": success,
                 "timed_out": self.timed_out,
                 "partial_results": self.timed_out and (self.stdout_data or self.stderr_data),
+                "output_truncated": output_truncated,
+                **self._output_reference(),
                 "execution_time": self.end_time - self.start_time if self.end_time else 0,
                 "timestamp": datetime.now().isoformat()
             }
@@ -6990,6 +9514,7 @@ class EnhancedCommandExecutor:
             logger.error(f"💥 ERROR: Command execution failed: {str(e)}")
             logger.error(f"🔍 TRACEBACK: {traceback.format_exc()}")
             telemetry.record_execution(False, execution_time)
+            self._finalize_output()
 
             return {
                 "stdout": self.stdout_data,
@@ -6998,10 +9523,15 @@ class EnhancedCommandExecutor:
                 "success": False,
                 "timed_out": False,
                 "partial_results": bool(self.stdout_data or self.stderr_data),
+                **self._output_reference(),
                 "execution_time": execution_time,
                 "timestamp": datetime.now().isoformat()
             }
 
+        finally:
+            progress_ticker.unregister(self)
+            admission_controller.release(ticket)
+
 # ============================================================================
 # DUPLICATE CLASSES REMOVED - Using the first definitions above
 # ============================================================================
@@ -8629,9 +11159,9 @@ class VulnerabilityCorrelator:
         return "\n".join(recommendations)
 
 # Global intelligence managers
-cve_intelligence = CVEIntelligenceManager()
-exploit_generator = AIExploitGenerator()
-vulnerability_correlator = VulnerabilityCorrelator()
+cve_intelligence = LazyInstance(CVEIntelligenceManager)
+exploit_generator = LazyInstance(AIExploitGenerator)
+vulnerability_correlator = LazyInstance(VulnerabilityCorrelator)
 
 def execute_command(command: str, use_cache: bool = True) -> Dict[str, Any]:
     """
@@ -8645,21 +11175,35 @@ def execute_command(command: str, use_cache: bool = True) -> Dict[str, Any]:
         A dictionary containing the stdout, stderr, return code, and metadata
     """
 
+    stream = CommandStream.current()
+    # Batch tool items run with the batch's use_cache setting
+    if use_cache and has_request_context():
+        use_cache = g.get("use_cache", True)
+
     # Check cache first
     if use_cache:
-        cached_result = cache.get(command, {})
+        cached_result = cache.get(command)
+        if stream:
+            stream.record_cache(bool(cached_result))
         if cached_result:
             return cached_result
 
-    # Execute command
-    executor = EnhancedCommandExecutor(command)
-    result = executor.execute()
+    return _execute_and_cache(command, use_cache, stream)
 
-    # Cache successful results
-    if use_cache and result.get("success", False):
-        cache.set(command, {}, result)
+def _execute_and_cache(command: str, use_cache: bool = True, sink: Optional[CommandStream] = None) -> Dict[str, Any]:
+    """Run a command, joining an identical execution that is already running, and cache success"""
+    def run(flight: CommandFlight) -> Dict[str, Any]:
+        executor = EnhancedCommandExecutor(command)
+        executor.line_sink = flight
+        result = executor.execute()
 
-    return result
+        # Cache successful results
+        if use_cache and result.get("success", False):
+            cache.set(command, result)
+
+        return result
+
+    return command_flights.run(f"cmd:{SingleFlight.normalize(command)}", run, sink=sink)
 
 def execute_command_with_recovery(tool_name: str, command: str, parameters: Dict[str, Any] = None,
                                  use_cache: bool = True, max_attempts: int = 3) -> Dict[str, Any]:
@@ -8676,6 +11220,17 @@ def execute_command_with_recovery(tool_name: str, command: str, parameters: Dict
     Returns:
         A dictionary containing execution results with recovery information
     """
+    # Identical tool runs share one execution, including its recovery attempts
+    key = f"recovery:{tool_name}:{SingleFlight.normalize(command)}"
+    return command_flights.run(
+        key,
+        lambda flight: _execute_with_recovery(tool_name, command, parameters, use_cache, max_attempts),
+        sink=CommandStream.current()
+    )
+
+def _execute_with_recovery(tool_name: str, command: str, parameters: Optional[Dict[str, Any]],
+                           use_cache: bool, max_attempts: int) -> Dict[str, Any]:
+    """Recovery loop behind execute_command_with_recovery"""
     if parameters is None:
         parameters = {}
 
@@ -9016,124 +11571,486 @@ class FileOperationsManager:
             return {"success": False, "error": str(e)}
 
 # Global file operations manager
-file_manager = FileOperationsManager()
+file_manager = LazyInstance(FileOperationsManager)
 
 # API Routes
 
-@app.route("/health", methods=["GET"])
-def health_check():
-    """Health check endpoint with comprehensive tool detection"""
-
-    essential_tools = [
+# Tools reported by /health, by category
+HEALTH_TOOL_CATEGORIES = {
+    "essential": [
         "nmap", "gobuster", "dirb", "nikto", "sqlmap", "hydra", "john", "hashcat"
-    ]
-
-    network_tools = [
+    ],
+    "network": [
         "rustscan", "masscan", "autorecon", "nbtscan", "arp-scan", "responder",
         "nxc", "enum4linux-ng", "rpcclient", "enum4linux"
-    ]
-
-    web_security_tools = [
+    ],
+    "web_security": [
         "ffuf", "feroxbuster", "dirsearch", "dotdotpwn", "xsser", "wfuzz",
         "gau", "waybackurls", "arjun", "paramspider", "x8", "jaeles", "dalfox",
         "httpx", "wafw00f", "burpsuite", "zaproxy", "katana", "hakrawler"
-    ]
-
-    vuln_scanning_tools = [
+    ],
+    "vuln_scanning": [
         "nuclei", "wpscan", "graphql-scanner", "jwt-analyzer"
-    ]
-
-    password_tools = [
+    ],
+    "password": [
         "medusa", "patator", "hash-identifier", "ophcrack", "hashcat-utils"
-    ]
-
-    binary_tools = [
+    ],
+    "binary": [
         "gdb", "radare2", "binwalk", "ropgadget", "checksec", "objdump",
         "ghidra", "pwntools", "one-gadget", "ropper", "angr", "libc-database",
         "pwninit"
-    ]
-
-    forensics_tools = [
+    ],
+    "forensics": [
         "volatility3", "vol", "steghide", "hashpump", "foremost", "exiftool",
         "strings", "xxd", "file", "photorec", "testdisk", "scalpel", "bulk-extractor",
         "stegsolve", "zsteg", "outguess"
-    ]
-
-    cloud_tools = [
+    ],
+    "cloud": [
         "prowler", "scout-suite", "trivy", "kube-hunter", "kube-bench",
         "docker-bench-security", "checkov", "terrascan", "falco", "clair"
-    ]
-
-    osint_tools = [
+    ],
+    "osint": [
         "amass", "subfinder", "fierce", "dnsenum", "theharvester", "sherlock",
         "social-analyzer", "recon-ng", "maltego", "spiderfoot", "shodan-cli",
         "censys-cli", "have-i-been-pwned"
-    ]
-
-    exploitation_tools = [
+    ],
+    "exploitation": [
         "metasploit", "exploit-db", "searchsploit"
-    ]
-
-    api_tools = [
+    ],
+    "api": [
         "api-schema-analyzer", "postman", "insomnia", "curl", "httpie", "anew", "qsreplace", "uro"
-    ]
-
-    wireless_tools = [
+    ],
+    "wireless": [
         "kismet", "wireshark", "tshark", "tcpdump"
-    ]
-
-    additional_tools = [
+    ],
+    "additional": [
         "smbmap", "volatility", "sleuthkit", "autopsy", "evil-winrm",
         "paramspider", "airmon-ng", "airodump-ng", "aireplay-ng", "aircrack-ng",
         "msfvenom", "msfconsole", "graphql-scanner", "jwt-analyzer"
     ]
+}
 
-    all_tools = (
-        essential_tools + network_tools + web_security_tools + vuln_scanning_tools +
-        password_tools + binary_tools + forensics_tools + cloud_tools +
-        osint_tools + exploitation_tools + api_tools + wireless_tools + additional_tools
-    )
-    tools_status = {}
-
-    for tool in all_tools:
-        try:
-            result = execute_command(f"which {tool}", use_cache=True)
-            tools_status[tool] = result["success"]
-        except:
-            tools_status[tool] = False
-
-    all_essential_tools_available = all(tools_status[tool] for tool in essential_tools)
+def _build_health_report() -> Dict[str, Any]:
+    """Tool availability, category stats, cache and telemetry for the health endpoints"""
+    all_tools = [tool for tools in HEALTH_TOOL_CATEGORIES.values() for tool in tools]
+    tools_status = tool_registry.status(all_tools)
 
     category_stats = {
-        "essential": {"total": len(essential_tools), "available": sum(1 for tool in essential_tools if tools_status.get(tool, False))},
-        "network": {"total": len(network_tools), "available": sum(1 for tool in network_tools if tools_status.get(tool, False))},
-        "web_security": {"total": len(web_security_tools), "available": sum(1 for tool in web_security_tools if tools_status.get(tool, False))},
-        "vuln_scanning": {"total": len(vuln_scanning_tools), "available": sum(1 for tool in vuln_scanning_tools if tools_status.get(tool, False))},
-        "password": {"total": len(password_tools), "available": sum(1 for tool in password_tools if tools_status.get(tool, False))},
-        "binary": {"total": len(binary_tools), "available": sum(1 for tool in binary_tools if tools_status.get(tool, False))},
-        "forensics": {"total": len(forensics_tools), "available": sum(1 for tool in forensics_tools if tools_status.get(tool, False))},
-        "cloud": {"total": len(cloud_tools), "available": sum(1 for tool in cloud_tools if tools_status.get(tool, False))},
-        "osint": {"total": len(osint_tools), "available": sum(1 for tool in osint_tools if tools_status.get(tool, False))},
-        "exploitation": {"total": len(exploitation_tools), "available": sum(1 for tool in exploitation_tools if tools_status.get(tool, False))},
-        "api": {"total": len(api_tools), "available": sum(1 for tool in api_tools if tools_status.get(tool, False))},
-        "wireless": {"total": len(wireless_tools), "available": sum(1 for tool in wireless_tools if tools_status.get(tool, False))},
-        "additional": {"total": len(additional_tools), "available": sum(1 for tool in additional_tools if tools_status.get(tool, False))}
+        category: {"total": len(tools), "available": sum(1 for tool in tools if tools_status.get(tool, False))}
+        for category, tools in HEALTH_TOOL_CATEGORIES.items()
     }
 
-    return jsonify({
+    return {
         "status": "healthy",
         "message": "HexStrike AI Tools API Server is operational",
         "version": "6.0.0",
         "tools_status": tools_status,
-        "all_essential_tools_available": all_essential_tools_available,
+        "all_essential_tools_available": all(tools_status[tool] for tool in HEALTH_TOOL_CATEGORIES["essential"]),
         "total_tools_available": sum(1 for tool, available in tools_status.items() if available),
         "total_tools_count": len(all_tools),
         "category_stats": category_stats,
+        "tool_versions": tool_registry.get_versions() if tool_registry.probe_versions else None,
         "cache_stats": cache.get_stats(),
-        "telemetry": telemetry.get_stats(),
+        "telemetry": telemetry.get_stats()
+    }
+
+class HealthSnapshot:
+    """Health report rebuilt in the background so health polls never pay for building it"""
+
+    def __init__(self, builder, interval: float = HEALTH_SNAPSHOT_INTERVAL):
+        self.builder = builder
+        self.interval = interval
+        self.report = None
+        self.built_at = 0.0
+        self.build_time = 0.0
+        self.build_lock = threading.Lock()
+        self.refresh_thread = None
+
+    def start(self):
+        """Start the background refresh thread"""
+        with self.build_lock:
+            if self.refresh_thread is None:
+                self.refresh_thread = threading.Thread(target=self._run, daemon=True, name="hexstrike-health")
+                self.refresh_thread.start()
+
+    def rebuild(self):
+        """Build a fresh report"""
+        with self.build_lock:
+            started = time.time()
+            self.report = self.builder()
+            self.built_at = time.time()
+            self.build_time = self.built_at - started
+
+    def get(self) -> Dict[str, Any]:
+        """Latest report, built synchronously only if none exists yet"""
+        if self.report is None:
+            with self.build_lock:
+                needs_build = self.report is None
+            if needs_build:
+                self.rebuild()
+            self.start()
+        return self.report
+
+    def _run(self):
+        while True:
+            try:
+                if self.report is None or time.time() - self.built_at >= self.interval:
+                    self.rebuild()
+            except Exception as e:
+                logger.error(f"💥 Health snapshot refresh error: {str(e)}")
+            time.sleep(self.interval)
+
+# Global health snapshot
+health_snapshot = HealthSnapshot(_build_health_report)
+
+@app.route("/livez", methods=["GET"])
+def liveness_check():
+    """Liveness probe: the server process is up and serving requests"""
+    return jsonify({"status": "alive", "version": "6.0.0"})
+
+@app.route("/readyz", methods=["GET"])
+def readiness_check():
+    """Readiness probe: essential tools are installed"""
+    tools_status = tool_registry.status(HEALTH_TOOL_CATEGORIES["essential"])
+    missing = [tool for tool, available in tools_status.items() if not available]
+    ready = not missing and not server_drain.draining
+    return jsonify({
+        "status": "ready" if ready else ("draining" if server_drain.draining else "not_ready"),
+        "essential_tools": tools_status,
+        "missing_essential_tools": missing
+    }), 200 if ready else 503
+
+@app.route("/health", methods=["GET"])
+def health_check():
+    """Health check endpoint with comprehensive tool detection, served from the background snapshot"""
+    return jsonify({
+        **health_snapshot.get(),
         "uptime": time.time() - telemetry.stats["start_time"]
     })
 
+@app.route("/health/full", methods=["GET"])
+def full_health_check():
+    """Full health report with snapshot metadata (?refresh=1 rebuilds it first)"""
+    try:
+        if request.args.get("refresh", "").lower() in ("1", "true", "yes"):
+            health_snapshot.rebuild()
+
+        report = health_snapshot.get()
+        return jsonify({
+            **report,
+            "uptime": time.time() - telemetry.stats["start_time"],
+            "snapshot": {
+                "age": time.time() - health_snapshot.built_at,
+                "build_time": health_snapshot.build_time,
+                "refresh_interval": health_snapshot.interval
+            }
+        })
+    except Exception as e:
+        logger.error(f"💥 Error building health report: {str(e)}")
+        return jsonify({"error": f"Server error: {str(e)}"}), 500
+
+class RequestMetrics:
+    """Per-route request counts, latency and response size histograms, and in-flight gauges"""
+
+    LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+    SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+    QUANTILES = (0.5, 0.95, 0.99)
+
+    def __init__(self, window: int = 1024):
+        self.window = window
+        self.routes = {}
+        self.in_flight = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def route_key() -> Tuple[str, str]:
+        """(route template, method) so /api/outputs/<id> is one series, not one per id"""
+        rule = request.url_rule.rule if request.url_rule is not None else "unmatched"
+        return rule, request.method
+
+    def _route(self, key):
+        route = self.routes.get(key)
+        if route is None:
+            route = self.routes[key] = {
+                "count": 0,
+                "status": {},
+                "latency_buckets": [0] * len(self.LATENCY_BUCKETS),
+                "latency_sum": 0.0,
+                "latency_window": deque(maxlen=self.window),
+                "size_buckets": [0] * len(self.SIZE_BUCKETS),
+                "size_sum": 0,
+                "size_count": 0
+            }
+        return route
+
+    def started(self, key):
+        with self.lock:
+            self.in_flight[key] = self.in_flight.get(key, 0) + 1
+
+    def finished(self, key, status: int, latency: float, size: Optional[int]):
+        with self.lock:
+            self.in_flight[key] -= 1
+            route = self._route(key)
+            route["count"] += 1
+            route["status"][status] = route["status"].get(status, 0) + 1
+            route["latency_sum"] += latency
+            route["latency_window"].append(latency)
+            for i, bound in enumerate(self.LATENCY_BUCKETS):
+                if latency <= bound:
+                    route["latency_buckets"][i] += 1
+            # Streamed responses have no length up front and are left out of the size histogram
+            if size is not None:
+                route["size_sum"] += size
+                route["size_count"] += 1
+                for i, bound in enumerate(self.SIZE_BUCKETS):
+                    if size <= bound:
+                        route["size_buckets"][i] += 1
+
+    def snapshot(self) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """Copy of every route's series with latency quantiles over the recent window"""
+        with self.lock:
+            routes = {key: {**route, "status": dict(route["status"]),
+                            "latency_buckets": list(route["latency_buckets"]),
+                            "size_buckets": list(route["size_buckets"]),
+                            "latency_window": list(route["latency_window"])}
+                      for key, route in self.routes.items()}
+            in_flight = dict(self.in_flight)
+        for key, route in routes.items():
+            route["quantiles"] = ProcessPool._wait_percentiles(route.pop("latency_window"))
+            route["in_flight"] = in_flight.get(key, 0)
+        for key, count in in_flight.items():
+            if key not in routes and count:
+                routes[key] = {**self._empty(), "in_flight": count}
+        return routes
+
+    def _empty(self) -> Dict[str, Any]:
+        return {"count": 0, "status": {}, "latency_buckets": [0] * len(self.LATENCY_BUCKETS), "latency_sum": 0.0,
+                "size_buckets": [0] * len(self.SIZE_BUCKETS), "size_sum": 0, "size_count": 0,
+                "quantiles": ProcessPool._wait_percentiles([])}
+
+    def get_stats(self) -> List[Dict[str, Any]]:
+        """Per-route summary, slowest p95 first"""
+        summary = []
+        for (rule, method), route in self.snapshot().items():
+            summary.append({
+                "route": rule,
+                "method": method,
+                "count": route["count"],
+                "in_flight": route["in_flight"],
+                "errors": sum(n for status, n in route["status"].items() if status >= 500),
+                "avg": route["latency_sum"] / route["count"] if route["count"] else 0.0,
+                "p50": route["quantiles"]["p50"],
+                "p95": route["quantiles"]["p95"],
+                "p99": route["quantiles"]["p99"],
+                "avg_response_bytes": route["size_sum"] / route["size_count"] if route["size_count"] else 0
+            })
+        return sorted(summary, key=lambda r: r["p95"], reverse=True)
+
+# Global request metrics
+request_metrics = RequestMetrics()
+
+@app.before_request
+def metrics_request_started():
+    """Start the latency clock; registered first so every other hook's time is included"""
+    g.metrics_key = RequestMetrics.route_key()
+    g.metrics_started = time.perf_counter()
+    request_metrics.started(g.metrics_key)
+
+@app.after_request
+def metrics_response_ready(response):
+    """Remember the final status and size; registered first so it runs after every other after_request hook"""
+    g.metrics_status = response.status_code
+    g.metrics_size = None if response.is_streamed else response.calculate_content_length()
+    return response
+
+@app.teardown_request
+def metrics_request_finished(exc):
+    key = g.pop("metrics_key", None)
+    if key is None:
+        return
+    status = g.pop("metrics_status", 500)
+    request_metrics.finished(key, status, time.perf_counter() - g.pop("metrics_started"), g.pop("metrics_size", None))
+
+class ServerDrain:
+    """Graceful shutdown: refuse new work, then wait for in-flight requests and tool runs"""
+
+    EXEMPT_PATHS = ("/livez", "/readyz", "/health")
+
+    def __init__(self, retry_after: int = 5):
+        self.retry_after = retry_after
+        self.draining = False
+        self.drain_started = None
+        self.drained = None
+        self.inflight_requests = 0
+        self.rejected_requests = 0
+        self.terminated_processes = 0
+        self.lock = threading.Lock()
+
+    def request_started(self) -> bool:
+        """Count a request in, or refuse it if the server is draining"""
+        with self.lock:
+            if self.draining:
+                self.rejected_requests += 1
+                return False
+            self.inflight_requests += 1
+            return True
+
+    def request_finished(self):
+        with self.lock:
+            self.inflight_requests -= 1
+
+    def pending_work(self) -> Dict[str, int]:
+        """In-flight requests, admitted tool runs and pool tasks that a drain waits for"""
+        pool = enhanced_process_manager.process_pool
+        return {
+            "requests": self.inflight_requests,
+            "tool_runs": admission_controller.global_used,
+            "pool_tasks": len(pool.active_tasks),
+            "queued_tasks": pool.task_queue.qsize()
+        }
+
+    def begin(self):
+        """Stop accepting new work; probes keep answering so load balancers see the drain"""
+        with self.lock:
+            if not self.draining:
+                self.draining = True
+                self.drain_started = time.time()
+                logger.info(f"🚰 Draining: refusing new work, waiting for {self.pending_work()}")
+
+    def drain(self, timeout: float = None) -> bool:
+        """Wait up to timeout for in-flight work to finish, then terminate leftover processes"""
+        self.begin()
+        timeout = SERVE_DRAIN_TIMEOUT if timeout is None else timeout
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if not any(self.pending_work().values()):
+                self.drained = True
+                logger.info(f"✅ Drained in {time.time() - self.drain_started:.1f}s")
+                return True
+            time.sleep(0.1)
+
+        self.drained = False
+        pending = self.pending_work()
+        running = [pid for pid, info in ProcessManager.list_active_processes().items()
+                   if info.get("status") == "running"]
+        logger.warning(f"⏰ Drain timed out after {timeout:.0f}s with {pending}, terminating {len(running)} processes")
+        for pid in running:
+            if ProcessManager.terminate_process(pid):
+                self.terminated_processes += 1
+        return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "draining": self.draining,
+            "drain_started": self.drain_started,
+            "drained": self.drained,
+            "pending": self.pending_work(),
+            "rejected_requests": self.rejected_requests,
+            "terminated_processes": self.terminated_processes
+        }
+
+# Global shutdown drain
+server_drain = ServerDrain()
+
+@app.before_request
+def drain_gate():
+    """Answer 503 with Retry-After to new work while the server drains for shutdown"""
+    if request.path.startswith(ServerDrain.EXEMPT_PATHS):
+        return None
+    if not server_drain.request_started():
+        response = jsonify({
+            "success": False,
+            "error": "Server is shutting down",
+            "retry_after": server_drain.retry_after
+        })
+        response.status_code = 503
+        response.headers["Retry-After"] = str(server_drain.retry_after)
+        response.headers["Connection"] = "close"
+        return response
+    g.drain_tracked = True
+    return None
+
+@app.teardown_request
+def drain_release(exc):
+    if g.pop("drain_tracked", False):
+        server_drain.request_finished()
+
+def _stream_requested() -> bool:
+    """Whether the client asked for a streamed response with ?stream=1"""
+    return request.args.get("stream", "").lower() in ("1", "true", "yes")
+
+def _apply_admission_rejection(response: Response) -> Response:
+    """Turn the response of a request whose command was refused admission into a 429"""
+    rejection = g.pop("admission_rejected", None)
+    if rejection is None:
+        return response
+
+    response = jsonify({
+        "success": False,
+        "error": str(rejection),
+        "reason": rejection.reason,
+        "retry_after": rejection.retry_after
+    })
+    response.status_code = 429
+    response.headers["Retry-After"] = str(rejection.retry_after)
+    return response
+
+@app.after_request
+def admission_rejection_response(response):
+    """Answer with 429 and Retry-After when the admission controller refused a command"""
+    return _apply_admission_rejection(response)
+
+@app.before_request
+def stream_command_output():
+    """Serve /api/command and /api/tools/* as Server-Sent Events when ?stream=1 is set"""
+    if not _stream_requested() or request.endpoint not in app.view_functions:
+        return None
+    if request.path != "/api/command" and not request.path.startswith("/api/tools/"):
+        return None
+
+    view = app.view_functions[request.endpoint]
+    view_args = request.view_args or {}
+    stream = CommandStream()
+    # Cache the body so the view can still read it after this hook returns
+    request.get_data(cache=True)
+
+    @copy_current_request_context
+    def run_view():
+        CommandStream.bind(stream)
+        try:
+            response = _apply_admission_rejection(app.make_response(view(**view_args)))
+            payload = response.get_json(silent=True)
+            stream.finish(response.status_code, payload if payload is not None else response.get_data(as_text=True))
+        except Exception as e:
+            logger.error(f"💥 Error in streamed request {request.path}: {str(e)}")
+            stream.finish(500, {"error": f"Server error: {str(e)}"})
+        finally:
+            CommandStream.bind(None)
+
+    # The request counts toward a drain until its last event is sent, not until this hook returns
+    drain_tracked = g.pop("drain_tracked", False)
+    path = request.path
+
+    def events():
+        finished = False
+        try:
+            for frame in stream.iter_events():
+                yield frame
+            finished = True
+        finally:
+            if not finished:
+                logger.info(f"🔌 Client left the stream for {path}, stopping its command")
+                stream.cancel()
+            if drain_tracked:
+                server_drain.request_finished()
+
+    threading.Thread(target=run_view, daemon=True).start()
+    logger.info(f"📡 Streaming output for {path}")
+    return Response(events(), mimetype="text/event-stream", headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no"
+    })
+
 @app.route("/api/command", methods=["POST"])
 def generic_command():
     """Execute any command provided in the request with enhanced logging"""
@@ -9157,6 +12074,39 @@ def generic_command():
             "error": f"Server error: {str(e)}"
         }), 500
 
+@app.route("/api/outputs/<output_id>", methods=["GET"])
+def get_command_output(output_id):
+    """Serve a byte range of spilled command output from the output store"""
+    try:
+        stream = request.args.get("stream", "stdout")
+        offset = request.args.get("offset", 0, type=int)
+        length = request.args.get("length", OUTPUT_PREVIEW_BYTES, type=int)
+
+        try:
+            chunk = output_store.read_range(output_id, stream, offset, length)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        if chunk is None:
+            return jsonify({"error": f"Output {output_id} ({stream}) not found"}), 404
+
+        if request.args.get("raw", "").lower() in ("1", "true", "yes"):
+            return app.response_class(chunk["data"], mimetype="application/octet-stream", headers={
+                "X-Output-Total-Size": str(chunk["total_size"]),
+                "X-Output-Next-Offset": str(chunk["next_offset"])
+            })
+
+        chunk["data"] = chunk["data"].decode(errors="replace")
+        return jsonify({
+            "success": True,
+            "output_id": output_id,
+            "stream": stream,
+            **chunk
+        })
+    except Exception as e:
+        logger.error(f"💥 Error reading command output: {str(e)}")
+        return jsonify({"error": f"Server error: {str(e)}"}), 500
+
 # File Operations API Endpoints
 
 @app.route("/api/files/create", methods=["POST"])
@@ -9273,17 +12223,218 @@ def cache_stats():
 @app.route("/api/cache/clear", methods=["POST"])
 def clear_cache():
     """Clear the cache"""
-    cache.cache.clear()
-    cache.stats = {"hits": 0, "misses": 0, "evictions": 0}
+    cache.clear()
     logger.info("🧹 Cache cleared")
     return jsonify({"success": True, "message": "Cache cleared"})
 
+@app.route("/api/cache/invalidate", methods=["POST"])
+def invalidate_cache_target():
+    """Invalidate cached results for a host, domain (including subdomains) or CIDR"""
+    try:
+        params = request.json or {}
+        target = params.get("target", "")
+
+        if not target:
+            return jsonify({"error": "Target parameter is required"}), 400
+
+        result = cache.invalidate_target(target)
+        removed = result["memory_entries_removed"] + result["disk_entries_removed"]
+        logger.info(f"🧹 Invalidated {removed} cache entries for {target}")
+        return jsonify({"success": True, "target": target, **result})
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        logger.error(f"💥 Error invalidating cache: {str(e)}")
+        return jsonify({"error": f"Server error: {str(e)}"}), 500
+
 # Telemetry Endpoint
 @app.route("/api/telemetry", methods=["GET"])
 def get_telemetry():
     """Get system telemetry"""
     return jsonify(telemetry.get_stats())
 
+class PrometheusExposition:
+    """Writer for the Prometheus text exposition format (version 0.0.4)"""
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self, namespace: str = "hexstrike"):
+        self.namespace = namespace
+        self.lines = []
+
+    @staticmethod
+    def _escape(value) -> str:
+        return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+    def _labels(self, labels: Dict[str, Any]) -> str:
+        if not labels:
+            return ""
+        return "{" + ",".join(f'{key}="{self._escape(value)}"' for key, value in labels.items()) + "}"
+
+    @staticmethod
+    def _value(value) -> str:
+        if value == float("inf"):
+            return "+Inf"
+        return repr(float(value)) if isinstance(value, float) else str(int(value))
+
+    def metric(self, name: str, kind: str, help_text: str, samples):
+        """Add one metric family; samples are (suffix, labels, value) tuples"""
+        full_name = f"{self.namespace}_{name}"
+        self.lines.append(f"# HELP {full_name} {help_text}")
+        self.lines.append(f"# TYPE {full_name} {kind}")
+        for suffix, labels, value in samples:
+            self.lines.append(f"{full_name}{suffix}{self._labels(labels)} {self._value(value)}")
+
+    def histogram(self, name: str, help_text: str, series):
+        """series: (labels, bounds, cumulative bucket counts, sum, count) per label set"""
+        samples = []
+        for labels, bounds, buckets, total, count in series:
+            for bound, bucket in zip(bounds, buckets):
+                samples.append(("_bucket", {**labels, "le": repr(float(bound))}, bucket))
+            samples.append(("_bucket", {**labels, "le": "+Inf"}, count))
+            samples.append(("_sum", labels, float(total)))
+            samples.append(("_count", labels, count))
+        self.metric(name, "histogram", help_text, samples)
+
+    def render(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+def _build_prometheus_metrics() -> str:
+    """Request, cache, pool, queue, admission and command metrics in Prometheus text format"""
+    out = PrometheusExposition()
+
+    routes = request_metrics.snapshot()
+    out.metric("http_requests_total", "counter", "HTTP requests by route, method and status", [
+        ("", {"route": rule, "method": method, "status": status}, n)
+        for (rule, method), route in routes.items() for status, n in sorted(route["status"].items())
+    ])
+    out.histogram("http_request_duration_seconds", "Time from request start to response headers", [
+        ({"route": rule, "method": method}, RequestMetrics.LATENCY_BUCKETS, route["latency_buckets"],
+         route["latency_sum"], route["count"])
+        for (rule, method), route in routes.items() if route["count"]
+    ])
+    out.metric("http_request_latency_seconds", "summary",
+               f"Latency quantiles over the last {request_metrics.window} requests per route", [
+        sample
+        for (rule, method), route in routes.items() if route["count"]
+        for sample in [("", {"route": rule, "method": method, "quantile": q}, route["quantiles"][f"p{int(q * 100)}"])
+                       for q in RequestMetrics.QUANTILES]
+        + [("_sum", {"route": rule, "method": method}, route["latency_sum"]),
+           ("_count", {"route": rule, "method": method}, route["count"])]
+    ])
+    out.histogram("http_response_size_bytes", "Response body size of non-streamed responses", [
+        ({"route": rule, "method": method}, RequestMetrics.SIZE_BUCKETS, route["size_buckets"],
+         route["size_sum"], route["size_count"])
+        for (rule, method), route in routes.items() if route["size_count"]
+    ])
+    out.metric("http_requests_in_flight", "gauge", "Requests currently being handled by route", [
+        ("", {"route": rule, "method": method}, route["in_flight"])
+        for (rule, method), route in routes.items() if route["in_flight"]
+    ] + [("", {"route": "all", "method": "all"}, sum(route["in_flight"] for route in routes.values()))])
+
+    cache_stats = cache.get_stats()
+    for name, key, kind, help_text in (
+        ("cache_hits_total", "hits", "counter", "Result cache hits"),
+        ("cache_misses_total", "misses", "counter", "Result cache misses"),
+        ("cache_stale_hits_total", "stale_hits", "counter", "Stale results served while revalidating"),
+        ("cache_revalidations_total", "revalidations", "counter", "Background cache revalidations started"),
+        ("cache_evictions_total", "evictions", "counter", "Entries evicted from the memory cache"),
+        ("cache_entries", "size", "gauge", "Entries in the memory cache"),
+        ("cache_bytes", "bytes", "gauge", "Estimated bytes held by the memory cache"),
+    ):
+        out.metric(name, kind, help_text, [("", {}, cache_stats.get(key, 0))])
+
+    pool_stats = enhanced_process_manager.process_pool.get_pool_stats()
+    out.metric("pool_workers", "gauge", "Process pool worker threads", [("", {}, pool_stats["active_workers"])])
+    out.metric("pool_retiring_workers", "gauge", "Workers told to retire that have not exited yet",
+               [("", {}, pool_stats["retiring_workers"])])
+    autoscaler = pool_stats["autoscaler"]
+    out.metric("autoscaler_enabled", "gauge", "1 while the pool autoscaler is enabled", [("", {}, int(autoscaler["enabled"]))])
+    out.metric("autoscaler_decisions_total", "counter", "Autoscaler decisions by action and reason", [
+        ("", {"action": decision["action"], "reason": decision["reason"]}, decision["count"])
+        for decision in autoscaler["decisions"]
+    ])
+    out.metric("autoscaler_workers_changed_total", "counter", "Workers added or removed by resizes", [
+        ("", {"direction": "added"}, autoscaler["workers_added"]),
+        ("", {"direction": "removed"}, autoscaler["workers_removed"])
+    ])
+    out.metric("autoscaler_queue_wait_seconds", "gauge", "Queue wait the last autoscaler decision saw",
+               [("", {}, float(autoscaler["signals"].get("queue_wait", 0.0)))])
+    out.metric("autoscaler_target_queue_wait_seconds", "gauge", "Queue wait the autoscaler steers towards",
+               [("", {}, float(autoscaler["target_queue_wait"]))])
+    out.metric("pool_active_tasks", "gauge", "Tasks running in the process pool", [("", {}, pool_stats["active_tasks"])])
+    out.metric("pool_tasks_total", "counter", "Process pool tasks by outcome", [
+        ("", {"outcome": outcome}, pool_stats["performance_metrics"].get(f"tasks_{outcome}", 0))
+        for outcome in ("completed", "failed", "expired")
+    ])
+    out.metric("queue_depth", "gauge", "Queued tasks by priority", [
+        ("", {"priority": priority}, depth) for priority, depth in pool_stats["queued_by_priority"].items()
+    ])
+    out.metric("queue_wait_seconds", "summary", "Queue wait quantiles by priority", [
+        sample
+        for priority, wait in pool_stats["queue_wait"].items() if priority != "overall"
+        for sample in [("", {"priority": priority, "quantile": q}, wait[f"p{int(q * 100)}"])
+                       for q in RequestMetrics.QUANTILES] + [("_count", {"priority": priority}, wait["samples"])]
+    ])
+
+    admission_stats = admission_controller.get_stats()
+    out.metric("admission_slots", "gauge", "Global admission cost units by state", [
+        ("", {"state": "used"}, admission_stats["global_used"]),
+        ("", {"state": "total"}, admission_stats["global_slots"])
+    ])
+    out.metric("admission_waiting", "gauge", "Commands waiting for admission", [("", {}, admission_stats["waiting"])])
+    out.metric("admission_decisions_total", "counter", "Admission decisions by outcome", [
+        ("", {"outcome": outcome}, admission_stats[outcome]) for outcome in ("admitted", "queued", "rejected")
+    ])
+
+    analysis_stats = analysis_executor.get_stats()
+    out.metric("analysis_jobs_total", "counter", "CPU-bound analysis jobs by where they ran", [
+        ("", {"mode": mode}, analysis_stats[mode]) for mode in ("offloaded", "inline", "fallbacks")
+    ])
+    out.metric("analysis_jobs_in_flight", "gauge", "Analysis jobs running in worker processes",
+               [("", {}, analysis_stats["in_flight"])])
+
+    flight_stats = command_flights.get_stats()
+    out.metric("commands_total", "counter", "Commands executed by outcome", [
+        ("", {"outcome": "success"}, telemetry.stats["successful_commands"]),
+        ("", {"outcome": "failure"}, telemetry.stats["failed_commands"])
+    ])
+    out.metric("commands_coalesced_total", "counter", "Duplicate commands served by an in-flight run",
+               [("", {}, flight_stats["coalesced"])])
+    out.metric("draining", "gauge", "1 while the server drains for shutdown", [("", {}, int(server_drain.draining))])
+
+    sample = resource_sampler.latest()
+    out.metric("system_cpu_percent", "gauge", "System CPU utilisation", [("", {}, float(sample.get("cpu_percent", 0.0)))])
+    out.metric("system_memory_percent", "gauge", "System memory utilisation", [("", {}, float(sample.get("memory_percent", 0.0)))])
+    out.metric("uptime_seconds", "gauge", "Seconds since the server started", [("", {}, time.time() - telemetry.stats["start_time"])])
+    return out.render()
+
+@app.route("/metrics", methods=["GET"])
+def prometheus_metrics():
+    """Prometheus scrape endpoint"""
+    try:
+        return Response(_build_prometheus_metrics(), mimetype=None, content_type=PrometheusExposition.CONTENT_TYPE)
+    except Exception as e:
+        logger.error(f"💥 Error building metrics: {str(e)}")
+        return jsonify({"error": f"Server error: {str(e)}"}), 500
+
+@app.route("/api/metrics/routes", methods=["GET"])
+def route_metrics():
+    """Per-route latency percentiles, slowest p95 first (?limit=N)"""
+    try:
+        routes = request_metrics.get_stats()
+        limit = request.args.get("limit", type=int)
+        return jsonify({
+            "success": True,
+            "window": request_metrics.window,
+            "routes": routes[:limit] if limit else routes,
+            "timestamp": datetime.now().isoformat()
+        })
+    except Exception as e:
+        logger.error(f"💥 Error getting route metrics: {str(e)}")
+        return jsonify({"error": f"Server error: {str(e)}"}), 500
+
 # ============================================================================
 # PROCESS MANAGEMENT API ENDPOINTS (v5.0 ENHANCEMENT)
 # ============================================================================
@@ -9415,8 +12566,10 @@ def resume_process(pid):
 def process_dashboard():
     """Get enhanced process dashboard with visual status using ModernVisualEngine"""
     try:
+        progress_ticker.attach_consumer()
         processes = ProcessManager.list_active_processes()
         current_time = time.time()
+        system_sample = resource_sampler.latest()
 
         # Create beautiful dashboard using ModernVisualEngine
         dashboard_visual = ModernVisualEngine.create_live_dashboard(processes)
@@ -9427,8 +12580,8 @@ def process_dashboard():
             "visual_dashboard": dashboard_visual,
             "processes": [],
             "system_load": {
-                "cpu_percent": psutil.cpu_percent(interval=1),
-                "memory_percent": psutil.virtual_memory().percent,
+                "cpu_percent": system_sample["cpu_percent"],
+                "memory_percent": system_sample["memory_percent"],
                 "active_connections": len(psutil.net_connections())
             }
         }
@@ -13489,64 +16642,9 @@ class HTTPTestingFramework:
 
     def _analyze_response_for_vulns(self, url: str, response):
         """Analyze HTTP response for common vulnerabilities"""
-        vulns = []
-
-        # Check for missing security headers
-        security_headers = {
-            'X-Frame-Options': 'Clickjacking protection missing',
-            'X-Content-Type-Options': 'MIME type sniffing protection missing',
-            'X-XSS-Protection': 'XSS protection missing',
-            'Strict-Transport-Security': 'HTTPS enforcement missing',
-            'Content-Security-Policy': 'Content Security Policy missing'
-        }
-
-        for header, description in security_headers.items():
-            if header not in response.headers:
-                vulns.append({
-                    'type': 'missing_security_header',
-                    'severity': 'medium',
-                    'description': description,
-                    'url': url,
-                    'header': header
-                })
-
-        # Check for sensitive information disclosure
-        sensitive_patterns = [
-            (r'password\s*[:=]\s*["\']?([^"\'\s]+)', 'Password disclosure'),
-            (r'api[_-]?key\s*[:=]\s*["\']?([^"\'\s]+)', 'API key disclosure'),
-            (r'secret\s*[:=]\s*["\']?([^"\'\s]+)', 'Secret disclosure'),
-            (r'token\s*[:=]\s*["\']?([^"\'\s]+)', 'Token disclosure')
-        ]
-
-        for pattern, description in sensitive_patterns:
-            matches = re.findall(pattern, response.text, re.IGNORECASE)
-            if matches:
-                vulns.append({
-                    'type': 'information_disclosure',
-                    'severity': 'high',
-                    'description': description,
-                    'url': url,
-                    'matches': matches[:5]  # Limit matches
-                })
-
-        # Check for SQL injection indicators
-        sql_errors = [
-            'SQL syntax error',
-            'mysql_fetch_array',
-            'ORA-01756',
-            'Microsoft OLE DB Provider',
-            'PostgreSQL query failed'
-        ]
-
-        for error in sql_errors:
-            if error.lower() in response.text.lower():
-                vulns.append({
-                    'type': 'sql_injection_indicator',
-                    'severity': 'high',
-                    'description': f'Potential SQL injection: {error}',
-                    'url': url
-                })
-
+        text = response.text
+        vulns = run_analysis(hexstrike_analysis.analyze_http_response, url, list(response.headers.keys()), text,
+                             size=len(text))
         self.vulnerabilities.extend(vulns)
 
     def _get_recent_vulns(self, limit: int = 10):
@@ -13575,6 +16673,7 @@ class HTTPTestingFramework:
                         discovered_urls.add(current_url)
 
                         # Parse HTML for links and forms
+                        from bs4 import BeautifulSoup
                         soup = BeautifulSoup(response.text, 'html.parser')
 
                         # Find all links
@@ -13632,6 +16731,9 @@ class BrowserAgent:
     def setup_browser(self, headless: bool = True, proxy_port: int = None):
         """Setup Chrome browser with security testing options"""
         try:
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
+
             chrome_options = Options()
 
             if headless:
@@ -13883,6 +16985,7 @@ class BrowserAgent:
         """Extract all forms from the page"""
         forms = []
         try:
+            from selenium.webdriver.common.by import By
             form_elements = self.driver.find_elements(By.TAG_NAME, 'form')
             for form in form_elements:
                 form_data = {
@@ -13909,6 +17012,7 @@ class BrowserAgent:
         """Extract all links from the page"""
         links = []
         try:
+            from selenium.webdriver.common.by import By
             link_elements = self.driver.find_elements(By.TAG_NAME, 'a')
             for link in link_elements[:50]:  # Limit to 50 links
                 href = link.get_attribute('href')
@@ -13926,6 +17030,7 @@ class BrowserAgent:
         """Extract all input elements"""
         inputs = []
         try:
+            from selenium.webdriver.common.by import By
             input_elements = self.driver.find_elements(By.TAG_NAME, 'input')
             for input_elem in input_elements:
                 inputs.append({
@@ -13943,6 +17048,7 @@ class BrowserAgent:
         """Extract script sources and inline scripts"""
         scripts = []
         try:
+            from selenium.webdriver.common.by import By
             script_elements = self.driver.find_elements(By.TAG_NAME, 'script')
             for script in script_elements[:20]:  # Limit to 20 scripts
                 src = script.get_attribute('src')
@@ -14033,8 +17139,8 @@ class BrowserAgent:
             logger.info(f"{ModernVisualEngine.format_tool_status('BrowserAgent', 'SUCCESS', 'Browser Closed')}")
 
 # Global instances
-http_framework = HTTPTestingFramework()
-browser_agent = BrowserAgent()
+http_framework = LazyInstance(HTTPTestingFramework)
+browser_agent = LazyInstance(BrowserAgent)
 
 @app.route("/api/tools/http-framework", methods=["POST"])
 def http_framework_endpoint():
@@ -14744,7 +17850,7 @@ class AIPayloadGenerator:
         return recommendations.get(attack_type, ["Test thoroughly", "Monitor responses"])
 
 # Global AI payload generator
-ai_payload_generator = AIPayloadGenerator()
+ai_payload_generator = LazyInstance(AIPayloadGenerator)
 
 @app.route("/api/ai/generate_payload", methods=["POST"])
 def ai_generate_payload():
@@ -16284,78 +19390,8 @@ def ctf_cryptography_solver():
         if not cipher_text:
             return jsonify({"error": "Cipher text is required"}), 400
 
-        results = {
-            "cipher_text": cipher_text,
-            "cipher_type": cipher_type,
-            "analysis_results": [],
-            "potential_solutions": [],
-            "recommended_tools": [],
-            "next_steps": []
-        }
-
-        # Cipher type identification
-        if cipher_type == "unknown":
-            # Basic cipher identification heuristics
-            if re.match(r'^[0-9a-fA-F]+$', cipher_text.replace(' ', '')):
-                results["analysis_results"].append("Possible hexadecimal encoding")
-                results["recommended_tools"].extend(["hex", "xxd"])
-
-            if re.match(r'^[A-Za-z0-9+/]+=*$', cipher_text.replace(' ', '')):
-                results["analysis_results"].append("Possible Base64 encoding")
-                results["recommended_tools"].append("base64")
-
-            if len(set(cipher_text.upper().replace(' ', ''))) <= 26:
-                results["analysis_results"].append("Possible substitution cipher")
-                results["recommended_tools"].extend(["frequency-analysis", "substitution-solver"])
-
-        # Hash identification
-        hash_patterns = {
-            32: "MD5",
-            40: "SHA1",
-            64: "SHA256",
-            128: "SHA512"
-        }
-
-        clean_text = cipher_text.replace(' ', '').replace('\n', '')
-        if len(clean_text) in hash_patterns and re.match(r'^[0-9a-fA-F]+$', clean_text):
-            hash_type = hash_patterns[len(clean_text)]
-            results["analysis_results"].append(f"Possible {hash_type} hash")
-            results["recommended_tools"].extend(["hashcat", "john", "hash-identifier"])
-
-        # Frequency analysis for substitution ciphers
-        if cipher_type in ["substitution", "caesar", "vigenere"] or "substitution" in results["analysis_results"]:
-            char_freq = {}
-            for char in cipher_text.upper():
-                if char.isalpha():
-                    char_freq[char] = char_freq.get(char, 0) + 1
-
-            if char_freq:
-                most_common = max(char_freq, key=char_freq.get)
-                results["analysis_results"].append(f"Most frequent character: {most_common} ({char_freq[most_common]} occurrences)")
-                results["next_steps"].append("Try substituting most frequent character with 'E'")
-
-        # ROT/Caesar cipher detection
-        if cipher_type == "caesar" or len(set(cipher_text.upper().replace(' ', ''))) <= 26:
-            results["recommended_tools"].append("rot13")
-            results["next_steps"].append("Try all ROT values (1-25)")
-
-        # RSA-specific analysis
-        if cipher_type == "rsa" or "rsa" in additional_info.lower():
-            results["recommended_tools"].extend(["rsatool", "factordb", "yafu"])
-            results["next_steps"].extend([
-                "Check if modulus can be factored",
-                "Look for small public exponent attacks",
-                "Check for common modulus attacks"
-            ])
-
-        # Vigenère cipher analysis
-        if cipher_type == "vigenere" or "vigenere" in additional_info.lower():
-            results["recommended_tools"].append("vigenere-solver")
-            results["next_steps"].extend([
-                "Perform Kasiski examination for key length",
-                "Use index of coincidence analysis",
-                "Try common key words"
-            ])
+        results = run_analysis(hexstrike_analysis.analyze_cipher_text, cipher_text, cipher_type, additional_info,
+                               size=len(cipher_text))
 
         logger.info(f"🔐 CTF crypto analysis completed | Type: {cipher_type} | Tools: {len(results['recommended_tools'])}")
         return jsonify({
@@ -16691,6 +19727,306 @@ def ctf_binary_analyzer():
 # ADVANCED PROCESS MANAGEMENT API ENDPOINTS (v10.0 ENHANCEMENT)
 # ============================================================================
 
+class CommandBatch:
+    """Commands and tool invocations run through the process pool with at most `concurrency` in flight"""
+
+    TOOL_NAME = re.compile(r"[A-Za-z0-9_\-]+(/[A-Za-z0-9_\-]+)*")
+
+    def __init__(self, batch_id: str, items: List[Dict[str, Any]], concurrency: int, priority: str = "batch",
+                 client_id: Optional[str] = None, use_cache: bool = True):
+        self.batch_id = batch_id
+        self.concurrency = concurrency
+        self.priority = priority
+        self.client_id = client_id
+        self.use_cache = use_cache
+        self.items = [{**item, "index": i, "task_id": f"{batch_id}_{i}", "status": "pending"}
+                      for i, item in enumerate(items)]
+        self.next_index = 0
+        self.running = 0
+        self.cancelled = False
+        self.created_at = time.time()
+        self.finished_at = None
+        self.lock = threading.Lock()
+        self.done = threading.Event()
+
+    @classmethod
+    def parse_items(cls, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Normalize a request body into {"kind": "command"|"tool", ...} items, raising ValueError on bad input"""
+        items = list(params.get("items") or [])
+        items += [{"command": command} for command in params.get("commands") or []]
+        # Fan one tool invocation out over many targets
+        if params.get("tool") and params.get("targets"):
+            target_param = params.get("target_param", "target")
+            items += [{"tool": params["tool"], "params": {**(params.get("params") or {}), target_param: target}}
+                      for target in params["targets"]]
+
+        parsed = []
+        adapter = app.url_map.bind("localhost")
+        for i, item in enumerate(items):
+            if isinstance(item, str):
+                item = {"command": item}
+            if not isinstance(item, dict):
+                raise ValueError(f"Item {i} must be a command string or an object")
+            if item.get("command"):
+                parsed.append({"kind": "command", "command": str(item["command"])})
+            elif item.get("tool"):
+                tool = str(item["tool"])
+                if not cls.TOOL_NAME.fullmatch(tool):
+                    raise ValueError(f"Item {i} has an invalid tool name: {tool}")
+                try:
+                    adapter.match(f"/api/tools/{tool}", method="POST")
+                except Exception:
+                    raise ValueError(f"Item {i} names an unknown tool: {tool}")
+                parsed.append({"kind": "tool", "tool": tool, "params": item.get("params") or {}})
+            else:
+                raise ValueError(f"Item {i} needs a 'command' or a 'tool'")
+        return parsed
+
+    def start(self):
+        self._fill()
+
+    def cancel(self) -> int:
+        """Skip items that have not been submitted yet; submitted ones run to completion"""
+        with self.lock:
+            self.cancelled = True
+            skipped = 0
+            for item in self.items[self.next_index:]:
+                item["status"] = "cancelled"
+                skipped += 1
+            self.next_index = len(self.items)
+        self._check_done()
+        return skipped
+
+    def _fill(self):
+        """Submit pending items while fewer than `concurrency` are in flight"""
+        to_submit = []
+        with self.lock:
+            while self.running < self.concurrency and self.next_index < len(self.items):
+                item = self.items[self.next_index]
+                self.next_index += 1
+                self.running += 1
+                item["status"] = "queued"
+                to_submit.append(item)
+
+        for item in to_submit:
+            try:
+                enhanced_process_manager.process_pool.submit_task(
+                    item["task_id"], self._run_item, item["index"], priority=self.priority, client_id=self.client_id
+                )
+            except Exception as e:
+                self._item_finished(item, "failed", error=str(e))
+        self._check_done()
+
+    def _run_item(self, index: int) -> Dict[str, Any]:
+        """Pool task body for one item"""
+        item = self.items[index]
+        item["status"] = "running"
+        item["started_at"] = time.time()
+        try:
+            if item["kind"] == "command":
+                result = execute_command(item["command"], use_cache=self.use_cache)
+                success = bool(result.get("success"))
+            else:
+                response = self._call_tool(item["tool"], item["params"])
+                payload = response.get_json(silent=True)
+                result = {"status_code": response.status_code,
+                          "result": payload if payload is not None else response.get_data(as_text=True)}
+                success = response.status_code == 200 and (not isinstance(payload, dict) or payload.get("success", True))
+        except Exception as e:
+            self._item_finished(item, "failed", error=str(e))
+            raise
+        self._item_finished(item, "completed" if success else "failed", result=result)
+        return result
+
+    def _call_tool(self, tool: str, params: Dict[str, Any]) -> Response:
+        """Call a tool's view function directly, so batch items skip the HTTP request hooks"""
+        with app.test_request_context(f"/api/tools/{tool}", method="POST", json=params):
+            # Tool views do not take use_cache; execute_command reads it from the request context
+            g.use_cache = self.use_cache
+            view = app.view_functions[request.endpoint]
+            return _apply_admission_rejection(app.make_response(view(**(request.view_args or {}))))
+
+    def _item_finished(self, item: Dict[str, Any], status: str, result: Any = None, error: str = None):
+        # Keep the result on the item: the pool stores its copy only after this returns, so a batch
+        # reported finished must not depend on the pool's result store having caught up
+        with self.lock:
+            self.running -= 1
+            item["status"] = status
+            item["finished_at"] = time.time()
+            item["result"] = result
+            if error:
+                item["error"] = error
+        self._fill()
+
+    def _check_done(self):
+        with self.lock:
+            if self.running == 0 and self.next_index >= len(self.items) and not self.done.is_set():
+                self.finished_at = time.time()
+                self.done.set()
+                logger.info(f"📦 Batch {self.batch_id} finished in {self.finished_at - self.created_at:.1f}s")
+
+    def get_status(self, include_results: bool = True) -> Dict[str, Any]:
+        """Aggregate progress plus per-item status and, optionally, results"""
+        with self.lock:
+            items = [dict(item) for item in self.items]
+            running = self.running
+        counts = {}
+        for item in items:
+            counts[item["status"]] = counts.get(item["status"], 0) + 1
+        finished = counts.get("completed", 0) + counts.get("failed", 0) + counts.get("cancelled", 0)
+        durations = [item["finished_at"] - item["started_at"] for item in items
+                     if "started_at" in item and "finished_at" in item]
+        avg_time = sum(durations) / len(durations) if durations else 0.0
+        remaining = len(items) - finished
+        elapsed = (self.finished_at or time.time()) - self.created_at
+
+        for item in items:
+            if "started_at" in item and "finished_at" in item:
+                item["execution_time"] = item["finished_at"] - item["started_at"]
+            if not include_results:
+                item.pop("result", None)
+
+        return {
+            "batch_id": self.batch_id,
+            "status": "finished" if self.done.is_set() else ("cancelling" if self.cancelled else "running"),
+            "total": len(items),
+            "counts": counts,
+            "in_flight": running,
+            "concurrency": self.concurrency,
+            "priority": self.priority,
+            "client_id": self.client_id,
+            "progress": (finished / len(items) * 100) if items else 100.0,
+            "elapsed": elapsed,
+            "avg_item_time": avg_time,
+            "eta": avg_time * remaining / self.concurrency if durations and remaining else 0.0,
+            "items": items
+        }
+
+class BatchManager:
+    """Registry of submitted batches, keeping the most recent BATCH_HISTORY"""
+
+    def __init__(self, history: int = BATCH_HISTORY):
+        self.history = history
+        self.batches = OrderedDict()
+        self.lock = threading.Lock()
+
+    def submit(self, items: List[Dict[str, Any]], concurrency: int, **options) -> CommandBatch:
+        batch = CommandBatch(f"batch_{uuid.uuid4().hex[:12]}", items, concurrency, **options)
+        with self.lock:
+            self.batches[batch.batch_id] = batch
+            # Forget the oldest finished batches once over the history limit
+            for batch_id in [b for b, old in self.batches.items() if old.done.is_set()]:
+                if len(self.batches) <= self.history:
+                    break
+                del self.batches[batch_id]
+        batch.start()
+        return batch
+
+    def get(self, batch_id: str) -> Optional[CommandBatch]:
+        with self.lock:
+            return self.batches.get(batch_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self.lock:
+            batches = list(self.batches.values())
+        return {
+            "batches": len(batches),
+            "running": sum(1 for batch in batches if not batch.done.is_set()),
+            "items_in_flight": sum(batch.running for batch in batches)
+        }
+
+# Global batch manager
+batch_manager = BatchManager()
+
+@app.route("/api/process/execute-batch", methods=["POST"])
+def execute_command_batch():
+    """Run many commands or tool invocations through the process pool with a concurrency limit"""
+    try:
+        params = request.json or {}
+        priority = params.get("priority", "batch")
+        client_id = params.get("client_id") or request.headers.get("X-Client-Id")
+        try:
+            concurrency = int(params.get("concurrency", BATCH_DEFAULT_CONCURRENCY))
+        except (TypeError, ValueError):
+            return jsonify({"error": "Concurrency must be an integer"}), 400
+        concurrency = max(1, min(concurrency, BATCH_MAX_CONCURRENCY))
+
+        if priority not in PriorityTaskQueue.PRIORITIES:
+            return jsonify({"error": f"Invalid priority, expected one of: {', '.join(PriorityTaskQueue.PRIORITIES)}"}), 400
+        try:
+            items = CommandBatch.parse_items(params)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        if not items:
+            return jsonify({"error": "Provide items, commands, or a tool with targets"}), 400
+        if len(items) > BATCH_MAX_ITEMS:
+            return jsonify({"error": f"Batch has {len(items)} items, the limit is {BATCH_MAX_ITEMS}"}), 400
+
+        batch = batch_manager.submit(items, concurrency, priority=priority, client_id=client_id,
+                                     use_cache=params.get("use_cache", True))
+
+        logger.info(f"📦 Batch submitted | ID: {batch.batch_id} | Items: {len(items)} | Concurrency: {concurrency}")
+        return jsonify({
+            "success": True,
+            "batch_id": batch.batch_id,
+            "total": len(items),
+            "concurrency": concurrency,
+            "priority": priority,
+            "client_id": client_id,
+            "task_ids": [item["task_id"] for item in batch.items],
+            "status": "submitted",
+            "timestamp": datetime.now().isoformat()
+        })
+
+    except Exception as e:
+        logger.error(f"💥 Error in batch execution: {str(e)}")
+        return jsonify({"error": f"Server error: {str(e)}"}), 500
+
+@app.route("/api/process/batch/<batch_id>", methods=["GET"])
+def get_batch_status(batch_id):
+    """Aggregate progress and per-item results of a batch (?wait=N long-polls, ?results=0 omits results)"""
+    try:
+        batch = batch_manager.get(batch_id)
+        if batch is None:
+            return jsonify({"error": "Batch not found"}), 404
+
+        wait = min(max(request.args.get("wait", 0.0, type=float), 0.0), LONG_POLL_MAX_WAIT)
+        if wait:
+            batch.done.wait(wait)
+
+        include_results = request.args.get("results", "1").lower() not in ("0", "false", "no")
+        return jsonify({
+            "success": True,
+            **batch.get_status(include_results=include_results),
+            "timestamp": datetime.now().isoformat()
+        })
+
+    except Exception as e:
+        logger.error(f"💥 Error getting batch status: {str(e)}")
+        return jsonify({"error": f"Server error: {str(e)}"}), 500
+
+@app.route("/api/process/batch/<batch_id>", methods=["DELETE"])
+def cancel_batch(batch_id):
+    """Cancel the items of a batch that have not started yet"""
+    try:
+        batch = batch_manager.get(batch_id)
+        if batch is None:
+            return jsonify({"error": "Batch not found"}), 404
+
+        skipped = batch.cancel()
+        logger.info(f"🛑 Batch cancelled | ID: {batch_id} | Skipped items: {skipped}")
+        return jsonify({
+            "success": True,
+            "batch_id": batch_id,
+            "cancelled_items": skipped,
+            "in_flight": batch.running,
+            "timestamp": datetime.now().isoformat()
+        })
+
+    except Exception as e:
+        logger.error(f"💥 Error cancelling batch: {str(e)}")
+        return jsonify({"error": f"Server error: {str(e)}"}), 500
+
 @app.route("/api/process/execute-async", methods=["POST"])
 def execute_command_async():
     """Execute command asynchronously using enhanced process management"""
@@ -16698,18 +20034,32 @@ def execute_command_async():
         params = request.json
         command = params.get("command", "")
         context = params.get("context", {})
+        priority = params.get("priority", "batch")
+        deadline = params.get("deadline")  # Seconds from now
+        client_id = params.get("client_id") or request.headers.get("X-Client-Id")  # Receives pushed status events
 
         if not command:
             return jsonify({"error": "Command parameter is required"}), 400
+        if priority not in PriorityTaskQueue.PRIORITIES:
+            return jsonify({"error": f"Invalid priority, expected one of: {', '.join(PriorityTaskQueue.PRIORITIES)}"}), 400
+        if deadline is not None:
+            try:
+                deadline = time.time() + float(deadline)
+            except (TypeError, ValueError):
+                return jsonify({"error": "Deadline must be a number of seconds"}), 400
 
         # Execute command asynchronously
-        task_id = enhanced_process_manager.execute_command_async(command, context)
+        task_id = enhanced_process_manager.execute_command_async(command, context, priority=priority, deadline=deadline,
+                                                                 client_id=client_id)
 
-        logger.info(f"🚀 Async command execution started | Task ID: {task_id}")
+        logger.info(f"🚀 Async command execution started | Task ID: {task_id} | Priority: {priority}")
         return jsonify({
             "success": True,
             "task_id": task_id,
             "command": command,
+            "priority": priority,
+            "deadline": datetime.fromtimestamp(deadline).isoformat() if deadline else None,
+            "client_id": client_id,
             "status": "submitted",
             "timestamp": datetime.now().isoformat()
         })
@@ -16720,18 +20070,26 @@ def execute_command_async():
 
 @app.route("/api/process/get-task-result/<task_id>", methods=["GET"])
 def get_async_task_result(task_id):
-    """Get result of asynchronous task"""
+    """Get result of asynchronous task (?wait=N long-polls up to N seconds, ?ack=1 releases it once read)"""
     try:
+        wait = min(max(request.args.get("wait", 0.0, type=float), 0.0), LONG_POLL_MAX_WAIT)
+        if wait:
+            enhanced_process_manager.process_pool.wait_for_task(task_id, wait)
         result = enhanced_process_manager.get_task_result(task_id)
 
         if result["status"] == "not_found":
             return jsonify({"error": "Task not found"}), 404
 
+        acknowledged = False
+        if request.args.get("ack", "").lower() in ("1", "true", "yes") and result["status"] in ("completed", "failed", "expired"):
+            acknowledged = enhanced_process_manager.acknowledge_task_result(task_id) is not None
+
         logger.info(f"📋 Task result retrieved | Task ID: {task_id} | Status: {result['status']}")
         return jsonify({
             "success": True,
             "task_id": task_id,
             "result": result,
+            "acknowledged": acknowledged,
             "timestamp": datetime.now().isoformat()
         })
 
@@ -16739,11 +20097,66 @@ def get_async_task_result(task_id):
         logger.error(f"💥 Error getting task result: {str(e)}")
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
+@app.route("/api/process/task-events", methods=["GET"])
+def stream_task_events():
+    """Push status changes of a client's async tasks as Server-Sent Events (?client_id=...)"""
+    client_id = request.args.get("client_id") or request.headers.get("X-Client-Id")
+    if not client_id:
+        return jsonify({"error": "client_id parameter is required"}), 400
+
+    notifier = enhanced_process_manager.process_pool.notifier
+    subscriber, snapshot = notifier.subscribe(client_id)
+
+    def iter_events():
+        try:
+            # Statuses that changed before this connection, so reconnecting clients miss nothing
+            yield f"event: snapshot\ndata: {json.dumps({'client_id': client_id, 'tasks': snapshot})}\n\n"
+            while True:
+                try:
+                    event = subscriber.get(timeout=STREAM_KEEPALIVE_INTERVAL)
+                except queue.Empty:
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"event: task\ndata: {json.dumps(event)}\n\n"
+        finally:
+            notifier.unsubscribe(client_id, subscriber)
+
+    logger.info(f"📡 Streaming task events for client {client_id}")
+    return Response(iter_events(), mimetype="text/event-stream", headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no"
+    })
+
+@app.route("/api/process/get-task-result/<task_id>", methods=["DELETE"])
+def acknowledge_async_task_result(task_id):
+    """Delete a finished task's stored result and any spilled output"""
+    try:
+        removed = enhanced_process_manager.acknowledge_task_result(task_id)
+        if removed is None:
+            status = enhanced_process_manager.get_task_result(task_id)["status"]
+            if status in ("queued", "running"):
+                return jsonify({"error": f"Task is still {status}"}), 409
+            return jsonify({"error": "Task result not found"}), 404
+
+        logger.info(f"🗑️  Task result acknowledged | Task ID: {task_id}")
+        return jsonify({
+            "success": True,
+            "task_id": task_id,
+            "status": removed["status"],
+            "timestamp": datetime.now().isoformat()
+        })
+
+    except Exception as e:
+        logger.error(f"💥 Error acknowledging task result: {str(e)}")
+        return jsonify({"error": f"Server error: {str(e)}"}), 500
+
 @app.route("/api/process/pool-stats", methods=["GET"])
 def get_process_pool_stats():
     """Get process pool statistics and performance metrics"""
     try:
         stats = enhanced_process_manager.get_comprehensive_stats()
+        stats["batches"] = batch_manager.get_stats()
+        stats["analysis"] = analysis_executor.get_stats()
 
         logger.info(f"📊 Process pool stats retrieved | Active workers: {stats['process_pool']['active_workers']}")
         return jsonify({
@@ -16879,17 +20292,22 @@ def configure_auto_scaling():
         enabled = params.get("enabled", True)
         thresholds = params.get("thresholds", {})
 
+        target_queue_wait = params.get("target_queue_wait")
+
         # Update auto-scaling configuration
         enhanced_process_manager.auto_scaling_enabled = enabled
 
         if thresholds:
             enhanced_process_manager.resource_thresholds.update(thresholds)
+        if target_queue_wait is not None:
+            enhanced_process_manager.process_pool.autoscaler.target_wait = float(target_queue_wait)
 
         logger.info(f"⚙️ Auto-scaling configured | Enabled: {enabled}")
         return jsonify({
             "success": True,
             "auto_scaling_enabled": enabled,
             "resource_thresholds": enhanced_process_manager.resource_thresholds,
+            "autoscaler": enhanced_process_manager.process_pool.autoscaler.get_stats(),
             "timestamp": datetime.now().isoformat()
         })
 
@@ -16911,19 +20329,20 @@ def manual_scale_pool():
         current_stats = enhanced_process_manager.process_pool.get_pool_stats()
         current_workers = current_stats["active_workers"]
 
+        pool = enhanced_process_manager.process_pool
         if action == "up":
-            max_workers = enhanced_process_manager.process_pool.max_workers
+            max_workers = pool.max_workers
             if current_workers + count <= max_workers:
-                enhanced_process_manager.process_pool._scale_up(count)
-                new_workers = current_workers + count
+                pool.autoscaler.record("scale_up", pool._scale_up(count), "manual")
+                new_workers = pool.target_workers()
                 message = f"Scaled up by {count} workers"
             else:
                 return jsonify({"error": f"Cannot scale up: would exceed max workers ({max_workers})"}), 400
         else:  # down
-            min_workers = enhanced_process_manager.process_pool.min_workers
+            min_workers = pool.min_workers
             if current_workers - count >= min_workers:
-                enhanced_process_manager.process_pool._scale_down(count)
-                new_workers = current_workers - count
+                pool.autoscaler.record("scale_down", pool._scale_down(count), "manual")
+                new_workers = pool.target_workers()
                 message = f"Scaled down by {count} workers"
             else:
                 return jsonify({"error": f"Cannot scale down: would go below min workers ({min_workers})"}), 400
@@ -17253,6 +20672,210 @@ def get_alternative_tools():
 # Create the banner after all classes are defined
 BANNER = ModernVisualEngine.create_banner()
 
+def profile_startup(limit: int = 25) -> Dict[str, Any]:
+    """Import the server in a fresh interpreter under -X importtime and rank modules by cost"""
+    server_dir = os.path.dirname(os.path.abspath(__file__))
+    module_name = os.path.splitext(os.path.basename(__file__))[0]
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        cwd=server_dir, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+    wall_time = time.perf_counter() - started
+
+    modules = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            modules.append({
+                "module": name.strip(),
+                "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000
+            })
+        except ValueError:
+            continue
+
+    # importtime lists children before their parent, so the depth-1 entries seen
+    # just before the server's own line are the server's direct imports
+    top_level = [m for m in modules if m["depth"] == 0]
+    direct, pending = [], []
+    for m in modules:
+        if m["depth"] == 1:
+            pending.append(m)
+        elif m["depth"] == 0:
+            if m["module"] == module_name:
+                direct = pending
+            pending = []
+    server = next((m for m in top_level if m["module"] == module_name), None)
+
+    return {
+        "success": proc.returncode == 0,
+        "returncode": proc.returncode,
+        "wall_time_ms": round(wall_time * 1000, 1),
+        "total_import_ms": round(sum(m["cumulative_ms"] for m in top_level), 1),
+        "module_count": len(modules),
+        "server_body_ms": server["self_ms"] if server else None,
+        "by_cumulative": sorted(direct, key=lambda m: m["cumulative_ms"], reverse=True)[:limit],
+        "by_self": sorted(modules, key=lambda m: m["self_ms"], reverse=True)[:limit]
+    }
+
+def print_startup_profile(report: Dict[str, Any]):
+    """Render a startup profile as two ranked tables"""
+    print(f"Startup profile: {report['wall_time_ms']}ms wall, {report['total_import_ms']}ms in imports, "
+          f"{report['module_count']} modules (exit code {report['returncode']})")
+    if report["server_body_ms"] is not None:
+        print(f"Server module body (class definitions, routes, globals): {report['server_body_ms']:.1f}ms")
+    for title, key, rows in (("Direct imports by cumulative time", "cumulative_ms", report["by_cumulative"]),
+                             ("Modules by self time", "self_ms", report["by_self"])):
+        print(f"\n{title}:")
+        for row in rows:
+            print(f"  {row[key]:>9.1f}ms  {row['module']}")
+
+SERVE_MODES = ("dev", "waitress", "gunicorn", "asgi")
+
+def _prepare_unix_socket(path: str):
+    """Remove a stale socket file left behind by a previous run"""
+    if os.path.exists(path):
+        if not stat.S_ISSOCK(os.stat(path).st_mode):
+            raise RuntimeError(f"{path} exists and is not a socket")
+        os.unlink(path)
+
+def _install_drain_handlers(drain_timeout: float):
+    """First SIGTERM/SIGINT drains in the background and then stops the server; a second one stops it at once"""
+    def handle(signum, frame):
+        if server_drain.draining:
+            raise KeyboardInterrupt
+        logger.info(f"🛑 Received {signal.Signals(signum).name}, draining for up to {drain_timeout:.0f}s")
+
+        def drain_then_stop():
+            server_drain.drain(drain_timeout)
+            _thread.interrupt_main()
+
+        threading.Thread(target=drain_then_stop, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, handle)
+    signal.signal(signal.SIGINT, handle)
+
+def serve_dev(host: str, port: int, unix_socket: str, drain_timeout: float, **_):
+    """Werkzeug development server (threaded)"""
+    if unix_socket:
+        _prepare_unix_socket(unix_socket)
+        host = f"unix://{unix_socket}"
+    if not DEBUG_MODE:
+        # The reloader runs the app in a child process and handles signals itself
+        _install_drain_handlers(drain_timeout)
+    app.run(host=host, port=port, debug=DEBUG_MODE, threaded=True)
+
+def serve_waitress(host: str, port: int, unix_socket: str, threads: int, keepalive: int,
+                   drain_timeout: float, workers: int, **_):
+    """Waitress: a single process with a fixed pool of request threads"""
+    try:
+        import waitress
+    except ImportError:
+        raise RuntimeError("--serve-mode waitress requires the waitress package (pip install waitress)")
+    if workers > 1:
+        logger.warning("⚠️  waitress serves from a single process, ignoring --workers")
+
+    bind = {"unix_socket": unix_socket, "unix_socket_perms": "660"} if unix_socket else {"host": host, "port": port}
+    if unix_socket:
+        _prepare_unix_socket(unix_socket)
+    _install_drain_handlers(drain_timeout)
+    waitress.serve(app, threads=threads, channel_timeout=max(keepalive, COMMAND_TIMEOUT),
+                   connection_limit=max(100, threads * 4), ident="HexStrike", **bind)
+
+def serve_gunicorn(host: str, port: int, unix_socket: str, workers: int, threads: int, keepalive: int,
+                   drain_timeout: float, **_):
+    """Gunicorn with gthread workers; each worker imports a fresh copy of this module after the fork"""
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        raise RuntimeError("--serve-mode gunicorn requires the gunicorn package (pip install gunicorn)")
+
+    module_name = os.path.splitext(os.path.basename(__file__))[0]
+    if unix_socket:
+        _prepare_unix_socket(unix_socket)
+
+    def worker_module():
+        # Background threads do not survive fork, so workers must not reuse the arbiter's module
+        import importlib
+        return importlib.import_module(module_name)
+
+    def post_worker_init(worker):
+        worker_module().health_snapshot.start()
+        worker_module().analysis_executor.start()
+
+    def worker_exit(server, worker):
+        worker_module().server_drain.drain(drain_timeout)
+
+    class HexStrikeGunicorn(BaseApplication):
+        def load_config(self):
+            options = {
+                "bind": f"unix:{unix_socket}" if unix_socket else f"{host}:{port}",
+                "workers": workers,
+                "threads": threads,
+                "worker_class": "gthread",
+                "keepalive": keepalive,
+                "timeout": int(COMMAND_TIMEOUT + drain_timeout),
+                "graceful_timeout": int(drain_timeout),
+                "post_worker_init": post_worker_init,
+                "worker_exit": worker_exit,
+            }
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return worker_module().app
+
+    HexStrikeGunicorn().run()
+
+def create_asgi_app():
+    """ASGI application wrapping the Flask app, used by uvicorn worker processes"""
+    from asgiref.wsgi import WsgiToAsgi
+    health_snapshot.start()
+    analysis_executor.start()
+    return WsgiToAsgi(app)
+
+def serve_asgi(host: str, port: int, unix_socket: str, workers: int, keepalive: int, drain_timeout: float, **_):
+    """uvicorn serving the Flask app through asgiref's WSGI-to-ASGI adapter"""
+    try:
+        import uvicorn
+        from asgiref.wsgi import WsgiToAsgi
+    except ImportError:
+        raise RuntimeError("--serve-mode asgi requires uvicorn and asgiref (pip install uvicorn asgiref)")
+
+    bind = {"uds": unix_socket} if unix_socket else {"host": host, "port": port}
+    if unix_socket:
+        _prepare_unix_socket(unix_socket)
+    options = dict(bind, timeout_keep_alive=keepalive, timeout_graceful_shutdown=int(drain_timeout),
+                   lifespan="off", log_level="debug" if DEBUG_MODE else "info")
+
+    if workers > 1:
+        # Multiple workers need an import string; each worker builds its own app and state
+        module_name = os.path.splitext(os.path.basename(__file__))[0]
+        uvicorn.run(f"{module_name}:create_asgi_app", factory=True, workers=workers, **options)
+        return
+
+    def ignore_first_signal(signum, frame):
+        # uvicorn re-raises the shutdown signal after it stops serving; a second one skips the drain
+        if server_drain.draining:
+            raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, ignore_first_signal)
+    signal.signal(signal.SIGINT, ignore_first_signal)
+    server = uvicorn.Server(uvicorn.Config(WsgiToAsgi(app), **options))
+    server.run()
+    # uvicorn has waited for open requests; let background pool tasks finish too
+    server_drain.drain(drain_timeout)
+
+def run_server(mode: str, **options):
+    """Serve the Flask app with the selected server"""
+    if options.get("workers", 1) > 1 and mode in ("gunicorn", "asgi"):
+        logger.warning("⚠️  Each worker process keeps its own cache, task pool and process registry")
+    {"dev": serve_dev, "waitress": serve_waitress, "gunicorn": serve_gunicorn, "asgi": serve_asgi}[mode](**options)
+
 if __name__ == "__main__":
     # Display the beautiful new banner
     print(BANNER)
@@ -17260,8 +20883,22 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run the HexStrike AI API Server")
     parser.add_argument("--debug", action="store_true", help="Enable debug mode")
     parser.add_argument("--port", type=int, default=API_PORT, help=f"Port for the API server (default: {API_PORT})")
+    parser.add_argument("--profile-startup", action="store_true", help="Report per-module import cost of a cold start and exit")
+    parser.add_argument("--serve-mode", choices=SERVE_MODES, default=SERVE_MODE,
+                        help=f"HTTP server: dev (Werkzeug), waitress, gunicorn (gthread) or asgi (uvicorn) (default: {SERVE_MODE})")
+    parser.add_argument("--host", default="0.0.0.0", help="Interface to bind (default: 0.0.0.0)")
+    parser.add_argument("--workers", type=int, default=SERVE_WORKERS, help=f"Worker processes for gunicorn/asgi (default: {SERVE_WORKERS})")
+    parser.add_argument("--threads", type=int, default=SERVE_THREADS, help=f"Request threads per worker (default: {SERVE_THREADS})")
+    parser.add_argument("--keepalive", type=int, default=SERVE_KEEPALIVE, help=f"Keep-alive idle timeout in seconds (default: {SERVE_KEEPALIVE})")
+    parser.add_argument("--drain-timeout", type=float, default=SERVE_DRAIN_TIMEOUT,
+                        help=f"Seconds to let in-flight tool runs finish on shutdown (default: {SERVE_DRAIN_TIMEOUT:.0f})")
+    parser.add_argument("--unix-socket", default=SERVE_UNIX_SOCKET or None, help="Listen on this Unix socket instead of TCP")
     args = parser.parse_args()
 
+    if args.profile_startup:
+        print_startup_profile(profile_startup())
+        sys.exit(0)
+
     if args.debug:
         DEBUG_MODE = True
         logger.setLevel(logging.DEBUG)
@@ -17274,7 +20911,8 @@ if __name__ == "__main__":
 {ModernVisualEngine.COLORS['MATRIX_GREEN']}{ModernVisualEngine.COLORS['BOLD']}╭─────────────────────────────────────────────────────────────────────────────╮{ModernVisualEngine.COLORS['RESET']}
 {ModernVisualEngine.COLORS['BOLD']}│{ModernVisualEngine.COLORS['RESET']} {ModernVisualEngine.COLORS['NEON_BLUE']}🚀 Starting HexStrike AI Tools API Server{ModernVisualEngine.COLORS['RESET']}
 {ModernVisualEngine.COLORS['BOLD']}├─────────────────────────────────────────────────────────────────────────────┤{ModernVisualEngine.COLORS['RESET']}
-{ModernVisualEngine.COLORS['BOLD']}│{ModernVisualEngine.COLORS['RESET']} {ModernVisualEngine.COLORS['CYBER_ORANGE']}🌐 Port:{ModernVisualEngine.COLORS['RESET']} {API_PORT}
+{ModernVisualEngine.COLORS['BOLD']}│{ModernVisualEngine.COLORS['RESET']} {ModernVisualEngine.COLORS['CYBER_ORANGE']}🌐 Port:{ModernVisualEngine.COLORS['RESET']} {args.unix_socket or API_PORT}
+{ModernVisualEngine.COLORS['BOLD']}│{ModernVisualEngine.COLORS['RESET']} {ModernVisualEngine.COLORS['NEON_BLUE']}🧵 Serve Mode:{ModernVisualEngine.COLORS['RESET']} {args.serve_mode} | Workers: {args.workers} | Threads: {args.threads}
 {ModernVisualEngine.COLORS['BOLD']}│{ModernVisualEngine.COLORS['RESET']} {ModernVisualEngine.COLORS['WARNING']}🔧 Debug Mode:{ModernVisualEngine.COLORS['RESET']} {DEBUG_MODE}
 {ModernVisualEngine.COLORS['BOLD']}│{ModernVisualEngine.COLORS['RESET']} {ModernVisualEngine.COLORS['ELECTRIC_PURPLE']}💾 Cache Size:{ModernVisualEngine.COLORS['RESET']} {CACHE_SIZE} | TTL: {CACHE_TTL}s
 {ModernVisualEngine.COLORS['BOLD']}│{ModernVisualEngine.COLORS['RESET']} {ModernVisualEngine.COLORS['TERMINAL_GRAY']}⏱️  Command Timeout:{ModernVisualEngine.COLORS['RESET']} {COMMAND_TIMEOUT}s
@@ -17286,4 +20924,12 @@ if __name__ == "__main__":
         if line.strip():
             logger.info(line)
 
-    app.run(host="0.0.0.0", port=API_PORT, debug=DEBUG_MODE)
+    # Build the first health report in the background so early polls are fast
+    health_snapshot.start()
+    # Start analysis workers up front; multi-process modes start them per worker
+    if args.serve_mode != "gunicorn" and (args.serve_mode != "asgi" or args.workers <= 1):
+        analysis_executor.start()
+
+    run_server(args.serve_mode, host=args.host, port=API_PORT, unix_socket=args.unix_socket,
+               workers=max(1, args.workers), threads=max(1, args.threads), keepalive=args.keepalive,
+               drain_timeout=args.drain_timeout)